@@ -0,0 +1,305 @@
+"""
+Open latency, time to focus, keystroke cost and list build time of the public functions, as JSON
+
+For every function in dialoger: the cold open (new Tk interpreter, nothing pooled), the warm open (pooled
+window), the time until the window is visible and until the entry or first button has the focus. Each dialog
+is closed as soon as it has the focus, or after FOCUS_TIMEOUT if it never gets it. Then the cost of one
+keystroke in an input, of one keystroke with 100k suggestions, the time to fill askwithanswers with 10, 1k
+and 10k choices, and the cost per item of a progress window.
+
+Needs a display, on headless machines run it under Xvfb:
+
+    xvfb-run python benchmarks/dialogs.py --output after.json --compare before.json
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import types
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import dialoger
+from dialoger.engine import engine
+from dialoger.input import input
+from dialoger.options import options
+
+FOCUS_TIMEOUT = 1000
+CHOICES = (10, 1000, 10000)
+SUGGESTIONS = 100000
+ITEMS = 1000000
+
+CALLS = {
+    "ask": lambda: dialoger.ask("Benchmark", "What is your name?", "str"),
+    "form": lambda: dialoger.form("Benchmark", ["Name", {"question": "Age", "answer_type": "int"}]),
+    "askwithanswers": lambda: dialoger.askwithanswers("Benchmark", "Pick one", ["Red", "Green", "Blue"]),
+    "confirm": lambda: dialoger.confirm("Benchmark", "Continue?"),
+    "alert": lambda: dialoger.alert("Benchmark", "Alert"),
+    "info": lambda: dialoger.info("Benchmark", "Info"),
+    "error": lambda: dialoger.error("Benchmark", "Error"),
+    "success": lambda: dialoger.success("Benchmark", "Success"),
+}
+
+
+class probe:
+    """Times of the dialog being measured, recorded from class bindings"""
+
+    started = 0.0
+    visible = None
+    focused = None
+    fallback = None
+
+    @classmethod
+    def start(cls):
+        cls.started = time.perf_counter()
+        cls.visible = None
+        cls.focused = None
+        cls.fallback = None
+
+    @classmethod
+    def mapped(cls, event):
+        if event.widget.winfo_class() == "Toplevel" and cls.visible is None:
+            cls.visible = time.perf_counter() - cls.started
+            cls.fallback = event.widget.after(FOCUS_TIMEOUT, close, event.widget)
+
+    @classmethod
+    def focus_in(cls, event):
+        if cls.visible is not None and cls.focused is None:
+            cls.focused = time.perf_counter() - cls.started
+            window = event.widget.winfo_toplevel()
+            window.after_cancel(cls.fallback)
+            window.after_idle(close, window)
+
+
+def close(window):
+    """Close a dialog, as the window manager would"""
+    if window.winfo_exists() and window.state() == "normal":
+        window.tk.eval(window.protocol("WM_DELETE_WINDOW"))
+
+
+class probed_engine(engine):
+    """Engine adding the probe's bindings to every interpreter it creates"""
+
+    probed = None
+
+    def find_root(self):
+        root = super().find_root()
+        if root is not self.probed:
+            root.bind_class("Toplevel", "<Map>", probe.mapped, "+")
+            for widget_class in ("Entry", "Button"):
+                root.bind_class(widget_class, "<FocusIn>", probe.focus_in, "+")
+            self.probed = root
+        return root
+
+
+def fresh_engine():
+    """Replace the process-wide engine by a new one, without any window"""
+    if engine._instance is not None:
+        engine._instance.shutdown()
+    engine._instance = probed_engine(shared_root=False)
+    return engine._instance
+
+
+def measure_open(call):
+    """Open a dialog, return the time of the call and the times to visible and to focus, in ms"""
+    probe.start()
+    call()
+    total = time.perf_counter() - probe.started
+    return [None if value is None else value * 1000 for value in (total, probe.visible, probe.focused)]
+
+
+def median(values):
+    """Median of the values that were measured, None if there is none"""
+    values = [value for value in values if value is not None]
+    return statistics.median(values) if values else None
+
+
+def bench_open(repeat):
+    """Cold and warm open of every public function"""
+    results = {}
+    for name, call in CALLS.items():
+        fresh_engine()
+        cold = measure_open(call)
+        warm = [measure_open(call) for _ in range(repeat)]
+        results[name] = {
+            "cold_ms": cold[0],
+            "cold_focus_ms": cold[2],
+            "warm_ms": median(row[0] for row in warm),
+            "visible_ms": median(row[1] for row in warm),
+            "focus_ms": median(row[2] for row in warm),
+        }
+    return results
+
+
+def per_call(function, number):
+    """Best time of one call over 5 runs, in us"""
+    best = None
+    for _ in range(5):
+        begin = time.perf_counter()
+        for _ in range(number):
+            function()
+        elapsed = (time.perf_counter() - begin) / number
+        best = elapsed if best is None else min(best, elapsed)
+    return best * 1e6
+
+
+def bench_keystroke(root):
+    """Cost of one keystroke in an input: validation alone, and validation plus mask formatting"""
+    dialog = input.prebuilt(master=root)
+    event = types.SimpleNamespace(keysym="1")
+    results = {}
+    for name, pattern, answer_type, length in (("validate_us", None, "int", 30), ("validate_format_us", "###.###.###-##", "str", 14)):
+        dialog.configure_window("Benchmark", "Document", answer_type, pattern=pattern)
+        entry = dialog.answer_entry
+
+        def keystroke():
+            if len(entry.get()) >= length:
+                entry.delete(0, "end")
+            entry.insert("end", "1")
+            dialog.format_input(event)
+
+        results[name] = per_call(keystroke, 2000)
+    dialog.dispose()
+    return results
+
+
+def bench_suggestions(root):
+    """Time to index the suggestions and cost of one keystroke refreshing the list, in a fresh window"""
+    corpus = [f"host-{i:06d}.example.com" for i in range(SUGGESTIONS)]
+    dialog = input.prebuilt(master=root)
+    begin = time.perf_counter()
+    dialog.configure_window("Benchmark", "Host", suggestions=corpus)
+    results = {"index_ms": (time.perf_counter() - begin) * 1000}
+    entry = dialog.answer_entry
+    typed = "host-0421"
+
+    def keystroke():
+        if entry.get() == typed:
+            entry.delete(0, "end")
+        entry.insert("end", typed[len(entry.get())])
+        dialog.suggest_list.refresh()
+
+    results["keystroke_us"] = per_call(keystroke, 2000)
+    dialog.dispose()
+    return results
+
+
+def bench_progress():
+    """Cost per item of a progress window, iterated and advanced, over a bare loop, and the redraws it made"""
+    engine._instance = engine(shared_root=False)
+    items = range(ITEMS)
+    results = {}
+
+    begin = time.perf_counter()
+    for _ in items:
+        pass
+    bare = time.perf_counter() - begin
+
+    for name in ("iterate", "advance"):
+        job = dialoger.progress("Benchmark", "Counting", items if name == "iterate" else None, total=ITEMS)
+        frames = []
+        draw = job.on_draw
+        job.on_draw = lambda job: (frames.append(None), draw(job))
+        begin = time.perf_counter()
+        if name == "iterate":
+            for _ in job:
+                pass
+        else:
+            for _ in items:
+                job.advance()
+            job.close()
+        elapsed = time.perf_counter() - begin
+        results[f"{name}_ns"] = (elapsed - bare) / ITEMS * 1e9
+        results[f"{name}_fps"] = len(frames) / elapsed
+    engine.get().shutdown()
+    return results
+
+
+def bench_choices(root):
+    """Time to fill askwithanswers with many choices, on a new window and on a reused one"""
+    results = {}
+    for count in CHOICES:
+        choices = [f"Choice {i}" for i in range(count)]
+        dialog = options.prebuilt(master=root)
+        times = []
+        for _ in range(5):
+            begin = time.perf_counter()
+            dialog.configure_window("Benchmark", "Pick one", choices, "question")
+            dialog.dialog.update_idletasks()
+            times.append((time.perf_counter() - begin) * 1000)
+        dialog.dispose()
+        results[str(count)] = {"first_ms": times[0], "reused_ms": statistics.median(times[1:])}
+    return results
+
+
+def metadata(root):
+    """Where the results come from"""
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+    except OSError:
+        commit = ""
+    return {
+        "commit": commit,
+        "python": platform.python_version(),
+        "tk": root.tk.call("info", "patchlevel"),
+        "platform": platform.platform(),
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+
+
+def flatten(results, prefix=""):
+    """Numbers of a result tree by dotted path"""
+    values = {}
+    for key, value in results.items():
+        if isinstance(value, dict):
+            values.update(flatten(value, f"{prefix}{key}."))
+        elif isinstance(value, (int, float)):
+            values[prefix + key] = value
+    return values
+
+
+def compare(before, after):
+    """Print every measure next to the one of a previous run"""
+    old = flatten({key: value for key, value in before.items() if key != "meta"})
+    new = flatten({key: value for key, value in after.items() if key != "meta"})
+    print(f"{'':<40} {before['meta']['commit']:>12} {after['meta']['commit']:>12}", file=sys.stderr)
+    for key, value in new.items():
+        if key in old and old[key]:
+            print(f"{key:<40} {old[key]:12.3f} {value:12.3f} {value / old[key]:8.2f}x", file=sys.stderr)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=20, help="warm opens of each function")
+    parser.add_argument("--output", help="file the JSON results are written to, stdout by default")
+    parser.add_argument("--compare", help="JSON results of a previous run to compare with")
+    args = parser.parse_args()
+
+    dialoger.backends.use("tk")
+    results = {"open": bench_open(args.repeat)}
+    root = fresh_engine().find_root()
+    results["keystroke"] = bench_keystroke(root)
+    results["suggestions"] = bench_suggestions(root)
+    results["choices"] = bench_choices(root)
+    meta = metadata(root)
+    engine.get().shutdown()
+    results["progress"] = bench_progress()
+    results = dict(meta=meta, **results)
+
+    text = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(text + "\n")
+    else:
+        print(text)
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as file:
+            compare(json.load(file), results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""
+Import time of dialoger, and a check that a bare `import dialoger` doesn't load tkinter
+
+    python benchmarks/importtime.py
+
+Exits with status 1 if tkinter is imported.
+"""
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def importtime(statement):
+    """
+    Run a statement in a fresh interpreter with -X importtime
+
+    Args:
+        statement (str): python code to run
+
+    Returns:
+        dict: cumulative import time in microseconds, by module
+    """
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", statement], cwd=ROOT, capture_output=True, text=True, check=True)
+    modules = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        modules[name.strip()] = int(cumulative)
+    return modules
+
+
+def main():
+    modules = importtime("import dialoger")
+    print(f"import dialoger: {modules['dialoger'] / 1000:.2f} ms")
+    loaded = sorted(name for name in modules if name.split(".")[0] in ("tkinter", "_tkinter"))
+    if loaded:
+        print("tkinter was imported by `import dialoger`: " + ", ".join(loaded))
+        sys.exit(1)
+    modules = importtime("import dialoger; dialoger.options")
+    print(f"tkinter, imported on the first dialog: {modules['tkinter'] / 1000:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+Cost of formatting the entry on a keystroke and on a paste, compiled masks against the previous implementation
+
+Doesn't need a display:
+
+    python benchmarks/mask.py
+"""
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dialoger.mask import mask
+
+PATTERN = "###.###.###-##"
+
+
+def legacy_format(text, pattern):
+    """The formatting done by input.format_input before masks were compiled"""
+    input = ''.join([c for c in text if c.isdigit()])
+    partial = ''
+    for char in pattern:
+        if char == '#':
+            if input:
+                partial += input[0]
+                input = input[1:]
+            else:
+                partial += '#'
+        else:
+            partial += char
+    result = ''.join([c for c in partial if c != '#'])
+    while len(result) > 0 and not result[-1].isdigit():
+        result = result[:-1]
+    return result
+
+
+def measure(name, function, number):
+    """Print the time of one call, best of 5 runs"""
+    best = min(timeit.repeat(function, number=number, repeat=5)) / number
+    print(f"{name:<40} {best * 1e6:10.2f} us")
+
+
+def main():
+    compiled = mask.compile(PATTERN)
+    keystroke = "123.456.7"
+    paste = "1234567890" * 10000
+    assert legacy_format(keystroke, PATTERN) == compiled.format(keystroke)
+    assert legacy_format(paste, PATTERN) == compiled.format(paste)
+
+    measure("keystroke, previous implementation", lambda: legacy_format(keystroke, PATTERN), 20000)
+    measure("keystroke, compiled mask", lambda: compiled.apply(keystroke, len(keystroke)), 20000)
+    measure("keystroke, compiling the mask each time", lambda: mask(PATTERN).apply(keystroke), 20000)
+    measure("paste of 100k characters, previous", lambda: legacy_format(paste, PATTERN), 20)
+    measure("paste of 100k characters, compiled mask", lambda: compiled.apply(paste), 20)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Dialogs per second and time to visible, with and without the window pool
+
+Needs a display, on headless machines run it under Xvfb:
+
+    xvfb-run python benchmarks/pool.py
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dialoger.engine import engine
+from dialoger.input import input
+from dialoger.options import options
+
+DIALOGS = 100
+
+
+class auto_close:
+    """Closes the dialog as soon as it is mapped and records the time it took to become visible"""
+
+    started = 0.0
+    visible = []
+
+    def build_window(self):
+        super().build_window()
+        self.dialog.bind("<Map>", self.mapped, add=True)
+
+    def mapped(self, event):
+        if event.widget is self.dialog:
+            auto_close.visible.append(time.perf_counter() - auto_close.started)
+            self.dialog.after_idle(self.destroy_window)
+
+
+class auto_options(auto_close, options):
+    pass
+
+
+class auto_input(auto_close, input):
+    pass
+
+
+def run(name, open_dialog):
+    """Open DIALOGS dialogs one after the other and print the results"""
+    auto_close.visible = []
+    begin = time.perf_counter()
+    for _ in range(DIALOGS):
+        auto_close.started = time.perf_counter()
+        open_dialog()
+    elapsed = time.perf_counter() - begin
+    visible = sorted(auto_close.visible)
+    print(f"{name:<24} {DIALOGS / elapsed:8.1f} dialogs/s   time to visible: median {visible[len(visible) // 2] * 1000:7.2f} ms   max {visible[-1] * 1000:7.2f} ms")
+
+
+def main():
+    message = dict(title="Benchmark", message="Do you want to continue?", choices=["Yes", "No"], icon="question")
+    question = dict(title="Benchmark", question="What is your name?", answer_type="str", icon="question")
+    run("options, fresh Tk", lambda: auto_options(**message))
+    run("input, fresh Tk", lambda: auto_input(**question))
+    run("options, pooled", lambda: engine.get().show(auto_options, **message))
+    run("input, pooled", lambda: engine.get().show(auto_input, **question))
+    engine.get().shutdown()
+
+
+if __name__ == "__main__":
+    main()
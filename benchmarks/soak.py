@@ -0,0 +1,90 @@
+"""
+Soak test: open and close many dialogs and check that nothing piles up
+
+Each dialog is closed through its window manager close handler as soon as it is shown. The number of Tcl
+commands and images must stay flat, and the memory traced by tracemalloc must not grow past a bound.
+Needs a display, on headless machines run it under Xvfb:
+
+    xvfb-run python benchmarks/soak.py [dialogs]
+
+Exits with status 1 if something leaks.
+"""
+import gc
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import dialoger
+from dialoger.engine import engine
+
+DIALOGS = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+WARMUP = 200
+MAX_GROWTH = 512 * 1024
+
+CALLS = [
+    lambda: dialoger.ask("Soak", "What is your name?", "str"),
+    lambda: dialoger.ask("Soak", "Document", "str", pattern="###.###.###-##"),
+    lambda: dialoger.ask("Soak", "How many?", "int", answer_default="3"),
+    lambda: dialoger.askwithanswers("Soak", "Pick one", ["Red", "Green", "Blue"]),
+    lambda: dialoger.confirm("Soak", "Continue?"),
+    lambda: dialoger.alert("Soak", "Alert"),
+    lambda: dialoger.info("Soak", "Info"),
+    lambda: dialoger.error("Soak", "Error"),
+    lambda: dialoger.success("Soak", "Success"),
+]
+
+
+def close_shown(root):
+    """Close the dialog currently shown, as the window manager would"""
+    for window in root.winfo_children():
+        if window.winfo_class() == "Toplevel" and window.state() == "normal":
+            window.tk.eval(window.protocol("WM_DELETE_WINDOW"))
+
+
+def counts(root):
+    """Number of Tcl commands and images in the interpreter"""
+    return len(root.tk.splitlist(root.tk.call("info", "commands"))), len(root.tk.splitlist(root.tk.call("image", "names")))
+
+
+def soak(name, count):
+    """Open count dialogs, return the Tcl counts and traced memory before and after"""
+    root = engine.get().find_root()
+
+    def run(number):
+        for i in range(number):
+            root.after_idle(close_shown, root)
+            CALLS[i % len(CALLS)]()
+
+    run(WARMUP)
+    gc.collect()
+    before = counts(root), tracemalloc.get_traced_memory()[0]
+    begin = time.perf_counter()
+    run(count)
+    elapsed = time.perf_counter() - begin
+    gc.collect()
+    after = counts(root), tracemalloc.get_traced_memory()[0]
+    print(f"{name:<16} {count} dialogs in {elapsed:.1f} s   Tcl commands {before[0][0]} -> {after[0][0]}   images {before[0][1]} -> {after[0][1]}   memory +{(after[1] - before[1]) / 1024:.1f} KiB")
+    return before, after
+
+
+def main():
+    tracemalloc.start()
+    failed = False
+    for name, pool_size in (("pooled", 2), ("rebuilt", 0)):
+        engine.get().pool_size = pool_size
+        before, after = soak(name, DIALOGS)
+        if after[0] != before[0]:
+            print(f"  Tcl commands or images grew")
+            failed = True
+        if after[1] - before[1] > MAX_GROWTH:
+            print(f"  memory grew more than {MAX_GROWTH // 1024} KiB")
+            failed = True
+    engine.get().shutdown()
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
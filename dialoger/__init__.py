@@ -1,30 +1,96 @@
-from dialoger.options import options
-from dialoger.input import input
+import sys
+from dialoger import backends
 
+# The dialog classes import tkinter, so they are only loaded when the first dialog is shown
+_lazy = ("options", "input", "inputs", "engine", "dispatcher", "notifier", "progressbar")
 
-def ask(title:str, question:str, answer_type:str, answer_default:str = None, pattern:str = None, allow_empty:bool = True, allow_cancel:bool = True, entrance_width=35) -> str:
+
+def _load(name: str):
+    """
+    Import one of the tkinter-backed classes on first use
+
+    Importing a module sets the attribute of the package with its name to the module, hiding the class. So
+    after the import, every class whose module is loaded (the modules it imported included) is bound again.
+    Inside the package, the classes are imported with `from dialoger import <name>` for the same reason.
+
+    Args:
+        name (str): class name, which is also the name of its module
+
+    Returns:
+        type: the class
+    """
+    __import__("dialoger." + name)
+    for loaded in _lazy:
+        module = sys.modules.get("dialoger." + loaded)
+        if module is not None and hasattr(module, loaded):
+            globals()[loaded] = getattr(module, loaded)
+    return globals()[name]
+
+
+def __getattr__(name: str):
+    if name in _lazy:
+        return _load(name)
+    raise AttributeError(f"module 'dialoger' has no attribute '{name}'")
+
+
+def _remembered(kind: str, title: str, message: str, choices: list, remember) -> tuple:
+    """
+    Find the remembered answer of a dialog called with remember, without importing tkinter
+
+    Returns:
+        tuple: (True, answer) if the answer is remembered, (False, None) otherwise
+    """
+    if not remember:
+        return False, None
+    from dialoger.store import store
+    return store.get().recall(kind, title, message, list(choices))
+
+
+def ask(title:str, question:str, answer_type:str, answer_default:str = None, pattern:str = None, allow_empty:bool = True, allow_cancel:bool = True, entrance_width=35, typed:bool = False, timeout:float = None, on_timeout=None, suggestions=None, suggestions_only:bool = False) -> str:
     """
     Create an input window
 
     Args:
         title (str): window title
         question (str): question to be asked
-        answer_type (str): type of answer (int, float, alphanumeric, str)
+        answer_type (str): type of answer (int, float, alphanumeric, str, password, email, ipv4 or a type registered in dialoger.validators)
         answer_default (str, optional): default answer. Defaults to None.
         pattern (str, optional): pattern for the answer. Defaults to None.
         allow_empty (bool, optional): allow empty answer. Defaults to True.
         allow_cancel (bool, optional): allow cancel. Defaults to True.
         entrance_width (int, optional): width of the input field. Defaults to 35.
+        typed (bool, optional): return the answer converted to its type, such as int or float. Defaults to False.
+        timeout (float, optional): seconds before the window closes by itself, with a countdown. Defaults to None, dialoger.backends.default_timeout.
+        on_timeout (any, optional): answer when the time runs out, or an exception to raise. Defaults to None, answer_default.
+        suggestions (iterable | callable, optional): answers listed under the input while typing, the ones starting with the text typed. A function is called once to get them. The index of the suggestions is kept for the next calls with the same list or function. Defaults to None.
+        suggestions_only (bool, optional): only accept one of the suggestions, or an empty answer if allowed. Defaults to False.
 
     Returns:
         str: answer
     """
-    answer = input(title=title, question=question, answer_type=answer_type, answer_default=answer_default, pattern=pattern, allow_empty=allow_empty, allow_cancel=allow_cancel, icon="question", entrance_width=entrance_width).answer
-    input._instance = None
-    return answer
+    return backends.get().ask(title, question, answer_type, answer_default, pattern, allow_empty, allow_cancel, entrance_width, typed, backends.timeout(timeout), on_timeout, suggestions, suggestions_only)
 
 
-def askwithanswers(title:str, question:str, choices:list, orientation='horizontal') -> str:
+def form(title:str, fields:list, message:str = None, allow_cancel:bool = True, entrance_width=35, timeout:float = None, on_timeout=None) -> dict:
+    """
+    Create a window with several inputs and collect all the answers at once
+
+    Args:
+        title (str): window title
+        fields (list): one dict per input, with the options of ask: question, answer_type, answer_default, pattern, allow_empty and typed, plus name, the key of the answer (defaults to the question). A string is a question with a str answer.
+        message (str, optional): message shown above the inputs. Defaults to None.
+        allow_cancel (bool, optional): allow cancel. Defaults to True.
+        entrance_width (int, optional): width of the input fields. Defaults to 35.
+        timeout (float, optional): seconds before the window closes by itself, with a countdown. Defaults to None, dialoger.backends.default_timeout.
+        on_timeout (any, optional): answers when the time runs out, or an exception to raise. Defaults to None, the answer_default of every field.
+
+    Returns:
+        dict: answers by name, None if cancelled
+    """
+    return backends.get().form(title, fields, message, allow_cancel, entrance_width, backends.timeout(timeout), on_timeout)
+
+
+def askwithanswers(title:str, question:str, choices:list, orientation='horizontal', timeout:float = None, on_timeout=None, remember=False) -> str:
     """
     Create an window with a list of choices
 
@@ -32,16 +98,20 @@ def askwithanswers(title:str, question:str, choices:list, orientation='horizonta
         title (str): window title
         question (str): question to be asked
         choices (list): list of choices
+        timeout (float, optional): seconds before the window closes by itself, with a countdown. Defaults to None, dialoger.backends.default_timeout.
+        on_timeout (any, optional): choice when the time runs out, or an exception to raise. Defaults to None.
+        remember (bool | float, optional): offer "Don't ask again", and return the remembered choice without showing anything next time. A number is the seconds to remember it. Defaults to False, see dialoger.store.
 
     Returns:
         str: choice
     """
-    choice = options(title=title, message=question, choices=choices, icon="question", orientation=orientation).choice
-    options._instance = None
-    return choice
+    found, answer = _remembered("askwithanswers", title, question, choices, remember)
+    if found:
+        return answer
+    return backends.get().askwithanswers(title, question, choices, orientation, backends.timeout(timeout), on_timeout, remember)
 
 
-def confirm(title:str, message:str, choices:list=["Yes", "No"]) -> bool:
+def confirm(title:str, message:str, choices:list=["Yes", "No"], timeout:float = None, on_timeout:bool = False, remember=False) -> bool:
     """
     Create an confirmation window, with 2 choices, True is returned if the first choice is selected, False otherwise
 
@@ -49,61 +119,243 @@ def confirm(title:str, message:str, choices:list=["Yes", "No"]) -> bool:
         title (str): window title
         message (str): message to be shown
         choices (list, optional): list of choices. Defaults to ["Yes", "No"]
+        timeout (float, optional): seconds before the window closes by itself, with a countdown. Defaults to None, dialoger.backends.default_timeout.
+        on_timeout (any, optional): result when the time runs out, or an exception to raise. Defaults to False.
+        remember (bool | float, optional): offer "Don't ask again", and return the remembered result without showing anything next time. A number is the seconds to remember it. Defaults to False, see dialoger.store.
     """
     assert len(choices) == 2, "The list of options must contain exactly two options."
     assert isinstance(choices[0], str) and isinstance(choices[1], str), "Options must be strings."
-    choice = options(title=title, message=message, choices=choices, icon="question").choice
-    options._instance = None
-    return choice == choices[0]
+    found, answer = _remembered("confirm", title, message, choices, remember)
+    if found:
+        return answer
+    return backends.get().confirm(title, message, choices, backends.timeout(timeout), on_timeout, remember)
 
 
-def alert(title:str, message:str) -> str:
+def alert(title:str, message:str, timeout:float = None) -> str:
     """
     Create an alert window
 
     Args:
         title (str): window title
-        message (str): message to be shown
+        message (str | os.PathLike | iterable): message to be shown. Long messages, text files and iterables of lines are shown in a scrollable text. Only a path object, such as pathlib.Path, is read as a file; a string is always the text itself, even if it is a path. Iterables of lines are lists, tuples and iterators, anything else (a number, an exception) is shown as its str().
+        timeout (float, optional): seconds before the window closes by itself, with a countdown. Defaults to None, dialoger.backends.default_timeout.
     """
-    options(title=title, message=message, choices=["OK"], icon="alert")
-    options._instance = None
+    backends.get().message(title, message, "alert", backends.timeout(timeout))
     return None
 
 
-def info(title:str, message:str) -> str:
+def info(title:str, message:str, timeout:float = None) -> str:
     """
     Create an information window
 
     Args:
         title (str): window title
-        message (str): message to be shown
+        message (str | os.PathLike | iterable): message to be shown. Long messages, text files and iterables of lines are shown in a scrollable text. Only a path object, such as pathlib.Path, is read as a file; a string is always the text itself, even if it is a path. Iterables of lines are lists, tuples and iterators, anything else (a number, an exception) is shown as its str().
+        timeout (float, optional): seconds before the window closes by itself, with a countdown. Defaults to None, dialoger.backends.default_timeout.
     """
-    options(title=title, message=message, choices=["OK"], icon="info")
-    options._instance = None
+    backends.get().message(title, message, "info", backends.timeout(timeout))
     return None
 
 
-def error(title:str, message:str) -> str:
+def error(title:str, message:str, timeout:float = None) -> str:
     """
     Create an error window
 
     Args:
         title (str): window title
-        message (str): message to be shown
+        message (str | os.PathLike | iterable): message to be shown. Long messages, text files and iterables of lines are shown in a scrollable text. Only a path object, such as pathlib.Path, is read as a file; a string is always the text itself, even if it is a path. Iterables of lines are lists, tuples and iterators, anything else (a number, an exception) is shown as its str().
+        timeout (float, optional): seconds before the window closes by itself, with a countdown. Defaults to None, dialoger.backends.default_timeout.
     """
-    options(title=title, message=message, choices=["OK"], icon="error")
-    options._instance = None
+    backends.get().message(title, message, "error", backends.timeout(timeout))
     return None
 
 
-def success(title:str, message:str) -> str:
+def success(title:str, message:str, timeout:float = None) -> str:
     """
     Create an success window
 
+    Args:
+        title (str): window title
+        message (str | os.PathLike | iterable): message to be shown. Long messages, text files and iterables of lines are shown in a scrollable text. Only a path object, such as pathlib.Path, is read as a file; a string is always the text itself, even if it is a path. Iterables of lines are lists, tuples and iterators, anything else (a number, an exception) is shown as its str().
+        timeout (float, optional): seconds before the window closes by itself, with a countdown. Defaults to None, dialoger.backends.default_timeout.
+    """
+    backends.get().message(title, message, "success", backends.timeout(timeout))
+    return None
+
+
+def notify(title:str, message:str, icon:str = "info") -> None:
+    """
+    Queue a notification and return at once, from any thread. Notifications that are alike (same title and icon, same message apart from numbers) are merged into one window with a count, and only a few windows are opened per interval, see dialoger.notifier.
+
     Args:
         title (str): window title
         message (str): message to be shown
+        icon (str, optional): alert, info, error or success. Defaults to "info".
+    """
+    backends.get().notify(title, message, icon)
+
+
+def progress(title:str, message:str, iterable=None, total:int = None, icon:str = "info", fps:float = 10):
+    """
+    Show the progress of a job in a window with a Cancel button
+
+    Iterate over the result to get the items of the iterable, or call its advance(n) method from any thread. The
+    window is redrawn at most fps times a second, however fast the items come, by the thread that called
+    progress: while it iterates or advances, or while it runs the Tk event loop or the join() method of the result.
+    Once cancelled, the iteration stops and advance() returns False. Closing the result (at the end of the
+    iteration or of a with block) closes the window.
+
+    Args:
+        title (str): window title
+        message (str): message to be shown
+        iterable (iterable, optional): items of the job. Defaults to None, the job calls advance().
+        total (int, optional): number of items. Defaults to the length of the iterable, if it has one.
+        icon (str, optional): icon. Defaults to "info".
+        fps (float, optional): most redraws per second. Defaults to 10.
+
+    Returns:
+        tracker: progress of the job, with advance(n), cancelled, join() and close(), see dialoger.tracker
+    """
+    return backends.get().progress(title, message, iterable, total, icon, fps)
+
+
+def show_ask(title:str, question:str, answer_type:str, answer_default:str = None, pattern:str = None, allow_empty:bool = True, allow_cancel:bool = True, entrance_width=35, typed:bool = False, timeout:float = None, on_timeout=None, suggestions=None, suggestions_only:bool = False):
+    """
+    Show an input window without waiting for the answer, see ask. The window doesn't disable the main window, so several of them can be open at once.
+
+    Returns:
+        handle: handle of the dialog, with done(), result(timeout), wait(timeout), cancel() and add_done_callback(callback)
+    """
+    return backends.get().show("ask", title, question, answer_type, answer_default, pattern, allow_empty, allow_cancel, entrance_width, typed, backends.timeout(timeout), on_timeout, suggestions, suggestions_only)
+
+
+def show_form(title:str, fields:list, message:str = None, allow_cancel:bool = True, entrance_width=35, timeout:float = None, on_timeout=None):
+    """
+    Show a window with several inputs without waiting for the answers, see form and show_ask.
+
+    Returns:
+        handle: handle of the dialog
     """
-    options(title=title, message=message, choices=["OK"], icon="success")
-    options._instance = None
+    return backends.get().show("form", title, fields, message, allow_cancel, entrance_width, backends.timeout(timeout), on_timeout)
+
+
+def show_askwithanswers(title:str, question:str, choices:list, orientation='horizontal', timeout:float = None, on_timeout=None, remember=False):
+    """
+    Show a window with a list of choices without waiting for the choice, see askwithanswers and show_ask.
+
+    Returns:
+        handle: handle of the dialog
+    """
+    found, answer = _remembered("askwithanswers", title, question, choices, remember)
+    if found:
+        from dialoger.handle import handle
+        return handle.completed(answer)
+    return backends.get().show("askwithanswers", title, question, choices, orientation, backends.timeout(timeout), on_timeout, remember)
+
+
+def show_confirm(title:str, message:str, choices:list=["Yes", "No"], timeout:float = None, on_timeout:bool = False, remember=False):
+    """
+    Show a confirmation window without waiting for the choice, see confirm and show_ask.
+
+    Returns:
+        handle: handle of the dialog, its result is True if the first choice is selected
+    """
+    assert len(choices) == 2, "The list of options must contain exactly two options."
+    assert isinstance(choices[0], str) and isinstance(choices[1], str), "Options must be strings."
+    found, answer = _remembered("confirm", title, message, choices, remember)
+    if found:
+        from dialoger.handle import handle
+        return handle.completed(answer)
+    return backends.get().show("confirm", title, message, choices, backends.timeout(timeout), on_timeout, remember)
+
+
+def show_alert(title:str, message:str, timeout:float = None):
+    """Show an alert window without waiting, see alert and show_ask."""
+    return backends.get().show("message", title, message, "alert", backends.timeout(timeout))
+
+
+def show_info(title:str, message:str, timeout:float = None):
+    """Show an information window without waiting, see info and show_ask."""
+    return backends.get().show("message", title, message, "info", backends.timeout(timeout))
+
+
+def show_error(title:str, message:str, timeout:float = None):
+    """Show an error window without waiting, see error and show_ask."""
+    return backends.get().show("message", title, message, "error", backends.timeout(timeout))
+
+
+def show_success(title:str, message:str, timeout:float = None):
+    """Show a success window without waiting, see success and show_ask."""
+    return backends.get().show("message", title, message, "success", backends.timeout(timeout))
+
+
+async def ask_async(title:str, question:str, answer_type:str, answer_default:str = None, pattern:str = None, allow_empty:bool = True, allow_cancel:bool = True, entrance_width=35, typed:bool = False, timeout:float = None, on_timeout=None, suggestions=None, suggestions_only:bool = False) -> str:
+    """
+    Create an input window without blocking the asyncio event loop, see ask. Cancelling the task closes the window.
+
+    Returns:
+        str: answer
+    """
+    return await backends.get().ask_async(title, question, answer_type, answer_default, pattern, allow_empty, allow_cancel, entrance_width, typed, backends.timeout(timeout), on_timeout, suggestions, suggestions_only)
+
+
+async def form_async(title:str, fields:list, message:str = None, allow_cancel:bool = True, entrance_width=35, timeout:float = None, on_timeout=None) -> dict:
+    """
+    Create a window with several inputs without blocking the asyncio event loop, see form. Cancelling the task closes the window.
+
+    Returns:
+        dict: answers by name, None if cancelled
+    """
+    return await backends.get().form_async(title, fields, message, allow_cancel, entrance_width, backends.timeout(timeout), on_timeout)
+
+
+async def askwithanswers_async(title:str, question:str, choices:list, orientation='horizontal', timeout:float = None, on_timeout=None, remember=False) -> str:
+    """
+    Create an window with a list of choices without blocking the asyncio event loop, see askwithanswers.
+
+    Returns:
+        str: choice
+    """
+    found, answer = _remembered("askwithanswers", title, question, choices, remember)
+    if found:
+        return answer
+    return await backends.get().askwithanswers_async(title, question, choices, orientation, backends.timeout(timeout), on_timeout, remember)
+
+
+async def confirm_async(title:str, message:str, choices:list=["Yes", "No"], timeout:float = None, on_timeout:bool = False, remember=False) -> bool:
+    """
+    Create an confirmation window without blocking the asyncio event loop, see confirm.
+
+    Returns:
+        bool: True if the first choice is selected, False otherwise
+    """
+    assert len(choices) == 2, "The list of options must contain exactly two options."
+    assert isinstance(choices[0], str) and isinstance(choices[1], str), "Options must be strings."
+    found, answer = _remembered("confirm", title, message, choices, remember)
+    if found:
+        return answer
+    return await backends.get().confirm_async(title, message, choices, backends.timeout(timeout), on_timeout, remember)
+
+
+async def alert_async(title:str, message:str, timeout:float = None) -> str:
+    """Create an alert window without blocking the asyncio event loop, see alert."""
+    await backends.get().message_async(title, message, "alert", backends.timeout(timeout))
+    return None
+
+
+async def info_async(title:str, message:str, timeout:float = None) -> str:
+    """Create an information window without blocking the asyncio event loop, see info."""
+    await backends.get().message_async(title, message, "info", backends.timeout(timeout))
+    return None
+
+
+async def error_async(title:str, message:str, timeout:float = None) -> str:
+    """Create an error window without blocking the asyncio event loop, see error."""
+    await backends.get().message_async(title, message, "error", backends.timeout(timeout))
+    return None
+
+
+async def success_async(title:str, message:str, timeout:float = None) -> str:
+    """Create an success window without blocking the asyncio event loop, see success."""
+    await backends.get().message_async(title, message, "success", backends.timeout(timeout))
     return None
@@ -0,0 +1,363 @@
+import abc
+import os
+import sys
+from collections.abc import Iterator
+
+def expired(on_timeout, default=None):
+    """
+    Result of a dialog whose time to answer ran out
+
+    Args:
+        on_timeout (any): what to do: an exception (class or instance) to raise, or the result, None for the default
+        default (any, optional): result when on_timeout is None. Defaults to None.
+
+    Returns:
+        any: the result
+    """
+    if isinstance(on_timeout, BaseException) or (isinstance(on_timeout, type) and issubclass(on_timeout, BaseException)):
+        raise on_timeout
+    return default if on_timeout is None else on_timeout
+
+
+def keep(kind, title, message, choices, answer, remember):
+    """Remember the answer of a dialog whose "Don't ask again" was ticked, see dialoger.store"""
+    from dialoger.store import keep
+    keep(kind, title, message, choices, answer, remember)
+
+
+def body(message):
+    """
+    Message as the backends show it: a text, a path object of a text file or an iterable of lines
+
+    Only path objects (a string is the text), lists, tuples, generators and other iterators are kept as they are,
+    anything else, such as a number or an exception, is shown as its str().
+
+    Args:
+        message (any): message given to dialoger.message
+
+    Returns:
+        str | os.PathLike | iterable: the message, None for no message
+    """
+    if message is None or isinstance(message, (str, os.PathLike)):
+        return message
+    if isinstance(message, (list, tuple, Iterator)) and not isinstance(message, BaseException):
+        return message
+    return str(message)
+
+
+class backend(abc.ABC):
+    """
+    Shows the dialogs of the functions in dialoger
+
+    A backend must implement ask, form, askwithanswers, confirm and message. The async variants run the blocking
+    ones in a worker thread unless a backend has a better way. asyncio is imported by them, as it is slow to
+    import and most programs never need it.
+    """
+
+    @abc.abstractmethod
+    def ask(self, title, question, answer_type, answer_default=None, pattern=None, allow_empty=True, allow_cancel=True, entrance_width=35, typed=False, timeout=None, on_timeout=None, suggestions=None, suggestions_only=False):
+        """Ask a question, see dialoger.ask"""
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def form(self, title, fields, message=None, allow_cancel=True, entrance_width=35, timeout=None, on_timeout=None):
+        """Ask several questions at once, see dialoger.form"""
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def askwithanswers(self, title, question, choices, orientation='horizontal', timeout=None, on_timeout=None, remember=False):
+        """Ask to pick one of the choices, see dialoger.askwithanswers"""
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def confirm(self, title, message, choices, timeout=None, on_timeout=False, remember=False):
+        """Ask to pick one of two choices, True for the first one, see dialoger.confirm"""
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def message(self, title, message, icon, timeout=None):
+        """Show a message, icon is alert, info, error or success"""
+        raise NotImplementedError
+
+    def notify(self, title, message, icon="info"):
+        """Show a notification without waiting for it to be closed, see dialoger.notify. Backends whose messages don't wait show a message."""
+        self.message(title, message, icon)
+
+    def progress(self, title, message, iterable=None, total=None, icon="info", fps=10):
+        """Show the progress of a job, see dialoger.progress. Backends that can't show it only count."""
+        from dialoger.tracker import tracker
+        return tracker(iterable, total, fps)
+
+    def show(self, name, *args, **kwargs):
+        """
+        Show the dialog of a function without waiting, see dialoger.show_ask
+
+        Backends that can't leave a dialog open answer it right away and return a handle that is already done.
+
+        Args:
+            name (str): function: ask, form, askwithanswers, confirm or message
+            *args, **kwargs: arguments of the function
+
+        Returns:
+            handle: the handle of the dialog
+        """
+        from dialoger.handle import handle
+        return handle.completed(getattr(self, name)(*args, **kwargs))
+
+    async def ask_async(self, *args, **kwargs):
+        import asyncio
+        return await asyncio.to_thread(self.ask, *args, **kwargs)
+
+    async def form_async(self, *args, **kwargs):
+        import asyncio
+        return await asyncio.to_thread(self.form, *args, **kwargs)
+
+    async def askwithanswers_async(self, *args, **kwargs):
+        import asyncio
+        return await asyncio.to_thread(self.askwithanswers, *args, **kwargs)
+
+    async def confirm_async(self, *args, **kwargs):
+        import asyncio
+        return await asyncio.to_thread(self.confirm, *args, **kwargs)
+
+    async def message_async(self, *args, **kwargs):
+        import asyncio
+        return await asyncio.to_thread(self.message, *args, **kwargs)
+
+
+class gui(backend):
+    """
+    Tkinter windows, shown through the shared engine
+
+    Each function is described once by a request_ method, giving the dialog class, the arguments of its show()
+    method and the function reading the result from the closed window. The blocking, async and non-blocking
+    variants only differ in how they show it.
+    """
+
+    def request_ask(self, title, question, answer_type, answer_default=None, pattern=None, allow_empty=True, allow_cancel=True, entrance_width=35, typed=False, timeout=None, on_timeout=None, suggestions=None, suggestions_only=False):
+        from dialoger import input
+        kwargs = dict(title=title, question=question, answer_type=answer_type, answer_default=answer_default, pattern=pattern, allow_empty=allow_empty, allow_cancel=allow_cancel, icon="question", entrance_width=entrance_width, timeout=timeout, suggestions=suggestions, suggestions_only=suggestions_only)
+
+        def result(dialog):
+            if dialog.timed_out:
+                return expired(on_timeout, dialog.field.default(answer_default, typed))
+            return dialog.value if typed else dialog.answer
+
+        return input, kwargs, result
+
+    def request_form(self, title, fields, message=None, allow_cancel=True, entrance_width=35, timeout=None, on_timeout=None):
+        from dialoger import inputs
+        kwargs = dict(title=title, fields=fields, message=message, allow_cancel=allow_cancel, icon="question", entrance_width=entrance_width, timeout=timeout)
+
+        def result(dialog):
+            if dialog.timed_out:
+                return expired(on_timeout, {spec["name"]: rules.default(spec["answer_default"], spec["typed"]) for spec, rules in zip(dialog.specs, dialog.fields)})
+            return dialog.answers
+
+        return inputs, kwargs, result
+
+    def request_askwithanswers(self, title, question, choices, orientation='horizontal', timeout=None, on_timeout=None, remember=False):
+        from dialoger import options
+        kwargs = dict(title=title, message=question, choices=choices, icon="question", orientation=orientation, timeout=timeout, remember=bool(remember))
+
+        def result(dialog):
+            if dialog.timed_out:
+                return expired(on_timeout)
+            if dialog.remembered:
+                keep("askwithanswers", title, question, choices, dialog.choice, remember)
+            return dialog.choice
+
+        return options, kwargs, result
+
+    def request_confirm(self, title, message, choices, timeout=None, on_timeout=False, remember=False):
+        from dialoger import options
+        kwargs = dict(title=title, message=message, choices=choices, icon="question", timeout=timeout, remember=bool(remember))
+
+        def result(dialog):
+            if dialog.timed_out:
+                return expired(on_timeout)
+            if dialog.remembered and dialog.choice is not None:
+                keep("confirm", title, message, choices, dialog.choice == choices[0], remember)
+            return dialog.choice == choices[0]
+
+        return options, kwargs, result
+
+    def request_message(self, title, message, icon, timeout=None):
+        from dialoger import options
+        kwargs = dict(title=title, message=message, choices=["OK"], icon=icon, timeout=timeout)
+        return options, kwargs, lambda dialog: None
+
+    def run(self, name, *args, **kwargs):
+        """Show the dialog of a function and wait until it is closed"""
+        from dialoger import engine
+        kind, options, result = getattr(self, "request_" + name)(*args, **kwargs)
+        return result(engine.get().show(kind, **options))
+
+    async def run_async(self, name, *args, **kwargs):
+        """Show the dialog of a function without blocking the asyncio event loop"""
+        from dialoger import engine
+        kind, options, result = getattr(self, "request_" + name)(*args, **kwargs)
+        return result(await engine.get().show_async(kind, **options))
+
+    def show(self, name, *args, **kwargs):
+        """Show the dialog of a function without waiting, see dialoger.show_ask"""
+        from dialoger import engine
+        kind, options, result = getattr(self, "request_" + name)(*args, **kwargs)
+        return engine.get().show_nowait(kind, result, **options)
+
+    def notify(self, title, message, icon="info"):
+        """Queue a notification with the process-wide notifier, see dialoger.notifier"""
+        from dialoger import notifier
+        notifier.get().notify(title, message, icon)
+
+    def progress(self, title, message, iterable=None, total=None, icon="info", fps=10):
+        """Show the progress of a job in a pooled window, see dialoger.progress"""
+        from dialoger import engine, progressbar
+        from dialoger.tracker import tracker
+        shared = engine.get()
+        job = tracker(iterable, total, fps)
+        dialog = shared.acquire(progressbar)
+        try:
+            dialog.show(title, message, job, icon, release=shared.release)
+        except Exception:
+            shared.release(dialog)
+            raise
+        return job
+
+    def ask(self, *args, **kwargs):
+        return self.run("ask", *args, **kwargs)
+
+    def form(self, *args, **kwargs):
+        return self.run("form", *args, **kwargs)
+
+    def askwithanswers(self, *args, **kwargs):
+        return self.run("askwithanswers", *args, **kwargs)
+
+    def confirm(self, *args, **kwargs):
+        return self.run("confirm", *args, **kwargs)
+
+    def message(self, *args, **kwargs):
+        return self.run("message", *args, **kwargs)
+
+    async def ask_async(self, *args, **kwargs):
+        return await self.run_async("ask", *args, **kwargs)
+
+    async def form_async(self, *args, **kwargs):
+        return await self.run_async("form", *args, **kwargs)
+
+    async def askwithanswers_async(self, *args, **kwargs):
+        return await self.run_async("askwithanswers", *args, **kwargs)
+
+    async def confirm_async(self, *args, **kwargs):
+        return await self.run_async("confirm", *args, **kwargs)
+
+    async def message_async(self, *args, **kwargs):
+        return await self.run_async("message", *args, **kwargs)
+
+
+# Known backends, as "module:class" so they are only imported when used
+_registry = {
+    "tk": "dialoger.backends:gui",
+    "tty": "dialoger.terminal:terminal",
+    "script": "dialoger.scripted:scripted",
+    "remote": "dialoger.client:client",
+}
+
+_current = None
+
+
+def register(name: str, factory) -> None:
+    """
+    Register a backend, usable with use() or in the DIALOGER_BACKEND environment variable
+
+    Args:
+        name (str): name of the backend
+        factory (type | callable | str): class or function building the backend, or "module:class"
+    """
+    _registry[name] = factory
+
+
+def create(name: str) -> backend:
+    """
+    Build a registered backend
+
+    Args:
+        name (str): name of the backend
+
+    Returns:
+        backend: the new backend
+    """
+    assert name in _registry, f"Unknown backend: {name}. Known backends: {', '.join(_registry)}"
+    factory = _registry[name]
+    if isinstance(factory, str):
+        module, attribute = factory.split(":")
+        factory = getattr(__import__(module, fromlist=[attribute]), attribute)
+    return factory()
+
+
+def detect() -> str:
+    """
+    Choose a backend for this process without importing tkinter
+
+    The DIALOGER_BACKEND environment variable wins, then a dialog server in DIALOGER_SERVER. Otherwise Tk is used
+    on Windows and macOS, and elsewhere when there is an X11 or Wayland display and tkinter is installed; the
+    terminal is used in any other case.
+
+    Returns:
+        str: name of the backend
+    """
+    name = os.environ.get("DIALOGER_BACKEND")
+    if name:
+        return name
+    if os.environ.get("DIALOGER_SERVER"):
+        return "remote"
+    import importlib.util
+    if importlib.util.find_spec("_tkinter") is None:
+        return "tty"
+    if sys.platform in ("win32", "darwin"):
+        return "tk"
+    if os.environ.get("DISPLAY") or os.environ.get("WAYLAND_DISPLAY"):
+        return "tk"
+    return "tty"
+
+
+def use(choice) -> backend:
+    """
+    Set the backend of the functions in dialoger
+
+    Args:
+        choice (str | backend): name of a registered backend, or a backend
+
+    Returns:
+        backend: the backend in use
+    """
+    global _current
+    _current = create(choice) if isinstance(choice, str) else choice
+    return _current
+
+
+def get() -> backend:
+    """Return the backend in use, choosing one on the first call"""
+    if _current is None:
+        return use(detect())
+    return _current
+
+
+# Seconds every dialog waits for an answer when its function isn't given a timeout, so unattended runs never
+# hang on a prompt. None (the default, unless DIALOGER_TIMEOUT is set) or 0 waits forever.
+default_timeout = float(os.environ["DIALOGER_TIMEOUT"]) if os.environ.get("DIALOGER_TIMEOUT") else None
+
+
+def timeout(value: float = None) -> float:
+    """
+    Timeout of a dialog
+
+    Args:
+        value (float, optional): timeout given to the function. Defaults to None, default_timeout.
+
+    Returns:
+        float: seconds to wait, None to wait forever
+    """
+    if value is None:
+        value = default_timeout
+    return value or None
@@ -0,0 +1,112 @@
+import tkinter as tk
+from dialoger.search import index
+
+class choicelist:
+    """List of choices with a type-ahead filter, where only the visible rows are given to Tk"""
+
+    rows = 15
+
+    def __init__(self, master, on_choose):
+        """Initialize the class
+
+        Args:
+            master (tk.Misc): parent widget
+            on_choose (callable): function receiving the chosen item
+        """
+        self.on_choose = on_choose
+        self.index = index([])
+        self.matches = []
+        self.query = ""
+        self.top = 0
+        self.selected = 0
+
+        self.frame = tk.Frame(master)
+        self.filter = tk.Entry(self.frame)
+        self.listbox = tk.Listbox(self.frame, height=self.rows, width=50, activestyle="none", exportselection=False)
+        self.scrollbar = tk.Scrollbar(self.frame, orient=tk.VERTICAL, command=self.scroll)
+        self.filter.grid(row=0, column=0, columnspan=2, sticky=tk.EW, pady=(0, 5), ipady=3)
+        self.listbox.grid(row=1, column=0, sticky=tk.NSEW)
+        self.scrollbar.grid(row=1, column=1, sticky=tk.NS)
+        self.frame.columnconfigure(0, weight=1)
+
+        self.filter.bind("<KeyRelease>", self.refilter)
+        self.filter.bind("<Down>", lambda event: self.move(1))
+        self.filter.bind("<Up>", lambda event: self.move(-1))
+        self.filter.bind("<Next>", lambda event: self.move(self.rows))
+        self.filter.bind("<Prior>", lambda event: self.move(-self.rows))
+        self.filter.bind("<Return>", lambda event: self.choose())
+        self.listbox.bind("<<ListboxSelect>>", self.clicked)
+        self.listbox.bind("<Double-Button-1>", lambda event: self.choose())
+        self.listbox.bind("<MouseWheel>", lambda event: self.scroll("scroll", -1 if event.delta > 0 else 1, "units"))
+        self.listbox.bind("<Button-4>", lambda event: self.scroll("scroll", -1, "units"))
+        self.listbox.bind("<Button-5>", lambda event: self.scroll("scroll", 1, "units"))
+
+    def load(self, choices):
+        """
+        Show a new list of choices, with an empty filter
+
+        Args:
+            choices (list): list of choices
+        """
+        self.index = index(choices)
+        self.filter.delete(0, tk.END)
+        self.query = ""
+        self.matches = list(range(len(self.index)))
+        self.top = 0
+        self.selected = 0
+        self.redraw()
+
+    def refilter(self, event=None):
+        """Filter the choices with the text of the filter, if it changed"""
+        query = self.filter.get()
+        if query == self.query:
+            return
+        self.query = query
+        self.matches = self.index.search(query)
+        self.top = 0
+        self.selected = 0
+        self.redraw()
+
+    def redraw(self):
+        """Put the visible rows in the listbox and update the scrollbar"""
+        visible = self.matches[self.top:self.top + self.rows]
+        self.listbox.delete(0, tk.END)
+        if visible:
+            self.listbox.insert(tk.END, *[self.index.labels[i] for i in visible])
+            self.listbox.selection_set(self.selected - self.top)
+        total = max(len(self.matches), 1)
+        self.scrollbar.set(self.top / total, min(self.top + self.rows, total) / total)
+
+    def scroll(self, action, amount, unit=None):
+        """Handle the commands of the scrollbar and of the mouse wheel"""
+        if action == "moveto":
+            top = int(float(amount) * len(self.matches))
+        else:
+            top = self.top + int(amount) * (self.rows if unit == "pages" else 1)
+        self.top = max(0, min(top, len(self.matches) - self.rows))
+        self.selected = min(max(self.selected, self.top), self.top + self.rows - 1)
+        self.redraw()
+
+    def move(self, delta):
+        """Move the selection, scrolling to keep it visible"""
+        if not self.matches:
+            return "break"
+        self.selected = max(0, min(self.selected + delta, len(self.matches) - 1))
+        if self.selected < self.top:
+            self.top = self.selected
+        elif self.selected >= self.top + self.rows:
+            self.top = self.selected - self.rows + 1
+        self.redraw()
+        return "break"
+
+    def clicked(self, event):
+        """Select the row clicked in the listbox"""
+        selection = self.listbox.curselection()
+        if selection:
+            self.selected = self.top + selection[0]
+
+    def choose(self):
+        """Choose the selected item"""
+        if self.matches:
+            self.on_choose(self.index.items[self.matches[self.selected]])
+        return "break"
@@ -0,0 +1,142 @@
+import json
+import os
+import socket
+from dialoger.backends import backend, body, expired
+
+# Functions a dialog server answers, see dialoger.server. A notification is answered as soon as it is queued.
+FUNCTIONS = ("ask", "form", "askwithanswers", "confirm", "message", "notify")
+
+# Host of a TCP address given as a port alone
+LOOPBACK = "127.0.0.1"
+
+
+def parse_address(address: str):
+    """
+    Socket family and address of a dialog server
+
+    Args:
+        address (str): path of a Unix socket, or host:port of a TCP socket on platforms without Unix sockets.
+            A port alone, such as 8765 or :8765, is a TCP socket on the loopback interface.
+
+    Returns:
+        tuple: (family, address) for socket.socket and its connect or bind
+    """
+    host, _, port = address.rpartition(":")
+    if port.isdigit() and "/" not in address and "\\" not in address:
+        return socket.AF_INET, (host or LOOPBACK, int(port))
+    assert hasattr(socket, "AF_UNIX"), f"Unix sockets are not supported here, use host:port instead of {address}"
+    return socket.AF_UNIX, address
+
+
+class client(backend):
+    """
+    Backend sending the dialogs to a dialog server, so the processes of a program share one Tk interpreter
+
+    Each call opens a connection, sends the request as one line of JSON and waits for the answer, so the client
+    works the same from threads and from processes started with fork. It doesn't import tkinter.
+    """
+
+    def __init__(self, address=None, token=None):
+        """Initialize the class
+
+        Args:
+            address (str, optional): address of the server, see parse_address. Defaults to the DIALOGER_SERVER environment variable.
+            token (str, optional): token the server asks for, needed over TCP. Defaults to the DIALOGER_TOKEN environment variable.
+        """
+        self.address = address if address is not None else os.environ.get("DIALOGER_SERVER")
+        assert self.address, "No dialog server address, set DIALOGER_SERVER or give the address."
+        self.token = token if token is not None else os.environ.get("DIALOGER_TOKEN")
+
+    def call(self, function: str, *args, raise_on_timeout=False, **kwargs):
+        """
+        Ask the server to show a dialog and wait for its result
+
+        Args:
+            function (str): function: ask, form, askwithanswers, confirm or message
+            *args, **kwargs: arguments of the function, as given to the backend
+            raise_on_timeout (bool, optional): raise TimeoutError when the time to answer runs out, instead of
+                returning on_timeout. Defaults to False.
+
+        Raises:
+            TimeoutError: the time to answer ran out, and the dialog was asked to raise
+            PermissionError: the server refused the token
+            ConnectionError: the server could not be reached or closed the connection
+            RuntimeError: the server failed to show the dialog
+
+        Returns:
+            any: the result of the function
+        """
+        family, address = parse_address(self.address)
+        request = {"function": function, "args": args, "kwargs": kwargs}
+        if raise_on_timeout:
+            request["raise_on_timeout"] = True
+        if self.token:
+            request["token"] = self.token
+        request = json.dumps(request, default=str) + "\n"
+        with socket.socket(family, socket.SOCK_STREAM) as connection:
+            connection.connect(address)
+            connection.sendall(request.encode("utf-8"))
+            with connection.makefile("r", encoding="utf-8") as stream:
+                line = stream.readline()
+        if not line:
+            raise ConnectionError(f"The dialog server at {self.address} closed the connection")
+        response = json.loads(line)
+        if "error" in response:
+            if response.get("type") == "TimeoutError":
+                raise TimeoutError(response["error"])
+            if response.get("type") == "PermissionError":
+                raise PermissionError(response["error"])
+            raise RuntimeError(f"The dialog server failed: {response['error']}")
+        return response["result"]
+
+    def timed(self, function: str, *args, on_timeout=None, **kwargs):
+        """
+        Call a function whose on_timeout can't be sent, an exception to raise, by asking the server to raise TimeoutError
+
+        Any other on_timeout is sent as a value and returned as is, even a string such as "TimeoutError".
+
+        Args:
+            function (str): function: ask, form, askwithanswers or confirm
+            *args, **kwargs: arguments of the function, without on_timeout
+            on_timeout (any, optional): on_timeout argument of the function. Defaults to None.
+
+        Returns:
+            any: the result of the function
+        """
+        if isinstance(on_timeout, BaseException) or (isinstance(on_timeout, type) and issubclass(on_timeout, BaseException)):
+            try:
+                return self.call(function, *args, raise_on_timeout=True, **kwargs)
+            except TimeoutError:
+                return expired(on_timeout)
+        return self.call(function, *args, on_timeout=on_timeout, **kwargs)
+
+    def ask(self, title, question, answer_type, answer_default=None, pattern=None, allow_empty=True, allow_cancel=True, entrance_width=35, typed=False, timeout=None, on_timeout=None, suggestions=None, suggestions_only=False):
+        """Ask a question, see dialoger.ask. Suggestions are sent as a list, a function giving them is called here."""
+        if suggestions is not None:
+            suggestions = [str(item) for item in (suggestions() if callable(suggestions) else suggestions)]
+        return self.timed("ask", title, question, answer_type, answer_default, pattern, allow_empty, allow_cancel, entrance_width, typed, timeout, on_timeout=on_timeout, suggestions=suggestions, suggestions_only=suggestions_only)
+
+    def form(self, title, fields, message=None, allow_cancel=True, entrance_width=35, timeout=None, on_timeout=None):
+        """Ask several questions at once, see dialoger.form"""
+        return self.timed("form", title, fields, message, allow_cancel, entrance_width, timeout, on_timeout=on_timeout)
+
+    def askwithanswers(self, title, question, choices, orientation='horizontal', timeout=None, on_timeout=None, remember=False):
+        """Ask to pick one of the choices, see dialoger.askwithanswers"""
+        return self.timed("askwithanswers", title, question, list(choices), orientation, timeout, on_timeout=on_timeout, remember=remember)
+
+    def confirm(self, title, message, choices, timeout=None, on_timeout=False, remember=False):
+        """Ask to pick one of two choices, True for the first one, see dialoger.confirm"""
+        return self.timed("confirm", title, message, list(choices), timeout, on_timeout=on_timeout, remember=remember)
+
+    def message(self, title, message, icon, timeout=None):
+        """Show a message. A path is sent as is, the server reads the file; an iterable of lines is sent as a text."""
+        message = body(message)
+        if isinstance(message, os.PathLike):
+            return self.call("message", title, None, icon, timeout, path=os.fspath(message))
+        if message is not None and not isinstance(message, str):
+            message = "".join(line if str(line).endswith("\n") else f"{line}\n" for line in map(str, message))
+        return self.call("message", title, message, icon, timeout)
+
+    def notify(self, title, message, icon="info"):
+        """Queue a notification with the notifier of the server, which answers without waiting for the window"""
+        self.call("notify", title, message, icon)
@@ -0,0 +1,49 @@
+import math
+import time
+import tkinter as tk
+
+class countdown:
+    """Label counting down the seconds left before a dialog closes by itself"""
+
+    def __init__(self, master):
+        """Initialize the class
+
+        Args:
+            master (tk.Misc): parent widget, the label is packed by the dialog
+        """
+        self.label = tk.Label(master, foreground="gray")
+        self.job = None
+        self.deadline = None
+        self.on_expire = None
+
+    def start(self, seconds: float, on_expire) -> None:
+        """
+        Start counting down
+
+        Args:
+            seconds (float): seconds before the time runs out
+            on_expire (callable): function called when it does
+        """
+        self.stop()
+        self.deadline = time.monotonic() + seconds
+        self.on_expire = on_expire
+        self.tick()
+
+    def tick(self):
+        """Show the seconds left, and call on_expire when there are none"""
+        self.job = None
+        left = self.deadline - time.monotonic()
+        if left <= 0:
+            on_expire, self.on_expire = self.on_expire, None
+            on_expire()
+            return
+        self.label.config(text=f"Closing in {math.ceil(left)} s")
+        # Next tick when the number of seconds shown changes
+        self.job = self.label.after(max(1, int((left - math.ceil(left) + 1) * 1000)), self.tick)
+
+    def stop(self):
+        """Stop counting down"""
+        if self.job is not None:
+            self.label.after_cancel(self.job)
+            self.job = None
+        self.on_expire = None
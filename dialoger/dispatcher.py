@@ -0,0 +1,224 @@
+import queue
+import threading
+from concurrent.futures import Future
+
+from dialoger import backends, engine
+
+class dispatcher:
+    """Shows dialogs requested from any thread on a UI thread that owns its own Tk interpreter"""
+
+    _instance = None
+
+    def __init__(self, concurrency=1, interval=0.02):
+        """Initialize the class
+
+        Args:
+            concurrency (int, optional): how many dialogs can be shown side by side, the others wait in the queue. Defaults to 1.
+            interval (float, optional): seconds between two checks of the queue. Defaults to 0.02.
+        """
+        assert concurrency >= 1, "The concurrency must allow at least one dialog at a time."
+        self.concurrency = concurrency
+        self.interval = interval
+        self.requests = queue.Queue()
+        self.calls = queue.Queue()
+        self.shown = []
+        self.thread = None
+        self.engine = None
+        self.lock = threading.Lock()
+
+    @classmethod
+    def get(cls):
+        """Return the process-wide dispatcher, creating it on first use"""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def submit(self, kind, result, **kwargs) -> Future:
+        """
+        Queue a dialog, it is shown on the UI thread as soon as there is room for it
+
+        Args:
+            kind (type): dialog class, options or input
+            result (callable): function turning the closed window into the result of the future
+            **kwargs: arguments of the dialog's show() method
+
+        Returns:
+            Future: result of the dialog
+        """
+        future = Future()
+        self.requests.put((future, kind, result, kwargs))
+        self.start()
+        return future
+
+    def call(self, function, *args) -> Future:
+        """
+        Run a function on the UI thread, without waiting for room like the dialogs
+
+        Args:
+            function (callable): function, it can use the Tk interpreter of the dispatcher through self.engine
+            *args: arguments of the function
+
+        Returns:
+            Future: result of the function
+        """
+        future = Future()
+        self.calls.put((future, function, args))
+        self.start()
+        return future
+
+    def start(self):
+        """Start the UI thread if it isn't running"""
+        with self.lock:
+            if self.thread is None or not self.thread.is_alive():
+                self.thread = threading.Thread(target=self.run, name="dialoger", daemon=True)
+                self.thread.start()
+
+    def run(self):
+        """Body of the UI thread"""
+        self.engine = engine(pool_size=max(2, self.concurrency), shared_root=False)
+        try:
+            root = self.engine.find_root()
+        except Exception as error:
+            # No display, fail the requests instead of leaving them pending
+            for pending in (self.requests, self.calls):
+                while True:
+                    try:
+                        item = pending.get_nowait()
+                    except queue.Empty:
+                        break
+                    if item is not None and item[0].set_running_or_notify_cancel():
+                        item[0].set_exception(error)
+            return
+        root.after(0, self.poll, root)
+        root.mainloop()
+        self.engine.shutdown()
+
+    def finish(self, item):
+        """Resolve the future of a closed dialog and give the window back to the pool"""
+        future, dialog, result = item
+        self.shown.remove(item)
+        try:
+            future.set_result(result(dialog))
+        except Exception as error:
+            future.set_exception(error)
+        self.engine.release(dialog)
+
+    def poll(self, root):
+        """Run the queued calls, resolve the dialogs that were closed and show the queued ones while there is room"""
+        while True:
+            try:
+                future, function, args = self.calls.get_nowait()
+            except queue.Empty:
+                break
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(function(*args))
+            except Exception as error:
+                future.set_exception(error)
+
+        for item in list(self.shown):
+            dialog = item[1]
+            if not dialog.alive() or dialog.closed.get():
+                self.finish(item)
+
+        while len(self.shown) < self.concurrency:
+            try:
+                item = self.requests.get_nowait()
+            except queue.Empty:
+                break
+            if item is None:
+                for item in list(self.shown):
+                    if item[1].alive():
+                        item[1].close()
+                    self.finish(item)
+                root.quit()
+                return
+            future, kind, result, kwargs = item
+            if not future.set_running_or_notify_cancel():
+                continue
+            dialog = self.engine.acquire(kind)
+            try:
+                dialog.show(wait=False, **kwargs)
+            except Exception as error:
+                future.set_exception(error)
+                self.engine.release(dialog)
+                continue
+            # Dialogs shown side by side are cascaded so they don't hide each other
+            offset = 30 * len(self.shown)
+            dialog.dialog.geometry(f"+{400 + offset}+{250 + offset}")
+            self.shown.append((future, dialog, result))
+        root.after(int(self.interval * 1000), self.poll, root)
+
+    def shutdown(self, wait=True):
+        """
+        Close the shown dialogs, cancel the queued ones and stop the UI thread
+
+        Args:
+            wait (bool, optional): wait until the UI thread has stopped. Defaults to True.
+        """
+        with self.lock:
+            thread, self.thread = self.thread, None
+        while True:
+            try:
+                item = self.requests.get_nowait()
+            except queue.Empty:
+                break
+            if item is not None:
+                item[0].cancel()
+        while True:
+            try:
+                self.calls.get_nowait()[0].cancel()
+            except queue.Empty:
+                break
+        if thread is not None and thread.is_alive():
+            self.requests.put(None)
+            if wait:
+                thread.join()
+
+    def request(self, name, *args, **kwargs) -> Future:
+        """Queue the dialog of a function of dialoger, described by the request_ method of the Tk backend"""
+        kind, options, result = getattr(backends.gui(), "request_" + name)(*args, **kwargs)
+        return self.submit(kind, result, **options)
+
+    def ask(self, title:str, question:str, answer_type:str, answer_default:str = None, pattern:str = None, allow_empty:bool = True, allow_cancel:bool = True, entrance_width=35, typed:bool = False, timeout:float = None, on_timeout=None, suggestions=None, suggestions_only:bool = False) -> Future:
+        """Queue an input window, see dialoger.ask"""
+        return self.request("ask", title, question, answer_type, answer_default, pattern, allow_empty, allow_cancel, entrance_width, typed, backends.timeout(timeout), on_timeout, suggestions, suggestions_only)
+
+    def remembered(self, kind, title, message, choices, remember):
+        """Future already done with the remembered answer of a dialog, None if there is none, see dialoger.store"""
+        if not remember:
+            return None
+        from dialoger.store import store
+        found, answer = store.get().recall(kind, title, message, list(choices))
+        if not found:
+            return None
+        future = Future()
+        future.set_result(answer)
+        return future
+
+    def askwithanswers(self, title:str, question:str, choices:list, orientation='horizontal', timeout:float = None, on_timeout=None, remember=False) -> Future:
+        """Queue a window with a list of choices, see dialoger.askwithanswers"""
+        return self.remembered("askwithanswers", title, question, choices, remember) or self.request("askwithanswers", title, question, choices, orientation, backends.timeout(timeout), on_timeout, remember)
+
+    def confirm(self, title:str, message:str, choices:list=["Yes", "No"], timeout:float = None, on_timeout:bool = False, remember=False) -> Future:
+        """Queue a confirmation window, see dialoger.confirm"""
+        assert len(choices) == 2, "The list of options must contain exactly two options."
+        assert isinstance(choices[0], str) and isinstance(choices[1], str), "Options must be strings."
+        return self.remembered("confirm", title, message, choices, remember) or self.request("confirm", title, message, choices, backends.timeout(timeout), on_timeout, remember)
+
+    def alert(self, title:str, message:str, timeout:float = None) -> Future:
+        """Queue an alert window, see dialoger.alert"""
+        return self.request("message", title, message, "alert", backends.timeout(timeout))
+
+    def info(self, title:str, message:str, timeout:float = None) -> Future:
+        """Queue an information window, see dialoger.info"""
+        return self.request("message", title, message, "info", backends.timeout(timeout))
+
+    def error(self, title:str, message:str, timeout:float = None) -> Future:
+        """Queue an error window, see dialoger.error"""
+        return self.request("message", title, message, "error", backends.timeout(timeout))
+
+    def success(self, title:str, message:str, timeout:float = None) -> Future:
+        """Queue a success window, see dialoger.success"""
+        return self.request("message", title, message, "success", backends.timeout(timeout))
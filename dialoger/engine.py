@@ -0,0 +1,194 @@
+import tkinter as tk
+from dialoger.handle import handle
+
+class engine:
+    """Keeps one Tk interpreter alive between dialogs and reuses withdrawn windows instead of building new ones"""
+
+    _instance = None
+
+    def __init__(self, pool_size=2, interval=0.01, shared_root=True):
+        """Initialize the class
+
+        Args:
+            pool_size (int, optional): how many idle windows of each kind are kept. Defaults to 2.
+            interval (float, optional): seconds between two updates of the Tk event loop while an async dialog is open. Defaults to 0.01.
+            shared_root (bool, optional): show the dialogs on the application's root when there is one. Defaults to True.
+        """
+        self.pool_size = pool_size
+        self.interval = interval
+        self.shared_root = shared_root
+        self.root = None
+        self.idle = {}
+        self.handles = []
+
+    @classmethod
+    def get(cls):
+        """Return the process-wide engine, creating it on first use"""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def find_root(self):
+        """
+        Find the root the dialogs belong to
+
+        The application's root is used when there is one (and shared_root is set), otherwise a hidden root is
+        created once and kept.
+        The hidden root is not made the default root, so windows created later by the application don't end
+        up inside it.
+
+        Returns:
+            tk.Tk: root window
+        """
+        if self.shared_root and tk._default_root:
+            return tk._default_root
+        if self.root is None or not self.root_alive():
+            self.root = tk.Tk()
+            self.root.withdraw()
+            if tk._default_root is self.root:
+                tk._default_root = None
+        return self.root
+
+    def root_alive(self):
+        """Check if the hidden root still exists"""
+        try:
+            return bool(self.root.winfo_exists())
+        except tk.TclError:
+            return False
+
+    def acquire(self, kind, modal=None):
+        """
+        Take an idle window of the given kind from the pool, or build a new one
+
+        Args:
+            kind (type): dialog class, options or input
+            modal (bool, optional): disable the root while the window is shown. Defaults to None, only when it is the application's root.
+
+        Returns:
+            options | input: a withdrawn window
+        """
+        root = self.find_root()
+        if modal is None:
+            modal = root is not self.root
+        idle = self.idle.setdefault(kind, [])
+        while idle:
+            dialog = idle.pop()
+            if dialog._root is root and dialog.alive():
+                dialog.modal = modal
+                return dialog
+            dialog.dispose()
+        return kind.prebuilt(master=root, keep=True, modal=modal)
+
+    def release(self, dialog):
+        """
+        Give a closed window back to the pool, destroying it if the pool is full
+
+        Args:
+            dialog (options | input): window to release
+        """
+        idle = self.idle.setdefault(type(dialog), [])
+        if len(idle) < self.pool_size and dialog.alive():
+            idle.append(dialog)
+        else:
+            dialog.dispose()
+
+    def show(self, kind, **kwargs):
+        """
+        Show a pooled window of the given kind and wait until it is closed
+
+        Args:
+            kind (type): dialog class, options or input
+            **kwargs: arguments of the dialog's show() method
+
+        Returns:
+            options | input: the closed window, with its choice or answer set
+        """
+        dialog = self.acquire(kind)
+        try:
+            dialog.show(**kwargs)
+        finally:
+            self.release(dialog)
+        return dialog
+
+    async def show_async(self, kind, **kwargs):
+        """
+        Show a pooled window of the given kind without blocking the asyncio event loop
+
+        Instead of waiting inside Tk, the Tk event loop is updated every `interval` seconds from the asyncio
+        loop until the window is closed. Cancelling the task closes the window.
+
+        Args:
+            kind (type): dialog class, options or input
+            **kwargs: arguments of the dialog's show() method
+
+        Returns:
+            options | input: the closed window, with its choice or answer set
+        """
+        import asyncio
+        dialog = self.acquire(kind)
+        try:
+            dialog.show(wait=False, **kwargs)
+            while dialog.alive() and not dialog.closed.get():
+                dialog.dialog.update()
+                await asyncio.sleep(self.interval)
+        except asyncio.CancelledError:
+            if dialog.alive():
+                dialog.close()
+            raise
+        finally:
+            self.release(dialog)
+        return dialog
+
+    def show_nowait(self, kind, result, **kwargs):
+        """
+        Show a pooled window of the given kind without waiting, and without disabling the root
+
+        Several of these windows can be open at the same time, they are cascaded so they don't hide each other.
+
+        Args:
+            kind (type): dialog class, options or input
+            result (callable): function turning the closed window into the result of the handle
+            **kwargs: arguments of the dialog's show() method
+
+        Returns:
+            handle: the handle of the dialog
+        """
+        dialog = self.acquire(kind, modal=False)
+        try:
+            dialog.show(wait=False, **kwargs)
+        except Exception:
+            self.release(dialog)
+            raise
+        offset = 30 * (len(self.handles) % 10)
+        dialog.dialog.geometry(f"+{400 + offset}+{250 + offset}")
+        shown = handle(dialog, result, self.release)
+        self.handles.append(shown)
+        shown.add_done_callback(self.handles.remove)
+        return shown
+
+    def prewarm(self, kind, count=1):
+        """
+        Build windows ahead of time so the first dialogs open faster
+
+        Args:
+            kind (type): dialog class, options or input
+            count (int, optional): number of windows to build. Defaults to 1.
+        """
+        dialogs = [self.acquire(kind) for _ in range(count)]
+        for dialog in dialogs:
+            self.release(dialog)
+
+    def shutdown(self):
+        """Close the windows shown without waiting, destroy the pooled windows and the hidden root"""
+        for shown in list(self.handles):
+            root = shown.dialog._root
+            shown.cancel()
+            # Runs the idle callback giving the window back, so it is destroyed below
+            root.update_idletasks()
+        for idle in self.idle.values():
+            for dialog in idle:
+                dialog.dispose()
+        self.idle.clear()
+        if self.root is not None and self.root_alive():
+            self.root.destroy()
+        self.root = None
@@ -0,0 +1,193 @@
+import bisect
+import time
+
+# Functions called with every event, on the thread of the Tk interpreter. While there is none, the dialogs
+# don't build the events at all. A dialog emits created, shown, focused, invalid (a rejected keystroke or
+# answer), answered or cancelled (or timeout before cancelled when its time runs out), and destroyed when its
+# window is destroyed for good.
+observers = []
+
+
+class event:
+    """Something that happened to a dialog"""
+
+    __slots__ = ("name", "time", "kind", "title", "icon", "source", "data")
+
+    def __init__(self, name, kind, title, icon, source, data):
+        """Initialize the class
+
+        Args:
+            name (str): what happened: created, shown, focused, invalid, answered, timeout, cancelled or destroyed
+            kind (str): class of the dialog: options, input or inputs
+            title (str): title of the dialog, None before the first time it is shown
+            icon (str): icon of the dialog
+            source (int): identity of the window, the same for every event of a window
+            data (dict): details of the event, such as the choice of an options window
+        """
+        self.name = name
+        self.time = time.monotonic()
+        self.kind = kind
+        self.title = title
+        self.icon = icon
+        self.source = source
+        self.data = data
+
+    def __repr__(self):
+        return f"event({self.name!r}, kind={self.kind!r}, title={self.title!r}, time={self.time:.6f}, data={self.data!r})"
+
+
+def subscribe(observer):
+    """
+    Call a function with every event
+
+    Args:
+        observer (callable): function receiving an event
+
+    Returns:
+        callable: the function, so subscribe can be used as a decorator
+    """
+    observers.append(observer)
+    return observer
+
+
+def unsubscribe(observer) -> None:
+    """
+    Stop calling a function with the events
+
+    Args:
+        observer (callable): function given to subscribe
+    """
+    if observer in observers:
+        observers.remove(observer)
+
+
+def emit(name: str, dialog, **data) -> None:
+    """
+    Send an event to the observers
+
+    Args:
+        name (str): what happened
+        dialog (options | input | inputs): dialog it happened to
+        **data: details of the event
+    """
+    record = event(name, type(dialog).__name__, getattr(dialog, "title", None), getattr(dialog, "icon", None), id(dialog), data)
+    for observer in list(observers):
+        observer(record)
+
+
+def log(logger=None, level=10):
+    """
+    Log every event
+
+    Args:
+        logger (logging.Logger, optional): logger. Defaults to the "dialoger" logger.
+        level (int, optional): level of the messages. Defaults to logging.DEBUG.
+
+    Returns:
+        callable: the observer, to unsubscribe it
+    """
+    if logger is None:
+        import logging
+        logger = logging.getLogger("dialoger")
+
+    def observer(record):
+        logger.log(level, "%s %s %r %s", record.kind, record.name, record.title, record.data or "")
+
+    return subscribe(observer)
+
+
+class histogram:
+    """Counts of durations in fixed buckets, from 10 ms to 5 minutes"""
+
+    BOUNDS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 300)
+
+    def __init__(self):
+        self.counts = [0] * (len(self.BOUNDS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.low = None
+        self.high = None
+
+    def add(self, seconds: float) -> None:
+        """Count one duration"""
+        self.counts[bisect.bisect_left(self.BOUNDS, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        self.low = seconds if self.low is None else min(self.low, seconds)
+        self.high = seconds if self.high is None else max(self.high, seconds)
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimate a quantile, as the upper bound of its bucket
+
+        Args:
+            q (float): quantile, between 0 and 1
+
+        Returns:
+            float: duration in seconds, None if nothing was counted
+        """
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for position, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank and count:
+                return min(self.BOUNDS[position], self.high) if position < len(self.BOUNDS) else self.high
+        return self.high
+
+    def summary(self) -> dict:
+        """Count, mean, extremes, estimated quantiles and buckets, in seconds"""
+        return {
+            "count": self.count,
+            "mean": self.total / self.count if self.count else None,
+            "min": self.low,
+            "max": self.high,
+            "p50": self.quantile(0.5),
+            "p90": self.quantile(0.9),
+            "p99": self.quantile(0.99),
+            "buckets": dict(zip([*map(str, self.BOUNDS), "inf"], self.counts)),
+        }
+
+
+class latencies:
+    """
+    Latency histograms per dialog title, subscribed while it exists
+
+    overhead is the time from showing a window to its first focus, the part the user waits for dialoger, and
+    response the time from showing it to the answer or cancel, the part spent by the user.
+    """
+
+    def __init__(self):
+        self.shown = {}
+        self.overhead = {}
+        self.response = {}
+        subscribe(self)
+
+    def __call__(self, record):
+        if record.name == "shown":
+            self.shown[record.source] = record.time
+        elif record.name == "focused":
+            start = self.shown.get(record.source)
+            if start is not None:
+                self.overhead.setdefault(record.title, histogram()).add(record.time - start)
+        elif record.name in ("answered", "cancelled"):
+            start = self.shown.pop(record.source, None)
+            if start is not None:
+                self.response.setdefault(record.title, histogram()).add(record.time - start)
+        elif record.name == "destroyed":
+            self.shown.pop(record.source, None)
+
+    def summary(self) -> dict:
+        """
+        Summaries of the histograms
+
+        Returns:
+            dict: for each title, the summaries of its overhead and response histograms
+        """
+        titles = sorted(set(self.overhead) | set(self.response), key=str)
+        return {title: {name: histograms[title].summary() for name, histograms in (("overhead", self.overhead), ("response", self.response)) if title in histograms} for title in titles}
+
+    def stop(self) -> None:
+        """Stop collecting"""
+        unsubscribe(self)
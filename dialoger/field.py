@@ -0,0 +1,114 @@
+from dialoger import validators
+from dialoger.mask import mask
+
+# Keys of a field spec and their defaults, the same options ask has
+FIELD = {
+    "name": None,
+    "question": "",
+    "answer_type": "str",
+    "answer_default": None,
+    "pattern": None,
+    "allow_empty": True,
+    "typed": False,
+}
+
+class field:
+    """Rules of one answer: its type, its pattern and whether it can be empty"""
+
+    def __init__(self, answer_type="str", pattern=None, allow_empty=True):
+        """Initialize the class
+
+        Args:
+            answer_type (str, optional): type of answer, see dialoger.validators. Defaults to "str".
+            pattern (str, optional): pattern for the answer, see dialoger.mask. Defaults to None.
+            allow_empty (bool, optional): allow empty answer. Defaults to True.
+        """
+        self.answer_type = answer_type
+        self.validator = validators.get(answer_type)
+        self.pattern = pattern
+        self.mask = mask.compile(pattern) if pattern is not None else None
+        self.allow_empty = allow_empty
+
+    def accepts(self, value: str) -> bool:
+        """
+        Check a keystroke
+
+        Args:
+            value (str): text the entry would have after the keystroke
+
+        Returns:
+            bool: True if the keystroke is accepted, False otherwise
+        """
+        return self.validator.accepts(value)
+
+    def valid(self, value: str) -> bool:
+        """
+        Validate the answer
+
+        Args:
+            value (str): answer
+
+        Returns:
+            bool: True if the answer is valid, False otherwise
+        """
+        if value == "":
+            return self.allow_empty and self.mask is None
+        if not self.validator.valid(value):
+            return False
+        if self.mask is not None:
+            if not self.mask.complete(value):
+                return False
+        return True
+
+    def parse(self, value: str):
+        """
+        Convert a valid answer to its type
+
+        Args:
+            value (str): answer
+
+        Returns:
+            any: the typed answer, None if it is empty
+        """
+        return self.validator.parse(value) if value != "" else None
+
+    def default(self, answer_default, typed: bool = False):
+        """
+        Answer given when the time to answer runs out
+
+        Args:
+            answer_default (any): default answer of the question
+            typed (bool, optional): convert it to its type. Defaults to False.
+
+        Returns:
+            any: the default answer, None if there is none or it is not a valid typed answer
+        """
+        if answer_default is None or not typed:
+            return answer_default
+        text = str(answer_default)
+        return self.parse(text) if self.valid(text) else None
+
+    def format(self, entry) -> str:
+        """
+        Format the text of an entry according to the pattern, keeping the caret after the same typed characters
+
+        Args:
+            entry (tk.Entry): entry
+
+        Returns:
+            str: the formatted text
+        """
+        text = entry.get()
+        if self.mask is None:
+            return text
+        result, caret = self.mask.apply(text, entry.index("insert"))
+
+        # updates only the part of the entry that changed
+        if result != text:
+            start = 0
+            while start < len(text) and start < len(result) and text[start] == result[start]:
+                start += 1
+            entry.delete(start, "end")
+            entry.insert(start, result[start:])
+        entry.icursor(caret)
+        return result
@@ -0,0 +1,139 @@
+class handle:
+    """
+    Result of a dialog shown without waiting for it
+
+    It is used from the thread of the Tk interpreter, like the window itself. Waiting runs the Tk event loop,
+    so the application's windows keep updating.
+    """
+
+    def __init__(self, dialog=None, result=None, release=None):
+        """Initialize the class
+
+        Args:
+            dialog (options | input | inputs, optional): window being shown. Defaults to None, a handle that is already done.
+            result (callable, optional): function turning the closed window into the result. Defaults to None.
+            release (callable, optional): function receiving the window once it is closed, to pool or destroy it. Defaults to None.
+        """
+        self.dialog = dialog
+        self.convert = result
+        self.release = release
+        self.value = None
+        self.error = None
+        self.finished = dialog is None
+        self.was_cancelled = False
+        self.callbacks = []
+        self.trace = dialog.closed.trace_add("write", self.changed) if dialog is not None else None
+
+    @classmethod
+    def completed(cls, value):
+        """
+        Build a handle that is already done
+
+        Args:
+            value (any): result
+
+        Returns:
+            handle: the handle
+        """
+        self = cls()
+        self.value = value
+        return self
+
+    def changed(self, *args):
+        """Finish when the window is closed"""
+        if self.finished or not self.dialog.closed.get():
+            return
+        dialog = self.dialog
+        dialog.closed.trace_remove("write", self.trace)
+        self.finished = True
+        self.dialog = None
+        # The error of the result, such as the one asked for by on_timeout, is raised by result()
+        try:
+            self.value = self.convert(dialog)
+        except Exception as error:
+            self.error = error
+        # The window is still being closed, so it is given back once that's done
+        if self.release is not None:
+            if dialog._root is not None:
+                dialog._root.after_idle(self.release, dialog)
+            else:
+                self.release(dialog)
+        for callback in self.callbacks:
+            callback(self)
+        self.callbacks = []
+
+    def done(self) -> bool:
+        """Check if the dialog was closed"""
+        return self.finished
+
+    def cancelled(self) -> bool:
+        """Check if the dialog was closed by cancel()"""
+        return self.was_cancelled
+
+    def wait(self, timeout: float = None) -> bool:
+        """
+        Wait until the dialog is closed, running the Tk event loop
+
+        Args:
+            timeout (float, optional): seconds to wait at most. Defaults to None, no limit.
+
+        Returns:
+            bool: True if the dialog was closed, False if the time ran out
+        """
+        if self.finished:
+            return True
+        dialog = self.dialog
+        widget = dialog._root or dialog.dialog
+        job = None
+        if timeout is not None:
+            # Writing the same value wakes wait_variable up without closing the window
+            job = widget.after(max(0, int(timeout * 1000)), lambda: dialog.closed.set(dialog.closed.get()))
+        widget.wait_variable(dialog.closed)
+        if job is not None:
+            widget.after_cancel(job)
+        return self.finished
+
+    def result(self, timeout: float = None):
+        """
+        Wait until the dialog is closed and return its result
+
+        Args:
+            timeout (float, optional): seconds to wait at most. Defaults to None, no limit.
+
+        Raises:
+            TimeoutError: the dialog is still open after timeout seconds
+            Exception: the error the function of the same dialog without show_ would have raised
+
+        Returns:
+            any: the result, as returned by the function of the same dialog without show_
+        """
+        if not self.wait(timeout):
+            raise TimeoutError("The dialog is still open")
+        if self.error is not None:
+            raise self.error
+        return self.value
+
+    def cancel(self) -> bool:
+        """
+        Close the dialog without an answer
+
+        Returns:
+            bool: True if the dialog was open, False if it was already closed
+        """
+        if self.finished:
+            return False
+        self.was_cancelled = True
+        self.dialog.close()
+        return True
+
+    def add_done_callback(self, callback) -> None:
+        """
+        Call a function with the handle when the dialog is closed, right away if it already is
+
+        Args:
+            callback (callable): function receiving the handle
+        """
+        if self.finished:
+            callback(self)
+        else:
+            self.callbacks.append(callback)
@@ -0,0 +1,103 @@
+import tkinter as tk
+import os
+
+IMAGES = os.path.join(os.path.dirname(__file__), "images")
+ICONS = ["alert", "error", "info", "question", "success"]
+
+# Image files of the custom icons, by name
+_files = {}
+# Decoded images, by interpreter and then by icon name
+_cache = {}
+
+
+def register(name: str, png: str, ico: str = None) -> None:
+    """
+    Register a custom icon that can be used by name in any dialog
+
+    Args:
+        name (str): icon name
+        png (str): path of the image shown in the window (png or gif)
+        ico (str, optional): path of the .ico used as window icon on Windows. Defaults to None.
+    """
+    _files[name] = (png, ico)
+    for images in _cache.values():
+        images.pop(name, None)
+
+
+def files(icon: str) -> tuple:
+    """
+    Find the image files of an icon
+
+    Args:
+        icon (str): icon name, or path of an image file
+
+    Returns:
+        tuple: path of the image and path of the .ico (None if there is none)
+    """
+    if icon in _files:
+        return _files[icon]
+    if os.path.splitext(icon)[1]:
+        return icon, None
+    imagepath = os.path.join(IMAGES, icon)
+    return imagepath + '.png', imagepath + '.ico'
+
+
+def image(master, icon: str) -> tk.PhotoImage:
+    """
+    Return the decoded image of an icon, reading it from disk only the first time for each interpreter
+
+    Args:
+        master (tk.Misc): any widget of the interpreter the image is used in
+        icon (str): icon name, or path of an image file
+
+    Returns:
+        tk.PhotoImage: the image
+    """
+    images = _cache.get(master.tk)
+    if images is None:
+        images = _cache[master.tk] = {}
+        root = master._root()
+        root.bind("<Destroy>", lambda event: release(root) if event.widget is root else None, add=True)
+    if icon not in images:
+        images[icon] = tk.PhotoImage(master=master, file=files(icon)[0])
+    return images[icon]
+
+
+def set_window_icon(window, icon: str) -> None:
+    """
+    Set the icon of a window, using the .ico on Windows and the cached image elsewhere
+
+    Args:
+        window (tk.Wm): window
+        icon (str): icon name, or path of an image file
+    """
+    ico = files(icon)[1]
+    if ico and window.tk.call('tk', 'windowingsystem') == 'win32':
+        window.iconbitmap(ico)
+    else:
+        window.iconphoto(False, image(window, icon))
+
+
+def preload(master=None, icons=None) -> None:
+    """
+    Decode icons ahead of time, so the first dialogs don't read them from disk
+
+    Args:
+        master (tk.Misc, optional): any widget of the interpreter. Defaults to the root used by the dialogs.
+        icons (list, optional): icon names. Defaults to the bundled icons and the registered ones.
+    """
+    if master is None:
+        from dialoger import engine
+        master = engine.get().find_root()
+    for icon in icons if icons is not None else ICONS + list(_files):
+        image(master, icon)
+
+
+def release(master) -> None:
+    """
+    Drop the cached images of an interpreter
+
+    Args:
+        master (tk.Misc): any widget of the interpreter
+    """
+    _cache.pop(master.tk, None)
@@ -1,11 +1,18 @@
 import tkinter as tk
-import os
+from dialoger import events, icons, keys, validators
+from dialoger.countdown import countdown
+from dialoger.field import field
+from dialoger.search import cached
+from dialoger.suggestlist import suggestlist
 
 class input:
 
     _instance = None
 
-    def __init__(self, title, question, answer_type="str", answer_default=None, pattern=None, allow_empty=True, allow_cancel=True, icon=None, entrance_width=35):
+    # Handlers of the keys pressed on the entry and the buttons, by keysym, see dialoger.keys
+    keys = {"Escape": "escape_pressed", "Return": "enter_pressed", "Tab": "tab_pressed", "Down": "suggestion_key", "Up": "suggestion_key"}
+
+    def __init__(self, title, question, answer_type="str", answer_default=None, pattern=None, allow_empty=True, allow_cancel=True, icon=None, entrance_width=35, master=None, keep=False, modal=True):
         """Initialize the class
 
         Args:
@@ -18,15 +25,52 @@ class input:
             allow_cancel (bool, optional): allow cancel. Defaults to True.
             icon (str, optional): icon. Defaults to None.
             entrance_width (int, optional): width of the entrance. Defaults to 35.
+            master (tk.Misc, optional): parent window. Defaults to the current root, if any.
+            keep (bool, optional): withdraw the window instead of destroying it when closed. Defaults to False.
+            modal (bool, optional): disable the parent window while the dialog is shown. Defaults to True.
         """
         if hasattr(self, 'initialized') and self.initialized:
             self.reinitialize(title, question, answer_type, answer_default, pattern, allow_empty, allow_cancel, icon)
             return
+        self.setup(master, keep, modal)
+        self.show(title, question, answer_type, answer_default, pattern, allow_empty, allow_cancel, icon, entrance_width)
+
+    @classmethod
+    def prebuilt(cls, master=None, keep=True, modal=True):
+        """
+        Build a withdrawn window that can be shown later with show()
+
+        Args:
+            master (tk.Misc, optional): parent window. Defaults to the current root, if any.
+            keep (bool, optional): withdraw the window instead of destroying it when closed. Defaults to True.
+            modal (bool, optional): disable the parent window while the dialog is shown. Defaults to True.
+
+        Returns:
+            input: the window, not shown yet
+        """
+        self = cls.__new__(cls)
+        self.setup(master, keep, modal)
+        return self
+
+    def setup(self, master=None, keep=False, modal=True):
+        """Initialize the state and build the window"""
         self.initialized = True
         self.answer = None
+        self.value = None
+        self.answer_type = "str"
+        self.pattern = None
+        self.allow_empty = True
+        self.field = field()
+        self.suggestions = None
+        self.suggestions_only = False
+        self.allow_cancel = True
         self.dialog = None
-        self._root = self.find_root()
-        self.create_window(title, question, answer_type, answer_default, pattern, allow_empty, allow_cancel, icon, entrance_width)
+        self.icon = None
+        self.title = None
+        self.keep = keep
+        self.modal = modal
+        self._root = master if master is not None else self.find_root()
+        self.build_window()
 
     def find_root(self):
         """Find or create the root window."""
@@ -52,246 +96,383 @@ class input:
             answer_default (_type_, optional): default answer. Defaults to None.
             allow_cancel (bool, optional): allow cancel. Defaults to True.
         """
+        self.build_window()
+        self.show(title, question, answer_type, answer_default, pattern, allow_empty, allow_cancel, icon, entrance_width)
+
+    def build_window(self):
+        """Create the window and the widgets that don't depend on the question"""
         # Create window
         if self._root:
             self.dialog = tk.Toplevel(self._root)
-            # Disable the main window
-            self._root.attributes('-disabled', True)
         else:
             self.dialog = tk.Tk()
 
         self.dialog.withdraw()
-        # Initialize variables
-        self.answer_type = answer_type
-        self.allow_empty = allow_empty
-        self.allow_cancel = allow_cancel
-        self.pattern = pattern
+        self.closed = tk.BooleanVar(self.dialog, value=True)
+        self.focus_jobs = []
+        self.timed_out = False
+        self.countdown = countdown(self.dialog)
 
         self.dialog.protocol("WM_DELETE_WINDOW", self.destroy_window)
-        self.dialog.title(title)
         self.dialog.resizable(False, False)
-        self.dialog.geometry("+400+250")
         self.dialog.attributes('-topmost', True)
+        self.dialog.bind("<Destroy>", self.window_destroyed, add=True)
+        self.dialog.bind("<FocusIn>", self.focused, add=True)
+        self.focus_seen = False
 
         # Message frame
         frm_label = tk.Frame(self.dialog, background="white")
-        # Set icon
-        if icon:
-            imagepath = os.path.join(os.path.dirname(__file__), "images", icon)
-            self.dialog.iconbitmap(imagepath + '.ico')
-            self.image = tk.PhotoImage(file=os.path.join(os.path.dirname(__file__), "images", icon + '.png'))
-            title_img = tk.Label(frm_label, image=self.image, background="white")
-            title_img.image = self.image
-            title_img.pack(side=tk.LEFT, anchor=tk.N, padx=(15, 3), pady=15)
-
-        wraplength = 400
-        title_msg = tk.Label(frm_label, text=question, background="white", justify=tk.LEFT, wraplength=wraplength)
-        title_msg.pack(side=tk.LEFT, padx=(3, 15), pady=15)
+        self.title_img = tk.Label(frm_label, background="white")
+        self.title_msg = tk.Label(frm_label, background="white", justify=tk.LEFT, wraplength=400)
         frm_label.pack(expand=True, fill=tk.BOTH)
 
         # Frame for the entry
-        frmEntry = tk.Frame(self.dialog, background="white", padx=30)
-        self.answer_entry = tk.Entry(frmEntry, validate="key", width=entrance_width)
-        if self.answer_type == "int":
-            self.answer_entry.config(validatecommand=(self.dialog.register(self.validate_int), '%P'))
-        elif self.answer_type == "alphanumeric":
-            self.answer_entry.config(validatecommand=(self.dialog.register(self.validate_alphanumeric), '%P'))
-        elif self.answer_type == "float":
-            self.answer_entry.config(validatecommand=(self.dialog.register(self.validate_float), '%P'))
-        elif self.answer_type == "password":
-            self.answer_entry.config(validatecommand=(self.dialog.register(self.validate_str), '%P'), show="*")
-        else:
-            self.answer_entry.config(validatecommand=(self.dialog.register(self.validate_str), '%P'))
-        self.answer_entry.bind("<Key>", self.key_pressed)
-        self.answer_entry.focus()
+        self.frm_entry = tk.Frame(self.dialog, background="white", padx=30)
+        self.answer_entry = tk.Entry(self.frm_entry)
+        validators.attach(self.answer_entry, self.validate)
+        keys.attach(self.answer_entry, self, 0)
+        self.answer_entry.bind('<KeyRelease>', self.format_input)
+        self.answer_entry.bind('<<Paste>>', lambda event: self.dialog.after_idle(self.format_input, event))
         self.answer_entry.pack(padx=10, pady=(5,15), ipady=3)
-        frmEntry.pack(expand=True, fill=tk.BOTH)
+        self.frm_entry.pack(expand=True, fill=tk.BOTH)
+        # Created on the first question with suggestions
+        self.suggest_list = None
 
         # Frame for the buttons
         frmButtons = tk.Frame(self.dialog)
         self.button = tk.Button(frmButtons, text="OK", command=self.set_answer)
-        self.button.bind("<Key>", self.key_pressed)
-        if not self.allow_empty:
-            self.button.config(state="disabled")
-        if answer_default is not None:
-            self.answer_entry.insert(0, answer_default)
-            self.answer_entry.select_range(0, tk.END) # Deixa o texto selecionado
+        keys.attach(self.button, self, 1)
         self.button.pack(side=tk.LEFT, padx=10, pady=10, ipadx=3)
-        if self.pattern is not None:
-            self.button.config(state="disabled")
-            if answer_default is not None:
-                self.button.config(state="normal")
-            self.answer_entry.bind('<KeyRelease>', self.format_input)
-        if self.allow_cancel:
-            self.buttonCancel = tk.Button(frmButtons, text="Cancel", command=self.destroy_window)
-            self.buttonCancel.pack(side=tk.LEFT, padx=10, pady=10, ipadx=3)
-            self.buttonCancel.bind("<Key>", self.key_pressed)
+        self.buttonCancel = tk.Button(frmButtons, text="Cancel", command=self.destroy_window)
+        keys.attach(self.buttonCancel, self, 2)
+        # Widgets Tab cycles through, by position
+        self.tab_order = (self.answer_entry, self.button)
         frmButtons.pack(expand=True)
+        if events.observers:
+            events.emit("created", self)
 
-        # Update layout and show the window
-        self.dialog.update_idletasks()
-
-        # Set focus on the window
-        self.dialog.after(10, lambda: [self.dialog.focus_force(), self.answer_entry.focus_set()])
-        self.dialog.after(300, lambda: [self.dialog.focus_force(), self.answer_entry.focus_set()])
-
-        # Start the window
-        self.dialog.deiconify() # Show the window
-        self.dialog.wait_window()
-
-    def format_input(self, event):
-        """Format the input according to the pattern"""
-        if event.keysym in ["Left", "Right", "Up", "Down", "Shift_L", "Shift_R", "Control_L", "Control_R"]:
-            return
-
-        input = ''.join([c for c in self.answer_entry.get() if c.isdigit()])
-        partial = ''
-        for char in self.pattern:
-            if char == '#':
-                if input:
-                    partial += input[0]
-                    input = input[1:]
-                else:
-                    partial += '#'
-            else:
-                partial += char
+    def configure_window(self, title, question, answer_type="str", answer_default=None, pattern=None, allow_empty=True, allow_cancel=True, icon=None, entrance_width=35, suggestions=None, suggestions_only=False):
+        """
+        Fill the window with a new question
 
-        # Replaces all # with empty
-        result = ''.join([c for c in partial if c != '#'])
+        Args:
+            title (str): window title
+            question (str): question to be asked
+            answer_type (str, optional): type of answer (int, float, alphanumeric, str). Defaults to "str".
+            answer_default (_type_, optional): default answer. Defaults to None.
+            pattern (str, optional): pattern for the answer. Defaults to None.
+            allow_empty (bool, optional): allow empty answer. Defaults to True.
+            allow_cancel (bool, optional): allow cancel. Defaults to True.
+            icon (str, optional): icon. Defaults to None.
+            entrance_width (int, optional): width of the entrance. Defaults to 35.
+            suggestions (iterable | callable, optional): answers suggested while typing, see dialoger.search.cached. Defaults to None.
+            suggestions_only (bool, optional): only accept one of the suggestions (or an empty answer, if allowed). Defaults to False.
+        """
+        # Initialize variables
+        self.answer_type = answer_type
+        self.allow_empty = allow_empty
+        self.allow_cancel = allow_cancel
+        self.pattern = pattern
+        self.field = field(answer_type, pattern, allow_empty)
+        self.suggestions = cached(suggestions) if suggestions is not None else None
+        self.suggestions_only = suggestions_only and self.suggestions is not None
 
-        # while the last character is not a number, remove the last character
-        while len(result) > 0 and not result[-1].isdigit():
-            result = result[:-1]
+        self.dialog.title(title)
+        self.title = title
+        self.dialog.geometry("+400+250")
 
-        # updates the entry's content with the formatted entry
+        # Set icon
+        self.title_img.pack_forget()
+        self.title_msg.pack_forget()
+        if icon:
+            if icon != self.icon:
+                icons.set_window_icon(self.dialog, icon)
+            self.image = icons.image(self.dialog, icon)
+            self.title_img.config(image=self.image)
+            self.title_img.pack(side=tk.LEFT, anchor=tk.N, padx=(15, 3), pady=15)
+        self.icon = icon
+        self.title_msg.config(text=question)
+        self.title_msg.pack(side=tk.LEFT, padx=(3, 15), pady=15)
+
+        # Entry
+        self.answer_entry.config(width=entrance_width, show=self.field.validator.show)
         self.answer_entry.delete(0, tk.END)
-        self.answer_entry.insert(0, result)
+        self.answer_entry.focus()
+        if answer_default is not None:
+            self.answer_entry.insert(0, answer_default)
+            self.answer_entry.select_range(0, tk.END) # Deixa o texto selecionado
 
-        if len(self.answer_entry.get()) != len(self.pattern):
-            self.button.config(state="disabled")
+        # Suggestions
+        if self.suggestions is not None:
+            if self.suggest_list is None:
+                self.suggest_list = suggestlist(self.frm_entry, self.answer_entry, self.update_button)
+                self.answer_entry.bind('<KeyRelease>', self.suggest_list.schedule, add=True)
+            self.suggest_list.load(self.suggestions)
+        elif self.suggest_list is not None:
+            self.suggest_list.stop()
+
+        # Buttons
+        self.update_button()
+        if self.allow_cancel:
+            self.buttonCancel.pack(side=tk.LEFT, padx=10, pady=10, ipadx=3)
         else:
-            self.button.config(state="normal")
+            self.buttonCancel.pack_forget()
 
-    def validate_int(self, value):
+    def show(self, title, question, answer_type="str", answer_default=None, pattern=None, allow_empty=True, allow_cancel=True, icon=None, entrance_width=35, wait=True, timeout=None, suggestions=None, suggestions_only=False):
         """
-        Validate if the value is an integer
+        Show the window with a new question and wait for the answer
 
         Args:
-            value (str): value to be validated
+            title (str): window title
+            question (str): question to be asked
+            answer_type (str, optional): type of answer (int, float, alphanumeric, str). Defaults to "str".
+            answer_default (_type_, optional): default answer. Defaults to None.
+            pattern (str, optional): pattern for the answer. Defaults to None.
+            allow_empty (bool, optional): allow empty answer. Defaults to True.
+            allow_cancel (bool, optional): allow cancel. Defaults to True.
+            icon (str, optional): icon. Defaults to None.
+            entrance_width (int, optional): width of the entrance. Defaults to 35.
+            wait (bool, optional): wait until the window is closed. Defaults to True.
+            timeout (float, optional): seconds before the window closes by itself, setting timed_out. Defaults to None, no limit.
+            suggestions (iterable | callable, optional): answers suggested while typing. Defaults to None.
+            suggestions_only (bool, optional): only accept one of the suggestions. Defaults to False.
 
         Returns:
-            bool: True if the value is an integer, False otherwise
+            str: answer, None if not waiting
         """
-        if value.isdigit() or value == "":
-            self.button.config(state="normal")
-            return True
-        else:
-            return False
+        self.answer = None
+        self.value = None
+        self.configure_window(title, question, answer_type, answer_default, pattern, allow_empty, allow_cancel, icon, entrance_width, suggestions, suggestions_only)
+        self.show_window(wait, timeout)
+        return self.answer
 
-    def validate_alphanumeric(self, value):
+    def show_window(self, wait=True, timeout=None):
         """
-        Validate if the value is alphanumeric
+        Show the window
 
         Args:
-            value (str): value to be validated
-
-        Returns:
-            bool: True if the value is alphanumeric, False otherwise
+            wait (bool, optional): wait until the window is closed. Defaults to True.
+            timeout (float, optional): seconds before the window closes by itself. Defaults to None, no limit.
         """
-        if value.isalnum() or value == "":
-            self.button.config(state="normal")
-            return True
+        if self._root and self.modal:
+            # Disable the main window
+            self._root.attributes('-disabled', True)
+
+        if events.observers:
+            events.emit("shown", self)
+
+        # Update layout and show the window
+        self.dialog.update_idletasks()
+
+        # Set focus on the window
+        self.focus_jobs = [self.dialog.after(delay, self.focus_entry) for delay in (10, 300)]
+
+        # Close by itself when the time runs out, showing the seconds left
+        self.timed_out = False
+        if timeout:
+            self.countdown.label.pack(pady=(0, 5))
+            self.countdown.start(timeout, self.expire)
         else:
-            return False
+            self.countdown.label.pack_forget()
+
+        # Start the window
+        self.focus_seen = False
+        self.closed.set(False)
+        self.dialog.deiconify() # Show the window
+        if wait:
+            self.dialog.wait_variable(self.closed)
+
+    def focus_entry(self):
+        """Bring the window to the front and focus the entry"""
+        if self.dialog and not self.closed.get():
+            self.dialog.focus_force()
+            self.answer_entry.focus_set()
+
+    def focused(self, event):
+        """Emit the focused event the first time the window gets the focus after being shown"""
+        if not self.focus_seen and not self.closed.get():
+            self.focus_seen = True
+            if events.observers:
+                events.emit("focused", self)
+
+    def format_input(self, event):
+        """Format the input according to the pattern, keeping the caret after the same typed characters"""
+        if self.field.mask is None or self.dialog is None:
+            return
+        if event.keysym in ["Left", "Right", "Up", "Down", "Shift_L", "Shift_R", "Control_L", "Control_R"]:
+            return
+        self.update_button(self.field.format(self.answer_entry))
 
-    def validate_float(self, value):
+    def validate(self, value):
         """
-        Validate if the value is a float
+        Validate a keystroke with the validator of the current answer type
 
         Args:
-            value (str): value to be validated
+            value (str): value the entry would have after the keystroke
 
         Returns:
-            bool: True if the value is a float, False otherwise
+            bool: True if the keystroke is accepted, False otherwise
         """
-        if value.replace(".", "").isdigit() or value == "":
-            self.button.config(state="normal")
+        if self.field.accepts(value):
+            self.update_button(value)
             return True
+        if events.observers:
+            events.emit("invalid", self)
+        return False
+
+    def update_button(self, value=None):
+        """Enable the OK button only when the answer can be submitted"""
+        if self.validate_answer(value):
+            self.button.config(state="normal")
         else:
-            return False
+            self.button.config(state="disabled")
 
-    def validate_str(self, value):
+    def suggestion_key(self, event, index):
         """
-        Validate if the value is a string
+        Let the open list of suggestions use the keys moving in it
 
         Args:
-            value (str): value to be validated
+            event (event): key press event
+            index (int): position of the widget: 0 for the entry, 1 for OK and 2 for Cancel
 
         Returns:
-            bool: True if the value is a string, False otherwise
+            str: "break" if the key was used by the list, None otherwise
         """
-        self.button.config(state="normal")
-        return True
+        if self.suggest_list is not None and index == 0:
+            return self.suggest_list.key(event)
+        return None
+
+    def escape_pressed(self, event, index):
+        """Cancel, if allowed, unless the key closes the list of suggestions"""
+        if self.suggestion_key(event, index):
+            return "break"
+        if self.allow_cancel:
+            self.destroy_window()
 
-    def key_pressed(self, event):
+    def enter_pressed(self, event, index):
+        """Confirm the answer, unless the key picks a suggestion"""
+        if self.suggestion_key(event, index):
+            return "break"
+        self.set_answer()
+
+    def tab_pressed(self, event, index):
+        """Cycle through the entry and OK, backwards with Shift, unless the key picks a suggestion"""
+        if self.suggestion_key(event, index):
+            return "break"
+        step = -1 if event.keysym == "ISO_Left_Tab" or event.state & 0x1 else 1
+        self.tab_order[(min(index, len(self.tab_order) - 1) + step) % len(self.tab_order)].focus_set()
+        return "break"  # Prevent default behavior
+
+    def validate_answer(self, value=None):
         """
-        Handles keystrokes in the window for UI updates
+        Validate the answer
 
         Args:
-            event (event): key press event
-        """
-        # Escape
-        if event.keycode == 27:
-            if self.allow_cancel:
-                self.destroy_window()
-        # Enter
-        elif event.keycode == 13:
-            if self.validate_answer():
-                self.set_answer()
-        # Tab, cycle through buttons
-        elif event.keycode == 9:
-            widgets = [self.answer_entry, self.button]
-            current_index = widgets.index(event.widget)
-            next_index = (current_index + 1) % len(widgets)
-            widgets[next_index].focus_set()
-            return "break"  # Prevent default behavior
-        else:
-            pass
-
-    def validate_answer(self):
-        """
-        Validate the answer
+            value (str, optional): answer to validate. Defaults to the text of the entry.
 
         Returns:
             bool: True if the answer is valid, False otherwise
         """
-        if not self.allow_empty and self.answer_entry.get() == "":
+        if value is None:
+            value = self.answer_entry.get()
+        if self.suggestions_only and value != "" and value not in self.suggestions:
             return False
-        if self.answer_type == "int" and not self.answer_entry.get().isdigit():
-            return False
-        if self.answer_type == "alphanumeric" and not self.answer_entry.get().isalnum():
-            return False
-        if self.answer_type == "float" and not self.answer_entry.get().replace(".", "").isdigit():
-            return False
-        if self.pattern is not None:
-            if len(self.answer_entry.get()) != len(self.pattern):
-                return False
-        return True
+        return self.field.valid(value)
 
     def destroy_window(self):
-        """Destroy the window and re-enable the root"""
+        """Destroy (or withdraw, if kept) the window and re-enable the root"""
         if self.dialog:
-            self.dialog.destroy()
-            self.dialog = None
+            self.cancel_jobs()
+            if events.observers and not self.closed.get():
+                events.emit("cancelled" if self.answer is None else "answered", self)
+            self.closed.set(True)
+            if self.keep:
+                self.dialog.withdraw()
+            else:
+                self.dispose()
         input._instance = None
-        if self._root:
+        if self._root and self.modal:
             self._root.attributes('-disabled', False)
             self._root.focus_force()
 
+    def window_destroyed(self, event):
+        """Stop waiting if the window is destroyed from outside"""
+        if event.widget is self.dialog:
+            validators.detach(self.answer_entry)
+            if events.observers:
+                if not self.closed.get():
+                    events.emit("cancelled", self)
+                events.emit("destroyed", self)
+            self.closed.set(True)
+
+    def alive(self):
+        """Check if the window still exists and can be shown again"""
+        try:
+            return self.dialog is not None and bool(self.dialog.winfo_exists())
+        except tk.TclError:
+            return False
+
+    def cancel_jobs(self):
+        """Cancel the pending focus timers, the countdown and the refresh of the suggestions"""
+        if self.dialog is not None:
+            for job in self.focus_jobs:
+                try:
+                    self.dialog.after_cancel(job)
+                except tk.TclError:
+                    pass
+            for helper in (self.countdown, self.suggest_list):
+                if helper is not None:
+                    try:
+                        helper.stop()
+                    except tk.TclError:
+                        pass
+        self.focus_jobs = []
+
+    def dispose(self):
+        """
+        Destroy the window for good and drop every reference to it
+
+        Destroying the window deletes the Tcl commands of its bindings, buttons and protocol handler. Pending
+        timers are cancelled and the icon image is released, so nothing is left behind in the interpreter.
+        """
+        self.cancel_jobs()
+        if self.answer_entry is not None:
+            validators.detach(self.answer_entry)
+        if self.alive():
+            self.title_img.config(image="")
+            self.dialog.destroy()
+        self.dialog = None
+        self.image = None
+        self.title_img = None
+        self.title_msg = None
+        self.answer_entry = None
+        self.button = None
+        self.buttonCancel = None
+        self.tab_order = ()
+        self.countdown = None
+        self.suggest_list = None
+        self.frm_entry = None
+
+    def close(self):
+        """Close the window without an answer"""
+        self.answer = None
+        self.value = None
+        self.destroy_window()
+
+    def expire(self):
+        """Close the window without an answer when the time runs out"""
+        self.timed_out = True
+        if events.observers:
+            events.emit("timeout", self)
+        self.close()
+
     def set_answer(self):
         """
         Set the answer and close the window
         """
         if self.validate_answer():
             self.answer = self.answer_entry.get()
+            self.value = self.field.parse(self.answer)
             self.destroy_window()
+        elif events.observers:
+            events.emit("invalid", self)
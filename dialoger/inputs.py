@@ -0,0 +1,403 @@
+import tkinter as tk
+from dialoger import events, icons, keys, validators
+from dialoger.countdown import countdown
+from dialoger.field import FIELD, field
+
+class inputs:
+    """Window with several inputs, collecting all the answers at once"""
+
+    _instance = None
+
+    # Handlers of the keys pressed on the entries, by keysym, see dialoger.keys
+    keys = {"Return": "enter_pressed"}
+
+    def __init__(self, title, fields, message=None, allow_cancel=True, icon=None, entrance_width=35, master=None, keep=False, modal=True):
+        """Initialize the class
+
+        Args:
+            title (str): window title
+            fields (list): field specs, dicts with the keys of FIELD (only question is required) or questions as strings
+            message (str, optional): message shown above the fields. Defaults to None.
+            allow_cancel (bool, optional): allow cancel. Defaults to True.
+            icon (str, optional): icon. Defaults to None.
+            entrance_width (int, optional): width of the entrances. Defaults to 35.
+            master (tk.Misc, optional): parent window. Defaults to the current root, if any.
+            keep (bool, optional): withdraw the window instead of destroying it when closed. Defaults to False.
+            modal (bool, optional): disable the parent window while the dialog is shown. Defaults to True.
+        """
+        self.setup(master, keep, modal)
+        self.show(title, fields, message, allow_cancel, icon, entrance_width)
+
+    @classmethod
+    def prebuilt(cls, master=None, keep=True, modal=True):
+        """
+        Build a withdrawn window that can be shown later with show()
+
+        Args:
+            master (tk.Misc, optional): parent window. Defaults to the current root, if any.
+            keep (bool, optional): withdraw the window instead of destroying it when closed. Defaults to True.
+            modal (bool, optional): disable the parent window while the dialog is shown. Defaults to True.
+
+        Returns:
+            inputs: the window, not shown yet
+        """
+        self = cls.__new__(cls)
+        self.setup(master, keep, modal)
+        return self
+
+    def setup(self, master=None, keep=False, modal=True):
+        """Initialize the state and build the window"""
+        self.answers = None
+        self.specs = []
+        self.fields = []
+        self.allow_cancel = True
+        self.dialog = None
+        self.icon = None
+        self.title = None
+        self.keep = keep
+        self.modal = modal
+        self._root = master if master is not None else self.find_root()
+        self.build_window()
+
+    def find_root(self):
+        """Find or create the root window."""
+        if tk._default_root:
+            return tk._default_root
+        else:
+            return None
+
+    def build_window(self):
+        """Create the window and the widgets that don't depend on the fields"""
+        # Create window
+        if self._root:
+            self.dialog = tk.Toplevel(self._root)
+        else:
+            self.dialog = tk.Tk()
+
+        self.dialog.withdraw()
+        self.closed = tk.BooleanVar(self.dialog, value=True)
+        self.focus_jobs = []
+        self.timed_out = False
+        self.countdown = countdown(self.dialog)
+
+        self.dialog.protocol("WM_DELETE_WINDOW", self.close)
+        self.dialog.resizable(False, False)
+        self.dialog.attributes('-topmost', True)
+        self.dialog.bind("<Escape>", lambda event: self.close() if self.allow_cancel else None)
+        self.dialog.bind("<Destroy>", self.window_destroyed, add=True)
+        self.dialog.bind("<FocusIn>", self.focused, add=True)
+        self.focus_seen = False
+
+        # Message frame
+        self.frm_label = tk.Frame(self.dialog, background="white")
+        self.title_img = tk.Label(self.frm_label, background="white")
+        self.title_msg = tk.Label(self.frm_label, background="white", justify=tk.LEFT, wraplength=400)
+
+        # Frame for the entries, one row per field
+        self.frmEntries = tk.Frame(self.dialog, background="white", padx=30, pady=10)
+        self.frmEntries.pack(expand=True, fill=tk.BOTH)
+        self.rows = []
+
+        # Frame for the buttons
+        frmButtons = tk.Frame(self.dialog)
+        self.button = tk.Button(frmButtons, text="OK", command=self.set_answer)
+        self.button.pack(side=tk.LEFT, padx=10, pady=10, ipadx=3)
+        self.buttonCancel = tk.Button(frmButtons, text="Cancel", command=self.close)
+        frmButtons.pack(expand=True)
+        if events.observers:
+            events.emit("created", self)
+
+    def add_row(self):
+        """Create one more label and entry, bound to the field at their position"""
+        index = len(self.rows)
+        label = tk.Label(self.frmEntries, background="white", justify=tk.LEFT, anchor=tk.W)
+        entry = tk.Entry(self.frmEntries)
+        validators.attach(entry, lambda value: self.validate(index, value))
+        entry.bind('<KeyRelease>', lambda event: self.format_input(index, event))
+        keys.attach(entry, self, index)
+        self.rows.append((label, entry))
+
+    def configure_window(self, title, fields, message=None, allow_cancel=True, icon=None, entrance_width=35):
+        """
+        Fill the window with new fields
+
+        Args:
+            title (str): window title
+            fields (list): field specs, dicts with the keys of FIELD (only question is required) or questions as strings
+            message (str, optional): message shown above the fields. Defaults to None.
+            allow_cancel (bool, optional): allow cancel. Defaults to True.
+            icon (str, optional): icon. Defaults to None.
+            entrance_width (int, optional): width of the entrances. Defaults to 35.
+        """
+        self.specs = []
+        for spec in fields:
+            spec = {"question": spec} if isinstance(spec, str) else spec
+            assert set(spec) <= set(FIELD), f"Unknown field options: {', '.join(set(spec) - set(FIELD))}"
+            spec = dict(FIELD, **spec)
+            if spec["name"] is None:
+                spec["name"] = spec["question"]
+            self.specs.append(spec)
+        assert self.specs, "The list of fields must not be empty."
+        self.fields = [field(spec["answer_type"], spec["pattern"], spec["allow_empty"]) for spec in self.specs]
+        self.allow_cancel = allow_cancel
+
+        self.dialog.title(title)
+        self.title = title
+        self.dialog.geometry("+400+250")
+
+        # Message and icon
+        self.frm_label.pack_forget()
+        self.title_img.pack_forget()
+        self.title_msg.pack_forget()
+        if icon:
+            if icon != self.icon:
+                icons.set_window_icon(self.dialog, icon)
+            self.image = icons.image(self.dialog, icon)
+            self.title_img.config(image=self.image)
+            self.title_img.pack(side=tk.LEFT, anchor=tk.N, padx=(15, 3), pady=15)
+        self.icon = icon
+        if message:
+            self.title_msg.config(text=message)
+            self.title_msg.pack(side=tk.LEFT, padx=(3, 15), pady=15)
+        if icon or message:
+            self.frm_label.pack(expand=True, fill=tk.BOTH, before=self.frmEntries)
+
+        # Entries, reusing the rows created for previous forms
+        while len(self.rows) < len(self.specs):
+            self.add_row()
+        for label, entry in self.rows[len(self.specs):]:
+            label.grid_remove()
+            entry.grid_remove()
+        for row, (spec, rules) in enumerate(zip(self.specs, self.fields)):
+            label, entry = self.rows[row]
+            label.config(text=spec["question"])
+            label.grid(row=row, column=0, sticky=tk.W, padx=(0, 10), pady=4)
+            entry.config(width=entrance_width, show=rules.validator.show)
+            entry.delete(0, tk.END)
+            if spec["answer_default"] is not None:
+                entry.insert(0, spec["answer_default"])
+            entry.grid(row=row, column=1, pady=4, ipady=3)
+
+        # Buttons
+        self.update_button()
+        if self.allow_cancel:
+            self.buttonCancel.pack(side=tk.LEFT, padx=10, pady=10, ipadx=3)
+        else:
+            self.buttonCancel.pack_forget()
+
+    def show(self, title, fields, message=None, allow_cancel=True, icon=None, entrance_width=35, wait=True, timeout=None):
+        """
+        Show the window with new fields and wait for the answers
+
+        Args:
+            title (str): window title
+            fields (list): field specs, dicts with the keys of FIELD (only question is required) or questions as strings
+            message (str, optional): message shown above the fields. Defaults to None.
+            allow_cancel (bool, optional): allow cancel. Defaults to True.
+            icon (str, optional): icon. Defaults to None.
+            entrance_width (int, optional): width of the entrances. Defaults to 35.
+            wait (bool, optional): wait until the window is closed. Defaults to True.
+            timeout (float, optional): seconds before the window closes by itself, setting timed_out. Defaults to None, no limit.
+
+        Returns:
+            dict: answers by field name, None if cancelled or not waiting
+        """
+        self.answers = None
+        self.configure_window(title, fields, message, allow_cancel, icon, entrance_width)
+        self.show_window(wait, timeout)
+        return self.answers
+
+    def show_window(self, wait=True, timeout=None):
+        """
+        Show the window
+
+        Args:
+            wait (bool, optional): wait until the window is closed. Defaults to True.
+            timeout (float, optional): seconds before the window closes by itself. Defaults to None, no limit.
+        """
+        if self._root and self.modal:
+            # Disable the main window
+            self._root.attributes('-disabled', True)
+
+        if events.observers:
+            events.emit("shown", self)
+
+        # Update layout and show the window
+        self.dialog.update_idletasks()
+
+        # Set focus on the window
+        self.focus_jobs = [self.dialog.after(delay, self.focus_first) for delay in (10, 300)]
+
+        # Start the window
+        # Close by itself when the time runs out, showing the seconds left
+        self.timed_out = False
+        if timeout:
+            self.countdown.label.pack(pady=(0, 5))
+            self.countdown.start(timeout, self.expire)
+        else:
+            self.countdown.label.pack_forget()
+
+        self.focus_seen = False
+        self.closed.set(False)
+        self.dialog.deiconify()
+        if wait:
+            self.dialog.wait_variable(self.closed)
+
+    def focus_first(self):
+        """Bring the window to the front and focus the first entry"""
+        if self.dialog and not self.closed.get():
+            self.dialog.focus_force()
+            self.rows[0][1].focus_set()
+
+    def focused(self, event):
+        """Emit the focused event the first time the window gets the focus after being shown"""
+        if not self.focus_seen and not self.closed.get():
+            self.focus_seen = True
+            if events.observers:
+                events.emit("focused", self)
+
+    def format_input(self, index, event):
+        """Format the input of a field according to its pattern"""
+        if self.fields[index].mask is None or self.dialog is None:
+            return
+        if event.keysym in ["Left", "Right", "Up", "Down", "Shift_L", "Shift_R", "Control_L", "Control_R", "Tab", "ISO_Left_Tab"]:
+            return
+        self.fields[index].format(self.rows[index][1])
+        self.update_button()
+
+    def validate(self, index, value):
+        """
+        Validate a keystroke in one of the fields
+
+        Args:
+            index (int): position of the field
+            value (str): value the entry would have after the keystroke
+
+        Returns:
+            bool: True if the keystroke is accepted, False otherwise
+        """
+        if self.fields[index].accepts(value):
+            self.update_button(index, value)
+            return True
+        if events.observers:
+            events.emit("invalid", self, field=self.specs[index]["name"])
+        return False
+
+    def update_button(self, index=None, value=None):
+        """Enable the OK button only when every answer can be submitted"""
+        if self.validate_answers(index, value):
+            self.button.config(state="normal")
+        else:
+            self.button.config(state="disabled")
+
+    def validate_answers(self, index=None, value=None):
+        """
+        Validate the answers
+
+        Args:
+            index (int, optional): position of a field whose answer is about to change. Defaults to None.
+            value (str, optional): new answer of that field. Defaults to None.
+
+        Returns:
+            bool: True if every answer is valid, False otherwise
+        """
+        for row, rules in enumerate(self.fields):
+            text = value if row == index else self.rows[row][1].get()
+            if not rules.valid(text):
+                return False
+        return True
+
+    def set_answer(self):
+        """
+        Set the answers and close the window
+        """
+        if self.validate_answers():
+            self.answers = {}
+            for spec, rules, (label, entry) in zip(self.specs, self.fields, self.rows):
+                text = entry.get()
+                self.answers[spec["name"]] = rules.parse(text) if spec["typed"] else text
+            self.destroy_window()
+        elif events.observers:
+            events.emit("invalid", self)
+
+    def enter_pressed(self, event, index):
+        """Confirm the answers from any entry"""
+        self.set_answer()
+        return "break"
+
+    def close(self):
+        """Close the window without answers"""
+        self.answers = None
+        self.destroy_window()
+
+    def expire(self):
+        """Close the window without an answer when the time runs out"""
+        self.timed_out = True
+        if events.observers:
+            events.emit("timeout", self)
+        self.close()
+
+    def destroy_window(self):
+        """Destroy (or withdraw, if kept) the window and re-enable the root"""
+        if self.dialog:
+            self.cancel_jobs()
+            if events.observers and not self.closed.get():
+                events.emit("cancelled" if self.answers is None else "answered", self)
+            self.closed.set(True)
+            if self.keep:
+                self.dialog.withdraw()
+            else:
+                self.dispose()
+        if self._root and self.modal:
+            self._root.attributes('-disabled', False)
+            self._root.focus_force()
+
+    def window_destroyed(self, event):
+        """Stop waiting if the window is destroyed from outside"""
+        if event.widget is self.dialog:
+            for label, entry in self.rows:
+                validators.detach(entry)
+            if events.observers:
+                if not self.closed.get():
+                    events.emit("cancelled", self)
+                events.emit("destroyed", self)
+            self.closed.set(True)
+
+    def alive(self):
+        """Check if the window still exists and can be shown again"""
+        try:
+            return self.dialog is not None and bool(self.dialog.winfo_exists())
+        except tk.TclError:
+            return False
+
+    def cancel_jobs(self):
+        """Cancel the pending focus timers and the countdown"""
+        if self.dialog is not None:
+            for job in self.focus_jobs:
+                try:
+                    self.dialog.after_cancel(job)
+                except tk.TclError:
+                    pass
+            if self.countdown is not None:
+                try:
+                    self.countdown.stop()
+                except tk.TclError:
+                    pass
+        self.focus_jobs = []
+
+    def dispose(self):
+        """Destroy the window for good and drop every reference to it"""
+        self.cancel_jobs()
+        for label, entry in self.rows:
+            validators.detach(entry)
+        if self.alive():
+            self.title_img.config(image="")
+            self.dialog.destroy()
+        self.dialog = None
+        self.image = None
+        self.title_img = None
+        self.title_msg = None
+        self.rows = []
+        self.button = None
+        self.buttonCancel = None
+        self.countdown = None
@@ -0,0 +1,74 @@
+import tkinter as tk
+
+# Bind tag shared by the widgets of every dialog, bound once per interpreter
+TAG = "Dialoger"
+
+# Keys handled like another one when a dialog doesn't map them itself
+ALIASES = {"KP_Enter": "Return", "ISO_Left_Tab": "Tab"}
+
+# Dialog and position of the attached widgets, by interpreter and widget path
+_widgets = {}
+
+
+def attach(widget, owner, index: int = 0) -> None:
+    """
+    Route the keys pressed in a widget to its dialog, through one binding shared by all widgets
+
+    The widget gets the shared bind tag before its class tag, so a handler returning "break" replaces the
+    default behavior of the key. The dialog maps keysyms to the names of its handlers in its `keys` attribute,
+    see action(); a handler receives the event and the position of the widget in the dialog.
+
+    Args:
+        widget (tk.Widget): widget receiving the keys
+        owner (object): dialog with a `keys` dictionary of keysym: method name
+        index (int, optional): position of the widget, given to the handler. Defaults to 0.
+    """
+    if not widget.tk.call('bind', TAG, '<Key>'):
+        app = widget.tk
+        widget.bind_class(TAG, '<Key>', lambda event: _dispatch(app, event))
+        widget.bind_class(TAG, '<Destroy>', lambda event: _widgets.pop((app, str(event.widget)), None))
+    _widgets[(widget.tk, str(widget))] = (owner, index)
+    tags = widget.bindtags()
+    if TAG not in tags:
+        widget.bindtags(tags[:1] + (TAG,) + tags[1:])
+
+
+def action(owner, keysym: str) -> str:
+    """
+    Find the handler of a key in a dialog
+
+    Args:
+        owner (object): dialog, or dialog class, with a `keys` dictionary of keysym: method name
+        keysym (str): name of the key, such as Return or KP_Enter, the same on every platform
+
+    Returns:
+        str: name of the method handling the key, None if the dialog doesn't handle it
+    """
+    handler = owner.keys.get(keysym)
+    if handler is None and keysym in ALIASES:
+        handler = owner.keys.get(ALIASES[keysym])
+    return handler
+
+
+def _dispatch(app, event):
+    """Run the handler of the key in the dialog of the widget"""
+    attached = _widgets.get((app, str(event.widget)))
+    if attached is None:
+        return None
+    owner, index = attached
+    handler = action(owner, event.keysym)
+    return getattr(owner, handler)(event, index) if handler else None
+
+
+def detach(widget) -> None:
+    """
+    Stop routing the keys of a widget, which is done when it is destroyed
+
+    Args:
+        widget (tk.Widget): widget
+    """
+    _widgets.pop((widget.tk, str(widget)), None)
+    try:
+        widget.bindtags(tuple(tag for tag in widget.bindtags() if tag != TAG))
+    except tk.TclError:
+        pass
@@ -0,0 +1,127 @@
+import functools
+
+# Placeholders accepted in patterns, with the test each character typed in their place must pass
+PLACEHOLDERS = {
+    '#': str.isdigit,
+    '@': str.isalpha,
+    '*': str.isalnum,
+}
+ESCAPE = '\\'
+
+
+class mask:
+    """
+    Input pattern compiled once, such as ###.###.###-## or ##/##/####
+
+    Placeholders are # (digit), @ (letter) and * (letter or digit). Any other character is a literal that is
+    inserted automatically; a placeholder character preceded by a backslash is a literal too, and so is a
+    backslash preceded by another. Before version 1.3.0, @ and * were literals: such patterns must escape them.
+    """
+
+    def __init__(self, pattern: str):
+        """Initialize the class
+
+        Args:
+            pattern (str): pattern to compile
+        """
+        self.pattern = pattern
+        # For each position, the test of a placeholder or None for a literal
+        self.tests = []
+        self.literals = []
+        escaped = False
+        for char in pattern:
+            if char == ESCAPE and not escaped:
+                escaped = True
+                continue
+            test = None if escaped else PLACEHOLDERS.get(char)
+            self.tests.append(test)
+            self.literals.append(None if test else char)
+            escaped = False
+        self.length = len(self.tests)
+
+    @classmethod
+    @functools.lru_cache(maxsize=64)
+    def compile(cls, pattern: str):
+        """
+        Compile a pattern, reusing the mask of patterns compiled before
+
+        Args:
+            pattern (str): pattern to compile
+
+        Returns:
+            mask: compiled pattern
+        """
+        return cls(pattern)
+
+    def apply(self, text: str, caret: int = None) -> tuple:
+        """
+        Format a text according to the pattern in one pass
+
+        Characters that don't fit their placeholder are dropped, literals are inserted where they belong and
+        trailing literals are removed. Reading stops as soon as the pattern is full, so pasting a long text
+        costs no more than the pattern length.
+
+        Args:
+            text (str): text typed by the user
+            caret (int, optional): caret position in the text. Defaults to the end of the text.
+
+        Returns:
+            tuple: formatted text and caret position in it, after the same typed characters
+        """
+        if caret is None:
+            caret = len(text)
+        result = []
+        new_caret = 0
+        position = 0
+        for index, char in enumerate(text):
+            if position == self.length:
+                break
+            # Insert the literals in front of the next placeholder, the typed character may be one of them
+            kept = False
+            while position < self.length and self.tests[position] is None:
+                result.append(self.literals[position])
+                position += 1
+                if result[-1] == char:
+                    kept = True
+                    break
+            if not kept and position < self.length and self.tests[position](char):
+                result.append(char)
+                position += 1
+                kept = True
+            if kept and index < caret:
+                new_caret = len(result)
+
+        # Remove the literals left after the last typed character
+        end = len(result)
+        while end > 0 and self.tests[end - 1] is None:
+            end -= 1
+        return ''.join(result[:end]), min(new_caret, end)
+
+    def format(self, text: str) -> str:
+        """
+        Format a text according to the pattern
+
+        Args:
+            text (str): text typed by the user
+
+        Returns:
+            str: formatted text
+        """
+        return self.apply(text)[0]
+
+    def complete(self, text: str) -> bool:
+        """
+        Check if a text fills the whole pattern
+
+        Args:
+            text (str): formatted text
+
+        Returns:
+            bool: True if every position of the pattern is filled, False otherwise
+        """
+        if len(text) != self.length:
+            return False
+        for char, test, literal in zip(text, self.tests, self.literals):
+            if not (test(char) if test else char == literal):
+                return False
+        return True
@@ -0,0 +1,224 @@
+import collections
+import re
+import threading
+import time
+import tkinter as tk
+
+from dialoger import dispatcher, icons, options
+
+class toast:
+    """Small borderless window in a corner of the screen, closed by a click or after a while"""
+
+    def __init__(self, master, title, message, icon, slot, duration, on_close):
+        """Initialize the class
+
+        Args:
+            master (tk.Misc): root window
+            title (str): title
+            message (str): message
+            icon (str): icon
+            slot (int): position in the stack of toasts, from the bottom of the screen
+            duration (float): seconds before it closes by itself
+            on_close (callable): function called when it is closed
+        """
+        self.on_close = on_close
+        self.window = tk.Toplevel(master, background="white", borderwidth=1, relief=tk.SOLID)
+        self.window.overrideredirect(True)
+        self.window.attributes('-topmost', True)
+        self.image = icons.image(self.window, icon)
+        tk.Label(self.window, image=self.image, background="white").pack(side=tk.LEFT, anchor=tk.N, padx=10, pady=10)
+        tk.Label(self.window, text=title, background="white", anchor=tk.W).pack(fill=tk.X, padx=(0, 10), pady=(10, 0))
+        self.label = tk.Label(self.window, text=message, background="white", justify=tk.LEFT, anchor=tk.W, wraplength=300)
+        self.label.pack(fill=tk.X, padx=(0, 10), pady=(0, 10))
+        for widget in [self.window, *self.window.winfo_children()]:
+            widget.bind("<Button-1>", lambda event: self.close())
+
+        self.window.update_idletasks()
+        x = self.window.winfo_screenwidth() - self.window.winfo_reqwidth() - 20
+        y = self.window.winfo_screenheight() - (self.window.winfo_reqheight() + 10) * (slot + 1) - 40
+        self.window.geometry(f"+{x}+{y}")
+        self.job = self.window.after(int(duration * 1000), self.close)
+
+    def update(self, message):
+        """Change the message"""
+        self.label.config(text=message)
+
+    def close(self):
+        """Close the toast"""
+        if self.window is None:
+            return
+        self.window.after_cancel(self.job)
+        self.window.destroy()
+        self.window = None
+        self.image = None
+        self.on_close()
+
+
+class window:
+    """Notification shown in an options window, whose message can be updated while it is open"""
+
+    def __init__(self, handle):
+        """Initialize the class
+
+        Args:
+            handle (handle): handle of the window
+        """
+        self.handle = handle
+        self.dialog = handle.dialog
+
+    def update(self, message):
+        """Change the message, if the window is still open"""
+        if not self.handle.done() and self.dialog.title_msg is not None:
+            self.dialog.title_msg.config(text=message)
+
+
+class notifier:
+    """
+    Shows notifications sent from any thread without blocking it
+
+    Notifications that are alike (same icon and title, same message apart from numbers) are merged into one
+    window with a count, even after the window was shown. At most `limit` windows are opened every `interval`
+    seconds, the other notifications wait, merged, for their turn.
+    """
+
+    _instance = None
+
+    def __init__(self, limit=3, interval=5.0, toast=False, duration=5.0, dispatcher=None):
+        """Initialize the class
+
+        Args:
+            limit (int, optional): windows opened at most every interval. Defaults to 3.
+            interval (float, optional): seconds of the rate limit. Defaults to 5.0.
+            toast (bool, optional): show toasts that close by themselves instead of windows with an OK button. Defaults to False.
+            duration (float, optional): seconds a toast stays on screen. Defaults to 5.0.
+            dispatcher (dispatcher, optional): dispatcher whose UI thread shows the notifications. Defaults to the process-wide one.
+        """
+        assert limit >= 1, "The limit must allow at least one window per interval."
+        self.limit = limit
+        self.interval = interval
+        self.toast = toast
+        self.duration = duration
+        self.dispatcher = dispatcher
+        self.lock = threading.Lock()
+        # Notifications waiting for their turn, by key: [title, message, icon, count]
+        self.pending = collections.OrderedDict()
+        self.scheduled = False
+        # Used on the UI thread only: windows shown by key, and when the last windows were opened
+        self.shown = {}
+        self.opened = collections.deque()
+        self.toasts = []
+
+    @classmethod
+    def get(cls):
+        """Return the process-wide notifier, creating it on first use"""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    @staticmethod
+    def key(title, message, icon):
+        """
+        Identify notifications that are alike
+
+        Args:
+            title (str): title
+            message (str): message
+            icon (str): icon
+
+        Returns:
+            tuple: the same for notifications merged into one window
+        """
+        return icon, title, re.sub(r"\d+", "#", str(message))
+
+    def notify(self, title, message, icon="info"):
+        """
+        Queue a notification and return at once
+
+        Args:
+            title (str): title
+            message (str): message
+            icon (str, optional): alert, info, error or success. Defaults to "info".
+        """
+        key = self.key(title, message, icon)
+        with self.lock:
+            if key in self.pending:
+                self.pending[key][3] += 1
+            else:
+                self.pending[key] = [title, message, icon, 1]
+            if self.scheduled:
+                return
+            self.scheduled = True
+        if self.dispatcher is None:
+            self.dispatcher = dispatcher.get()
+        self.dispatcher.call(self.pump)
+
+    def alert(self, title, message):
+        """Queue an alert, see notify"""
+        self.notify(title, message, "alert")
+
+    def info(self, title, message):
+        """Queue an information, see notify"""
+        self.notify(title, message, "info")
+
+    def error(self, title, message):
+        """Queue an error, see notify"""
+        self.notify(title, message, "error")
+
+    def success(self, title, message):
+        """Queue a success, see notify"""
+        self.notify(title, message, "success")
+
+    @staticmethod
+    def text(message, count):
+        """Message with the number of notifications merged into it"""
+        return message if count == 1 else f"{message}\n\nx {count}"
+
+    def pump(self):
+        """On the UI thread: add the pending notifications to their windows, or open windows while the rate allows"""
+        root = self.dispatcher.engine.find_root()
+        now = time.monotonic()
+        while self.opened and now - self.opened[0] >= self.interval:
+            self.opened.popleft()
+
+        # Take what can be shown now, the lock is only held while the pending notifications change
+        ready = []
+        with self.lock:
+            room = self.limit - len(self.opened)
+            for key in list(self.pending):
+                if key not in self.shown:
+                    if room <= 0:
+                        continue
+                    room -= 1
+                ready.append((key, self.pending.pop(key)))
+            self.scheduled = bool(self.pending)
+
+        for key, (title, message, icon, count) in ready:
+            if key in self.shown:
+                self.shown[key][1] += count
+            else:
+                self.open(root, key, title, message, icon, count)
+                self.opened.append(now)
+            shown, total = self.shown[key]
+            shown.update(self.text(message, total))
+        if self.scheduled:
+            # Try again when the oldest window counted leaves the interval
+            wait = self.interval - (now - self.opened[0]) if self.opened else 0
+            root.after(int(wait * 1000) + 1, self.pump)
+
+    def open(self, root, key, title, message, icon, count):
+        """On the UI thread: open the window of a notification"""
+        if self.toast:
+            shown = toast(root, title, self.text(message, count), icon, len(self.toasts), self.duration, lambda: self.closed(key))
+            self.toasts.append(shown)
+        else:
+            handle = self.dispatcher.engine.show_nowait(options, lambda dialog: None, title=title, message=message, choices=["OK"], icon=icon)
+            shown = window(handle)
+            handle.add_done_callback(lambda handle: self.closed(key))
+        self.shown[key] = [shown, count]
+
+    def closed(self, key):
+        """On the UI thread: forget the window of a notification, the next alike one opens a new window"""
+        shown = self.shown.pop(key, None)
+        if shown is not None and shown[0] in self.toasts:
+            self.toasts.remove(shown[0])
+
@@ -1,11 +1,24 @@
 import tkinter as tk
-import os
+from dialoger import events, icons, keys
+from dialoger.backends import body
+from dialoger.choicelist import choicelist
+from dialoger.countdown import countdown
+from dialoger.textbody import textbody
 
 class options():
 
     _instance = None
 
-    def __init__(self, title: str, message: str, choices: list, icon=None, orientation='horizontal') -> None:
+    # Above this number of choices, a filtered list is shown instead of one button per choice
+    list_threshold = 50
+
+    # Messages longer than this, files and iterables of lines are shown in a scrollable text instead of a label
+    message_threshold = 2000
+
+    # Handlers of the keys pressed on the buttons, by keysym, see dialoger.keys
+    keys = {"Right": "next_button", "Left": "previous_button", "Return": "press_button", "Escape": "escape_pressed"}
+
+    def __init__(self, title: str, message: str, choices: list, icon=None, orientation='horizontal', master=None, keep=False, modal=True) -> None:
         """Initialize the class
 
         Args:
@@ -13,16 +26,47 @@ class options():
             message (str): message to be shown
             choices (list): list of choices
             icon (str): icon file name
+            orientation (str, optional): layout of the buttons, 'horizontal' or 'vertical'. Defaults to 'horizontal'.
+            master (tk.Misc, optional): parent window. Defaults to the current root, if any.
+            keep (bool, optional): withdraw the window instead of destroying it when closed. Defaults to False.
+            modal (bool, optional): disable the parent window while the dialog is shown. Defaults to True.
         """
         if hasattr(self, 'initialized') and self.initialized:
             self.reinitialize(title, message, choices, icon)
             return
-        self.orientation = orientation
+        self.setup(master, keep, modal)
+        self.show(title, message, choices, icon, orientation)
+
+    @classmethod
+    def prebuilt(cls, master=None, keep=True, modal=True):
+        """
+        Build a withdrawn window that can be shown later with show()
+
+        Args:
+            master (tk.Misc, optional): parent window. Defaults to the current root, if any.
+            keep (bool, optional): withdraw the window instead of destroying it when closed. Defaults to True.
+            modal (bool, optional): disable the parent window while the dialog is shown. Defaults to True.
+
+        Returns:
+            options: the window, not shown yet
+        """
+        self = cls.__new__(cls)
+        self.setup(master, keep, modal)
+        return self
+
+    def setup(self, master=None, keep=False, modal=True):
+        """Initialize the state and build the window"""
         self.initialized = True
+        self.orientation = 'horizontal'
         self.choice = None
+        self.choices = []
         self.dialog = None
-        self._root = self.find_root()
-        self.create_window(title, message, choices, icon)
+        self.icon = None
+        self.title = None
+        self.keep = keep
+        self.modal = modal
+        self._root = master if master is not None else self.find_root()
+        self.build_window()
 
     def find_root(self):
         """Find or create the root window."""
@@ -46,65 +90,209 @@ class options():
             choices (list): list of choices
             icon (str): icon file name
         """
+        self.build_window()
+        self.show(title, message, choices, icon, self.orientation)
+
+    def build_window(self):
+        """Create the window and the widgets that don't depend on the message"""
         # Create window
         if self._root:
             self.dialog = tk.Toplevel(self._root)
-            self._root.attributes('-disabled', True)
         else:
             self.dialog = tk.Tk()
 
         self.dialog.withdraw()
+        self.closed = tk.BooleanVar(self.dialog, value=True)
+        self.focus_jobs = []
+        self.timed_out = False
+        self.countdown = countdown(self.dialog)
 
         self.dialog.protocol("WM_DELETE_WINDOW", self.close)
-        self.dialog.title(title)
         self.dialog.resizable(False, False)
-        self.dialog.geometry("+400+250")
         self.dialog.attributes('-topmost', True)
-
-        # Set icon
-        if icon:
-            imagepath = os.path.join(os.path.dirname(__file__), "images", icon)
-            self.dialog.iconbitmap(imagepath + '.ico')
+        self.dialog.bind("<Key>", self.key_pressed_in_root)
+        self.dialog.bind("<Destroy>", self.window_destroyed, add=True)
+        self.dialog.bind("<FocusIn>", self.focused, add=True)
+        self.focus_seen = False
 
         # Message frame
-        frm_label = tk.Frame(self.dialog, background="white")
+        self.frm_label = tk.Frame(self.dialog, background="white")
+        self.title_img = tk.Label(self.frm_label, background="white")
+        self.title_msg = tk.Label(self.frm_label, background="white", justify=tk.LEFT)
+        self.text_body = None
+        self.frm_label.pack(expand=True, fill=tk.BOTH)
+
+        # Button frame
+        self.frmButtons = tk.Frame(self.dialog)
+        self.frmButtons.pack(expand=True)
+        self.all_buttons = []
+        self.buttons = []
+        self.choice_list = None
+        # "Don't ask again", created the first time a dialog offers it
+        self.remember_check = None
+        self.remember_var = None
+        self.remembered = False
+        if events.observers:
+            events.emit("created", self)
+
+    def configure_window(self, title, message, choices, icon):
+        """
+        Fill the window with a new message and choices
+
+        Args:
+            title (str): window title
+            message (str | os.PathLike | iterable): message to be shown, a path object (not a string) of a text file or an iterable of lines
+            choices (list): list of choices
+            icon (str): icon file name
+        """
+        self.dialog.title(title)
+        self.title = title
+        self.dialog.geometry("+400+250")
+
+        # Set icon
+        self.title_img.pack_forget()
+        self.title_msg.pack_forget()
         if icon:
-            self.image = tk.PhotoImage(file=os.path.join(os.path.dirname(__file__), "images", icon + '.png'))
-            title_img = tk.Label(frm_label, image=self.image, background="white")
-            title_img.image = self.image
-            title_img.pack(side=tk.LEFT, anchor=tk.N, padx=(15, 3), pady=15)
+            if icon != self.icon:
+                icons.set_window_icon(self.dialog, icon)
+            self.image = icons.image(self.dialog, icon)
+            self.title_img.config(image=self.image)
+            self.title_img.pack(side=tk.LEFT, anchor=tk.N, padx=(15, 3), pady=15)
+        self.icon = icon
 
-        wraplength = 400 if len(choices) < 3 else 650
-        title_msg = tk.Label(frm_label, text=message, background="white", justify=tk.LEFT, wraplength=wraplength)
-        title_msg.pack(side=tk.LEFT, padx=(3, 15), pady=15)
-        frm_label.pack(expand=True, fill=tk.BOTH)
+        # Long messages are loaded in chunks into a scrollable text, so the window is shown right away
+        message = body(message)
+        if textbody.is_long(message, self.message_threshold):
+            if self.text_body is None:
+                self.text_body = textbody(self.frm_label)
+            self.text_body.load(message)
+            self.text_body.frame.pack(side=tk.LEFT, expand=True, fill=tk.BOTH, padx=(3, 15), pady=15)
+        else:
+            if self.text_body is not None:
+                self.text_body.stop()
+                self.text_body.frame.pack_forget()
+            wraplength = 400 if len(choices) < 3 else 650
+            self.title_msg.config(text=message, wraplength=wraplength)
+            self.title_msg.pack(side=tk.LEFT, padx=(3, 15), pady=15)
 
-        # Button frame
-        frmButtons = tk.Frame(self.dialog)
+        self.choices = list(choices)
+        for btn in self.buttons:
+            btn.pack_forget()
         self.buttons = []
-        for choice in choices:
-            btn = tk.Button(frmButtons, text=choice, borderwidth=1, command=lambda x=choice: self.set_choice(x))
-
-            btn.bind("<Right>", lambda event, button=btn: self.next_button(button))
-            btn.bind("<Left>", lambda event, button=btn: self.previous_button(button))
-            btn.bind("<Return>", lambda event, button=btn: self.set_choice(button['text']))
-            btn.bind("<Escape>", lambda event: self.close())
-            side_option = tk.TOP if self.orientation == 'vertical' else tk.LEFT
+
+        # Too many choices for buttons, show them in a filtered list
+        if len(self.choices) > self.list_threshold:
+            self.frmButtons.pack_forget()
+            if self.choice_list is None:
+                self.choice_list = choicelist(self.dialog, self.set_choice)
+            self.choice_list.load(self.choices)
+            self.choice_list.frame.pack(expand=True, fill=tk.BOTH, padx=15, pady=(0, 15))
+            self.first_widget = self.choice_list.filter
+            self.first_widget.focus_set()
+            return
+        if self.choice_list is not None:
+            self.choice_list.frame.pack_forget()
+        self.frmButtons.pack(expand=True)
+
+        # Buttons, reusing the ones created for previous messages
+        while len(self.all_buttons) < len(self.choices):
+            self.add_button()
+        self.buttons = self.all_buttons[:len(self.choices)]
+        side_option = tk.TOP if self.orientation == 'vertical' else tk.LEFT
+        for choice, btn in zip(self.choices, self.buttons):
+            btn.config(text=choice)
             btn.pack(side=side_option, padx=10, pady=10, ipadx=5, ipady=1)
-            self.buttons.append(btn)
-        self.buttons[0].focus_set()
-        frmButtons.pack(expand=True)
+        self.first_widget = self.buttons[0]
+        self.first_widget.focus_set()
+
+    def add_button(self):
+        """Create one more button, bound to the choice at its position"""
+        index = len(self.all_buttons)
+        btn = tk.Button(self.frmButtons, borderwidth=1, command=lambda: self.set_choice(self.choices[index]))
+        keys.attach(btn, self, index)
+        self.all_buttons.append(btn)
+
+    def show(self, title: str, message: str, choices: list, icon=None, orientation='horizontal', wait=True, timeout=None, remember=False):
+        """
+        Show the window with a new message and wait for the user's choice
+
+        Args:
+            title (str): window title
+            message (str | os.PathLike | iterable): message to be shown, a path object (not a string) of a text file or an iterable of lines
+            choices (list): list of choices
+            icon (str, optional): icon file name. Defaults to None.
+            orientation (str, optional): layout of the buttons, 'horizontal' or 'vertical'. Defaults to 'horizontal'.
+            wait (bool, optional): wait until the window is closed. Defaults to True.
+            timeout (float, optional): seconds before the window closes by itself, setting timed_out. Defaults to None, no limit.
+            remember (bool, optional): show a "Don't ask again" check box, whose state is in remembered once closed. Defaults to False.
+
+        Returns:
+            str: choice, None if not waiting
+        """
+        self.orientation = orientation
+        self.choice = None
+        self.configure_window(title, message, choices, icon)
+        self.configure_remember(remember)
+        self.show_window(wait, timeout)
+        return self.choice
+
+    def configure_remember(self, remember=False):
+        """Show or hide the "Don't ask again" check box, unticked, below the choices"""
+        self.remembered = False
+        if self.remember_check is not None:
+            self.remember_check.pack_forget()
+        if not remember:
+            return
+        if self.remember_check is None:
+            self.remember_var = tk.BooleanVar(self.dialog, value=False)
+            self.remember_check = tk.Checkbutton(self.dialog, text="Don't ask again", variable=self.remember_var)
+        self.remember_var.set(False)
+        self.remember_check.pack(anchor=tk.W, padx=15, pady=(0, 5))
+
+    def show_window(self, wait=True, timeout=None):
+        """
+        Show the window
+
+        Args:
+            wait (bool, optional): wait until the window is closed. Defaults to True.
+            timeout (float, optional): seconds before the window closes by itself. Defaults to None, no limit.
+        """
+        if self._root and self.modal:
+            self._root.attributes('-disabled', True)
+
+        if events.observers:
+            events.emit("shown", self)
 
         # Update layout and show the window
         self.dialog.update_idletasks()
 
         # Focus settings
-        self.dialog.after(10, lambda: [self.dialog.focus_force(), self.buttons[0].focus_set()])
-        self.dialog.after(300, lambda: [self.dialog.focus_force(), self.buttons[0].focus_set()])
+        self.focus_jobs = [self.dialog.after(delay, self.focus_first) for delay in (10, 300)]
+        # Close by itself when the time runs out, showing the seconds left below everything else
+        self.timed_out = False
+        self.countdown.label.pack_forget()
+        if timeout:
+            self.countdown.label.pack(pady=(0, 5))
+            self.countdown.start(timeout, self.expire)
+
+        self.focus_seen = False
+        self.closed.set(False)
         self.dialog.deiconify()
-        self.dialog.bind("<Key>", self.key_pressed_in_root)
-        self.dialog.wait_window()
+        if wait:
+            self.dialog.wait_variable(self.closed)
 
+    def focus_first(self):
+        """Bring the window to the front and focus the first button (or the filter of the list)"""
+        if self.dialog and not self.closed.get():
+            self.dialog.focus_force()
+            self.first_widget.focus_set()
+
+    def focused(self, event):
+        """Emit the focused event the first time the window gets the focus after being shown"""
+        if not self.focus_seen and not self.closed.get():
+            self.focus_seen = True
+            if events.observers:
+                events.emit("focused", self)
 
     def set_choice(self, choice: str) -> None:
         """Set the choice and close the window"""
@@ -116,27 +304,110 @@ class options():
         self.choice = None
         self.destroy_window()
 
+    def expire(self):
+        """Close the window without an answer when the time runs out"""
+        self.timed_out = True
+        if events.observers:
+            events.emit("timeout", self)
+        self.close()
+
     def destroy_window(self):
-        """Destroy the window and re-enable the root"""
+        """Destroy (or withdraw, if kept) the window and re-enable the root"""
         if self.dialog:
-            self.dialog.destroy()
-            self.dialog = None
+            self.cancel_jobs()
+            if not self.closed.get():
+                self.remembered = self.remember_check is not None and self.remember_check.winfo_manager() != "" and self.remember_var.get()
+            if events.observers and not self.closed.get():
+                events.emit("cancelled" if self.choice is None else "answered", self, choice=self.choice)
+            self.closed.set(True)
+            if self.keep:
+                self.dialog.withdraw()
+            else:
+                self.dispose()
         options._instance = None
-        if self._root:
+        if self._root and self.modal:
             self._root.attributes('-disabled', False)
             self._root.focus_force()
 
+    def window_destroyed(self, event):
+        """Stop waiting if the window is destroyed from outside"""
+        if event.widget is self.dialog:
+            if events.observers:
+                if not self.closed.get():
+                    events.emit("cancelled", self)
+                events.emit("destroyed", self)
+            self.closed.set(True)
+
+    def alive(self):
+        """Check if the window still exists and can be shown again"""
+        try:
+            return self.dialog is not None and bool(self.dialog.winfo_exists())
+        except tk.TclError:
+            return False
+
+    def cancel_jobs(self):
+        """Cancel the pending focus timers, the countdown and the loading of a long message"""
+        if self.dialog is not None:
+            for job in self.focus_jobs:
+                try:
+                    self.dialog.after_cancel(job)
+                except tk.TclError:
+                    pass
+            for helper in (self.text_body, self.countdown):
+                if helper is not None:
+                    try:
+                        helper.stop()
+                    except tk.TclError:
+                        pass
+        self.focus_jobs = []
+
+    def dispose(self):
+        """
+        Destroy the window for good and drop every reference to it
+
+        Destroying the window deletes the Tcl commands of its bindings, buttons and protocol handler. Pending
+        timers are cancelled and the icon image is released, so nothing is left behind in the interpreter.
+        """
+        self.cancel_jobs()
+        if self.alive():
+            self.title_img.config(image="")
+            self.dialog.destroy()
+        self.dialog = None
+        self.image = None
+        self.title_img = None
+        self.title_msg = None
+        self.frm_label = None
+        self.text_body = None
+        self.frmButtons = None
+        self.all_buttons = []
+        self.buttons = []
+        self.choice_list = None
+        self.countdown = None
+        self.remember_check = None
+        self.remember_var = None
+        self.first_widget = None
+
     def key_pressed_in_root(self, event):
         """Handle Escape key press to close the dialog"""
         if event.keysym == 'Escape':
             self.close()
 
-    def next_button(self, button):
+    def next_button(self, event, index):
         """Select the next button"""
-        i = self.buttons.index(button)
-        self.buttons[(i + 1) % len(self.buttons)].focus_set()
+        self.buttons[(index + 1) % len(self.buttons)].focus_set()
+        return "break"
 
-    def previous_button(self, button):
+    def previous_button(self, event, index):
         """Select the previous button"""
-        i = self.buttons.index(button)
-        self.buttons[(i - 1) % len(self.buttons)].focus_set()
+        self.buttons[(index - 1) % len(self.buttons)].focus_set()
+        return "break"
+
+    def press_button(self, event, index):
+        """Choose the choice of the button"""
+        self.set_choice(self.choices[index])
+        return "break"
+
+    def escape_pressed(self, event, index):
+        """Close the dialog, without also running the Escape of the window"""
+        self.close()
+        return "break"
@@ -0,0 +1,110 @@
+import tkinter as tk
+from tkinter import ttk
+from dialoger import options
+
+class progressbar(options):
+    """Window showing the progress of a job, with the message and icon of options and a Cancel button"""
+
+    def build_window(self):
+        """Create the window, with a progress bar and a status line between the message and the buttons"""
+        super().build_window()
+        self.tracker = None
+        self.release = None
+        self.tick_job = None
+        self.frm_progress = tk.Frame(self.dialog, background="white")
+        self.bar = ttk.Progressbar(self.frm_progress, length=350, maximum=1000)
+        self.status = tk.Label(self.frm_progress, background="white", anchor=tk.W)
+        self.bar.pack(fill=tk.X, padx=15)
+        self.status.pack(fill=tk.X, padx=15, pady=(3, 10))
+        self.frm_progress.pack(after=self.frm_label, fill=tk.X)
+
+    def show(self, title: str, message: str, tracker, icon="info", release=None):
+        """
+        Show the window, drawing the progress of a tracker until it is closed
+
+        Args:
+            title (str): window title
+            message (str): message to be shown
+            tracker (tracker): progress of the job, see dialoger.tracker
+            icon (str, optional): icon file name. Defaults to "info".
+            release (callable, optional): function receiving the window once the job is over, to pool or destroy it. Defaults to None.
+        """
+        self.tracker = tracker
+        self.release = release
+        tracker.on_draw = self.draw
+        tracker.on_close = self.finish
+        self.choice = None
+        self.bar.config(mode="determinate" if tracker.total else "indeterminate", value=0)
+        self.configure_window(title, message, ["Cancel"], icon)
+        self.configure_remember(False)
+        self.redraw()
+        self.show_window(wait=False)
+        self.tick()
+
+    def redraw(self):
+        """Show the count of the tracker"""
+        count, total = self.tracker.count, self.tracker.total
+        if total:
+            fraction = self.tracker.fraction()
+            self.bar.config(value=fraction * 1000)
+            self.status.config(text=f"{count:,} / {total:,} ({fraction:.0%})")
+        else:
+            self.bar.step(25)
+            self.status.config(text=f"{count:,}")
+
+    def draw(self, tracker):
+        """Redraw when a frame is due, and handle the events (such as Cancel) the job kept waiting"""
+        if self.dialog is None or self.closed.get():
+            return
+        self.redraw()
+        self.dialog.update()
+
+    def tick(self):
+        """Redraw every frame while the Tk event loop runs, for jobs advanced from other threads"""
+        self.tick_job = None
+        if self.tracker.closed:
+            # Closed from another thread, finish on this one
+            self.tracker.close()
+            return
+        self.redraw()
+        self.tick_job = self.dialog.after(int(self.tracker.interval * 1000), self.tick)
+
+    def set_choice(self, choice: str) -> None:
+        """Cancel the job, the only choice is Cancel"""
+        self.close()
+
+    def close(self):
+        """Cancel the job and close the window"""
+        if self.tracker is not None:
+            self.tracker.cancel()
+        self.choice = None
+        self.destroy_window()
+
+    def cancel_jobs(self):
+        """Cancel the timers, the redraws included"""
+        if self.dialog is not None and self.tick_job is not None:
+            try:
+                self.dialog.after_cancel(self.tick_job)
+            except tk.TclError:
+                pass
+        self.tick_job = None
+        super().cancel_jobs()
+
+    def dispose(self):
+        """Destroy the window for good and drop every reference to it"""
+        super().dispose()
+        self.frm_progress = None
+        self.bar = None
+        self.status = None
+
+    def finish(self, tracker):
+        """Close the window once the job is over, and give it back"""
+        if self.dialog is not None and not self.closed.get():
+            self.redraw()
+            self.destroy_window()
+        else:
+            self.cancel_jobs()
+        self.tracker = None
+        release, self.release = self.release, None
+        if release is not None:
+            release(self)
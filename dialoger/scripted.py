@@ -0,0 +1,226 @@
+import collections
+import json
+import os
+import queue
+from dialoger.backends import backend, body, expired
+from dialoger.field import FIELD, field
+from dialoger.search import cached
+
+class scripted(backend):
+    """
+    Backend answering the dialogs from a script, for tests
+
+    Each answer is either a bare value, used by the next dialog, or a dict with an "answer" key and optionally
+    "title" and/or "question" keys, used by the first dialog with that title and question (these are tried before
+    the bare values). For a form, the question is its message. An answer of None cancels the dialog, and an answer
+    of scripted.TIMEOUT lets its time run out as if nobody answered. Answers are checked with the same rules as
+    the windows, so a script can't submit what a user couldn't type. Every dialog is recorded in the transcript.
+    "Don't ask again" is never ticked, so a script never remembers answers.
+    """
+
+    # Answer of a dialog left unanswered until its timeout, written {"timeout": true} in a JSONL file
+    TIMEOUT = {"timeout": True}
+
+    def __init__(self, answers=None):
+        """Initialize the class
+
+        Args:
+            answers (iterable | queue.Queue | str | os.PathLike, optional): answers, a queue other threads can fill, or
+                the path of a JSONL file with one answer per line. Defaults to the file in the DIALOGER_SCRIPT
+                environment variable, if any.
+        """
+        if answers is None:
+            answers = os.environ.get("DIALOGER_SCRIPT", ())
+        self.source = None
+        if isinstance(answers, queue.Queue):
+            self.source = answers
+            answers = ()
+        elif isinstance(answers, (str, os.PathLike)):
+            with open(answers, encoding="utf-8") as file:
+                answers = [json.loads(line) for line in file if line.strip()]
+        # Bare answers in order, and answers waiting for a dialog with their title and question
+        self.pending = collections.deque()
+        self.matched = []
+        for answer in answers:
+            self.add(answer)
+        self.transcript = []
+
+    def add(self, answer):
+        """
+        Add an answer to the script
+
+        Args:
+            answer (any): bare answer, or dict with an "answer" key and optionally "title" and/or "question" keys
+        """
+        if isinstance(answer, dict) and "answer" in answer:
+            self.matched.append(answer)
+        else:
+            self.pending.append(answer)
+
+    def take(self, kind, title, question=None):
+        """
+        Take the answer of a dialog and record the dialog
+
+        Args:
+            kind (str): function showing the dialog, such as ask or confirm
+            title (str): title of the dialog
+            question (str, optional): question of the dialog. Defaults to None.
+
+        Raises:
+            LookupError: no answer is left for this dialog
+
+        Returns:
+            any: the answer
+        """
+        if self.source is not None:
+            try:
+                while True:
+                    self.add(self.source.get_nowait())
+            except queue.Empty:
+                pass
+        record = {"kind": kind, "title": title, "question": question}
+        self.transcript.append(record)
+        for position, entry in enumerate(self.matched):
+            if entry.get("title", title) == title and entry.get("question", question) == question:
+                del self.matched[position]
+                record["answer"] = entry["answer"]
+                return entry["answer"]
+        if self.pending:
+            record["answer"] = self.pending.popleft()
+            return record["answer"]
+        raise LookupError(f"No scripted answer for {kind} '{title}': {question}")
+
+    def check(self, question, rules: field, answer, answer_default=None, allow_cancel=True):
+        """
+        Check a scripted answer with the rules of the input, formatting it with the pattern as typing would
+
+        Args:
+            question (str): question, for the error message
+            rules (field): rules of the answer
+            answer (any): scripted answer
+            answer_default (str, optional): answer when the scripted one is empty. Defaults to None.
+            allow_cancel (bool, optional): accept None as an answer. Defaults to True.
+
+        Raises:
+            ValueError: the answer could not be submitted in the window
+
+        Returns:
+            str: the answer as the window would return it, None if cancelled
+        """
+        if answer is None:
+            if not allow_cancel:
+                raise ValueError(f"'{question}' can't be cancelled")
+            return None
+        text = str(answer)
+        if text == "" and answer_default is not None:
+            text = str(answer_default)
+        if rules.mask is not None:
+            text = rules.mask.format(text)
+        if not (rules.accepts(text) and rules.valid(text)):
+            raise ValueError(f"Invalid scripted answer for '{question}': {answer!r}")
+        return text
+
+    def ask(self, title, question, answer_type, answer_default=None, pattern=None, allow_empty=True, allow_cancel=True, entrance_width=35, typed=False, timeout=None, on_timeout=None, suggestions=None, suggestions_only=False):
+        """Answer a question, see dialoger.ask"""
+        rules = field(answer_type, pattern, allow_empty)
+        answer = self.take("ask", title, question)
+        if answer == self.TIMEOUT:
+            return expired(on_timeout, rules.default(answer_default, typed))
+        answer = self.check(question, rules, answer, answer_default, allow_cancel)
+        if suggestions_only and suggestions is not None and answer not in (None, "") and answer not in cached(suggestions):
+            raise ValueError(f"Scripted answer for '{question}' is not one of the suggestions: {answer!r}")
+        if answer is not None and typed:
+            answer = rules.parse(answer)
+        # The transcript shows the answer as the window would return it, formatted with the pattern
+        self.transcript[-1]["answer"] = answer
+        return answer
+
+    def form(self, title, fields, message=None, allow_cancel=True, entrance_width=35, timeout=None, on_timeout=None):
+        """
+        Answer several questions at once, see dialoger.form
+
+        Raises:
+            ValueError: the answer is not a dict of answers by field name, or one of them is invalid
+        """
+        answer = self.take("form", title, message)
+        if answer is None:
+            if not allow_cancel:
+                raise ValueError(f"'{title}' can't be cancelled")
+            return None
+        specs = []
+        for spec in fields:
+            spec = {"question": spec} if isinstance(spec, str) else spec
+            assert set(spec) <= set(FIELD), f"Unknown field options: {', '.join(set(spec) - set(FIELD))}"
+            spec = dict(FIELD, **spec)
+            specs.append((spec, field(spec["answer_type"], spec["pattern"], spec["allow_empty"])))
+        if answer == self.TIMEOUT:
+            return expired(on_timeout, {spec["name"] or spec["question"]: rules.default(spec["answer_default"], spec["typed"]) for spec, rules in specs})
+        if not isinstance(answer, dict):
+            raise ValueError(f"Scripted answer for the form '{title}' must be a dict of answers by field name: {answer!r}")
+        answers = {}
+        for spec, rules in specs:
+            name = spec["name"] if spec["name"] is not None else spec["question"]
+            text = self.check(spec["question"], rules, answer.get(name, ""), spec["answer_default"], allow_cancel=False)
+            answers[name] = rules.parse(text) if spec["typed"] else text
+        self.transcript[-1]["answer"] = answers
+        return answers
+
+    def askwithanswers(self, title, question, choices, orientation='horizontal', timeout=None, on_timeout=None, remember=False):
+        """Pick one of the choices, see dialoger.askwithanswers"""
+        answer = self.take("askwithanswers", title, question)
+        if answer == self.TIMEOUT:
+            return expired(on_timeout)
+        if answer is not None and answer not in choices:
+            raise ValueError(f"Invalid scripted choice for '{question}': {answer!r}")
+        return answer
+
+    def confirm(self, title, message, choices, timeout=None, on_timeout=False, remember=False):
+        """Pick one of two choices, see dialoger.confirm. The answer can also be True or False."""
+        answer = self.take("confirm", title, message)
+        if answer == self.TIMEOUT:
+            return expired(on_timeout)
+        if isinstance(answer, bool):
+            return answer
+        if answer is not None and answer not in choices:
+            raise ValueError(f"Invalid scripted choice for '{message}': {answer!r}")
+        return answer == choices[0]
+
+    def progress(self, title, message, iterable=None, total=None, icon="info", fps=10):
+        """Record a progress dialog, the job runs to the end"""
+        self.transcript.append({"kind": "progress", "title": title, "question": message})
+        return super().progress(title, message, iterable, total, icon, fps)
+
+    def message(self, title, message, icon, timeout=None):
+        """Record a message, nothing is taken from the script"""
+        message = body(message)
+        if isinstance(message, os.PathLike):
+            message = os.fspath(message)
+        elif message is not None and not isinstance(message, str):
+            message = "\n".join(str(line).rstrip("\n") for line in message)
+        self.transcript.append({"kind": icon, "title": title, "question": message})
+
+    async def ask_async(self, *args, **kwargs):
+        return self.ask(*args, **kwargs)
+
+    async def form_async(self, *args, **kwargs):
+        return self.form(*args, **kwargs)
+
+    async def askwithanswers_async(self, *args, **kwargs):
+        return self.askwithanswers(*args, **kwargs)
+
+    async def confirm_async(self, *args, **kwargs):
+        return self.confirm(*args, **kwargs)
+
+    async def message_async(self, *args, **kwargs):
+        return self.message(*args, **kwargs)
+
+    def save(self, path) -> None:
+        """
+        Write the transcript to a JSONL file, one dialog per line
+
+        Args:
+            path (str | os.PathLike): path of the file
+        """
+        with open(path, "w", encoding="utf-8") as file:
+            for record in self.transcript:
+                file.write(json.dumps(record, default=str) + "\n")
@@ -0,0 +1,123 @@
+import bisect
+import collections
+
+class index:
+    """Case-insensitive prefix and substring search over a list of items, built once"""
+
+    def __init__(self, items):
+        """Initialize the class
+
+        Args:
+            items (iterable): items to search, compared by their text
+        """
+        self.items = list(items)
+        self.labels = [str(item) for item in self.items]
+        self.keys = [label.casefold() for label in self.labels]
+        # Positions sorted by key, built by sort()
+        self.order = None
+        self.sorted_keys = None
+        # Last substring search, narrowed when the next query extends it
+        self.last_query = None
+        self.last_matches = None
+        # Labels as a set, built on the first membership test
+        self.label_set = None
+
+    def __len__(self):
+        return len(self.items)
+
+    def sort(self) -> None:
+        """Sort the keys for prefix(), which does it on its first search otherwise"""
+        if self.order is None:
+            self.order = sorted(range(len(self.keys)), key=self.keys.__getitem__)
+            self.sorted_keys = [self.keys[i] for i in self.order]
+
+    def prefix(self, query: str, limit: int = None) -> list:
+        """
+        Find the items starting with a text, in alphabetical order
+
+        Args:
+            query (str): text
+            limit (int, optional): maximum number of results. Defaults to None, all of them.
+
+        Returns:
+            list: positions of the items
+        """
+        self.sort()
+        query = query.casefold()
+        start = bisect.bisect_left(self.sorted_keys, query)
+        end = bisect.bisect_left(self.sorted_keys, query + "\U0010ffff", start)
+        if limit is not None:
+            end = min(end, start + limit)
+        return self.order[start:end]
+
+    def search(self, query: str, limit: int = None) -> list:
+        """
+        Find the items containing a text, the ones starting with it first, each group in the original order
+
+        When the query extends the previous one, only the previous matches are searched again, so typing one
+        more character costs less than the first one.
+
+        Args:
+            query (str): text
+            limit (int, optional): maximum number of results. Defaults to None, all of them.
+
+        Returns:
+            list: positions of the items
+        """
+        query = query.casefold()
+        if not query:
+            return list(range(len(self.keys) if limit is None else min(limit, len(self.keys))))
+        if self.last_query and query.startswith(self.last_query):
+            candidates = self.last_matches
+        else:
+            candidates = range(len(self.keys))
+        keys = self.keys
+        matches = [i for i in candidates if query in keys[i]]
+        self.last_query = query
+        self.last_matches = matches
+        starting = [i for i in matches if keys[i].startswith(query)]
+        if len(starting) < len(matches):
+            first = set(starting)
+            matches = starting + [i for i in matches if i not in first]
+        else:
+            matches = starting
+        return matches if limit is None else matches[:limit]
+
+    def __contains__(self, label):
+        if self.label_set is None:
+            self.label_set = set(self.labels)
+        return label in self.label_set
+
+
+# Indexes of the last sources given to cached(), most recent last
+_cache = collections.OrderedDict()
+cache_size = 8
+
+
+def cached(source) -> index:
+    """
+    Index of a source of suggestions, reused while the same source is given again
+
+    Args:
+        source (iterable | callable): items, or a function returning them, called only when the index is built.
+            Lists, tuples and the like are indexed again when their length changes; iterators are never cached.
+
+    Returns:
+        index: the index
+    """
+    if isinstance(source, index):
+        return source
+    if not callable(source) and iter(source) is source:
+        return index(source)
+    key = id(source)
+    size = len(source) if hasattr(source, "__len__") else None
+    entry = _cache.get(key)
+    if entry is not None and entry[0] is source and entry[1] == size:
+        _cache.move_to_end(key)
+        return entry[2]
+    built = index(source() if callable(source) else source)
+    # The source is kept with its index, so its id can't be given to another object meanwhile
+    _cache[key] = (source, size, built)
+    while len(_cache) > cache_size:
+        _cache.popitem(last=False)
+    return built
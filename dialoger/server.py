@@ -0,0 +1,197 @@
+"""
+Dialog server: one process showing the dialogs of every process of a program
+
+    python -m dialoger.server /tmp/dialoger.sock
+
+The processes then use it with DIALOGER_SERVER=/tmp/dialoger.sock, see dialoger.client. Over TCP, the server
+only listens on the loopback interface unless --allow-remote is given, and it asks for a token, printed at
+start unless DIALOGER_TOKEN or --token sets it; the clients send it from DIALOGER_TOKEN.
+"""
+import argparse
+import hmac
+import ipaddress
+import json
+import os
+import pathlib
+import secrets
+import socket
+import threading
+
+from dialoger.client import FUNCTIONS, parse_address
+from dialoger import dispatcher, notifier
+
+class server:
+    """
+    Accepts dialog requests from clients and shows them with a dispatcher, one Tk interpreter for all
+
+    Requests for the same dialog (same function and arguments) that arrive while it is waiting or open are
+    answered together by one window, so the same question from many workers is asked once. Notifications are
+    answered as soon as they are queued with the notifier, which merges the alike ones, see dialoger.notifier.
+
+    A Unix socket is only open to the user. A TCP socket is open to every local user (and to other machines with
+    allow_remote), so its requests must carry the token of the server.
+    """
+
+    def __init__(self, address, dispatcher=None, token=None, allow_remote=False):
+        """Initialize the class
+
+        Args:
+            address (str): path of a Unix socket, or host:port of a TCP socket, see dialoger.client.parse_address
+            dispatcher (dispatcher, optional): dispatcher showing the dialogs. Defaults to the process-wide one.
+            token (str, optional): token the requests must carry. Defaults to the DIALOGER_TOKEN environment
+                variable; over TCP, to a random token, see the token attribute.
+            allow_remote (bool, optional): listen on a TCP address that isn't a loopback one. Defaults to False.
+        """
+        self.address = address
+        self.dispatcher = dispatcher
+        self.token = token if token is not None else os.environ.get("DIALOGER_TOKEN")
+        if not self.token and parse_address(address)[0] == socket.AF_INET:
+            self.token = secrets.token_urlsafe(24)
+        self.allow_remote = allow_remote
+        self.lock = threading.Lock()
+        # Connections waiting for each dialog, by request
+        self.waiting = {}
+        self.listener = None
+        self.notifier = None
+
+    def bind(self):
+        """Open the socket, replacing a Unix socket left by a server that stopped"""
+        family, address = parse_address(self.address)
+        if family == socket.AF_INET and not self.allow_remote and not ipaddress.ip_address(socket.gethostbyname(address[0])).is_loopback:
+            raise PermissionError(f"{address[0]} is not a loopback address, give allow_remote to accept clients from other machines")
+        self.listener = socket.socket(family, socket.SOCK_STREAM)
+        if family == socket.AF_INET:
+            self.listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        elif os.path.exists(address):
+            os.unlink(address)
+        self.listener.bind(address)
+        if family != socket.AF_INET:
+            # Only the user can send dialogs to the server
+            os.chmod(address, 0o600)
+        self.listener.listen()
+
+    def serve_forever(self):
+        """Accept clients until close() is called, or the process is interrupted"""
+        if self.dispatcher is None:
+            self.dispatcher = dispatcher.get()
+        if self.listener is None:
+            self.bind()
+        try:
+            while True:
+                try:
+                    connection, _ = self.listener.accept()
+                except OSError:
+                    # The socket was closed
+                    break
+                threading.Thread(target=self.receive, args=(connection,), name="dialoger-client", daemon=True).start()
+        finally:
+            self.close()
+
+    def receive(self, connection):
+        """Read the request of a client and queue its dialog, or join the same dialog if it is already queued"""
+        try:
+            with connection.makefile("r", encoding="utf-8") as stream:
+                line = stream.readline()
+            request = json.loads(line)
+            function = request["function"]
+            assert function in FUNCTIONS, f"Unknown function: {function}"
+            if self.token and not hmac.compare_digest(str(request.get("token", "")).encode("utf-8"), self.token.encode("utf-8")):
+                raise PermissionError("Wrong or missing token, set DIALOGER_TOKEN to the token of the server")
+        except (OSError, ValueError, KeyError, TypeError, AttributeError, AssertionError) as error:
+            self.send(connection, {"error": str(error), "type": type(error).__name__})
+            return
+        if function == "notify":
+            try:
+                self.notify(*request.get("args", []))
+            except Exception as error:
+                self.send(connection, {"error": str(error), "type": type(error).__name__})
+            else:
+                self.send(connection, {"result": None})
+            return
+        raising = bool(request.get("raise_on_timeout"))
+        key = json.dumps([function, request.get("args", []), request.get("kwargs", {}), raising], sort_keys=True)
+        with self.lock:
+            if key in self.waiting:
+                self.waiting[key].append(connection)
+                return
+            self.waiting[key] = [connection]
+        try:
+            future = self.show(function, request.get("args", []), request.get("kwargs", {}), raising)
+        except Exception as error:
+            self.answer(key, {"error": str(error), "type": type(error).__name__})
+            return
+        future.add_done_callback(lambda future: self.finished(key, future))
+
+    def show(self, function, args, kwargs, raising=False):
+        """Queue the dialog of a request with the dispatcher, raising TimeoutError when its time runs out if asked"""
+        if raising and function != "message":
+            kwargs["on_timeout"] = TimeoutError
+        if function == "message" and "path" in kwargs:
+            args = [args[0], pathlib.Path(kwargs.pop("path")), *args[2:]]
+        return self.dispatcher.request(function, *args, **kwargs)
+
+    def notify(self, title, message, icon="info"):
+        """Queue a notification, shown by the UI thread of the dispatcher"""
+        if self.notifier is None:
+            self.notifier = notifier(dispatcher=self.dispatcher)
+        self.notifier.notify(title, message, icon)
+
+    def finished(self, key, future):
+        """Send the result of a dialog to every client waiting for it"""
+        try:
+            response = {"result": future.result()}
+        except Exception as error:
+            response = {"error": str(error), "type": type(error).__name__}
+        self.answer(key, response)
+
+    def answer(self, key, response):
+        """Send a response to the clients waiting for a request"""
+        with self.lock:
+            connections = self.waiting.pop(key, [])
+        for connection in connections:
+            self.send(connection, response)
+
+    @staticmethod
+    def send(connection, response):
+        """Send a response and close the connection, ignoring clients that went away"""
+        try:
+            connection.sendall((json.dumps(response, default=str) + "\n").encode("utf-8"))
+        except OSError:
+            pass
+        finally:
+            connection.close()
+
+    def close(self):
+        """Stop accepting clients and remove the Unix socket"""
+        if self.listener is None:
+            return
+        listener, self.listener = self.listener, None
+        listener.close()
+        family, address = parse_address(self.address)
+        if family != socket.AF_INET and os.path.exists(address):
+            os.unlink(address)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("address", nargs="?", default=os.environ.get("DIALOGER_SERVER"), help="path of the Unix socket, or host:port. Defaults to DIALOGER_SERVER.")
+    parser.add_argument("--concurrency", type=int, default=1, help="dialogs shown side by side, the others wait in the queue")
+    parser.add_argument("--token", help="token the clients must send. Defaults to DIALOGER_TOKEN, or a random one over TCP.")
+    parser.add_argument("--allow-remote", action="store_true", help="listen on a TCP address that isn't a loopback one")
+    args = parser.parse_args()
+    if not args.address:
+        parser.error("give the address or set DIALOGER_SERVER")
+    shown = dispatcher(concurrency=args.concurrency)
+    listening = server(args.address, shown, args.token, args.allow_remote)
+    if listening.token and not (args.token or os.environ.get("DIALOGER_TOKEN")):
+        print(f"DIALOGER_TOKEN={listening.token}", flush=True)
+    try:
+        listening.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        shown.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,199 @@
+import hashlib
+import json
+import os
+import sys
+import threading
+import time
+
+class store:
+    """
+    Answers remembered with "Don't ask again", in a JSON file shared by the processes of the user
+
+    A dialog is identified by a signature of its function, title, message and choices, so the answer of a dialog
+    is only reused for the very same question. The file is read again when another process changed it, and
+    written to a temporary file renamed over the old one, so a crash never leaves it half written.
+    """
+
+    _instance = None
+
+    def __init__(self, path=None, ttl=None):
+        """Initialize the class
+
+        Args:
+            path (str | os.PathLike, optional): JSON file. Defaults to the DIALOGER_STORE environment variable,
+                or answers.json in the dialoger folder of the user's configuration.
+            ttl (float, optional): seconds an answer is remembered when the dialog doesn't say. Defaults to None, forever.
+        """
+        self.path = os.fspath(path) if path is not None else self.default_path()
+        self.ttl = ttl
+        self.lock = threading.Lock()
+        self.answers = {}
+        self.loaded = None
+
+    @classmethod
+    def get(cls):
+        """Return the process-wide store, creating it on first use"""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    @staticmethod
+    def default_path() -> str:
+        """File of the process-wide store"""
+        path = os.environ.get("DIALOGER_STORE")
+        if path:
+            return path
+        if sys.platform == "win32":
+            base = os.environ.get("APPDATA") or os.path.expanduser("~")
+        elif sys.platform == "darwin":
+            base = os.path.expanduser("~/Library/Application Support")
+        else:
+            base = os.environ.get("XDG_CONFIG_HOME") or os.path.expanduser("~/.config")
+        return os.path.join(base, "dialoger", "answers.json")
+
+    @staticmethod
+    def signature(kind: str, title: str, message: str, choices) -> str:
+        """
+        Identify a dialog
+
+        Args:
+            kind (str): function showing the dialog: confirm or askwithanswers
+            title (str): title
+            message (str): message or question
+            choices (list): choices
+
+        Returns:
+            str: the same text for the same dialog, in every process
+        """
+        text = json.dumps([kind, title, str(message), [str(choice) for choice in choices]], ensure_ascii=False)
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    def load(self) -> None:
+        """Read the file, if it changed since it was last read"""
+        try:
+            stamp = os.stat(self.path).st_mtime_ns
+        except OSError:
+            self.answers = {}
+            self.loaded = None
+            return
+        if stamp == self.loaded:
+            return
+        try:
+            with open(self.path, encoding="utf-8") as file:
+                answers = json.load(file).get("answers", {})
+        except (OSError, ValueError, AttributeError):
+            # A damaged file is the same as no file, it is replaced by the next save
+            answers = {}
+        self.answers = answers if isinstance(answers, dict) else {}
+        self.loaded = stamp
+
+    def save(self) -> None:
+        """Write the answers that didn't expire, replacing the file at once"""
+        import tempfile
+        now = time.time()
+        self.answers = {key: entry for key, entry in self.answers.items() if not self.expired(entry, now)}
+        folder = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(folder, exist_ok=True)
+        handle, temporary = tempfile.mkstemp(prefix=".answers-", suffix=".tmp", dir=folder)
+        try:
+            with os.fdopen(handle, "w", encoding="utf-8") as file:
+                json.dump({"version": 1, "answers": self.answers}, file, ensure_ascii=False, indent=1)
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(temporary, self.path)
+        except BaseException:
+            os.unlink(temporary)
+            raise
+        self.loaded = os.stat(self.path).st_mtime_ns
+
+    @staticmethod
+    def expired(entry: dict, now: float = None) -> bool:
+        """Check if a remembered answer expired"""
+        expires = entry.get("expires")
+        return expires is not None and expires <= (time.time() if now is None else now)
+
+    def recall(self, kind: str, title: str, message: str, choices):
+        """
+        Find the remembered answer of a dialog
+
+        Args:
+            kind (str): function showing the dialog: confirm or askwithanswers
+            title (str): title
+            message (str): message or question
+            choices (list): choices
+
+        Returns:
+            tuple: (True, answer) if the answer is remembered, (False, None) otherwise
+        """
+        with self.lock:
+            self.load()
+            entry = self.answers.get(self.signature(kind, title, message, choices))
+        if entry is None or self.expired(entry):
+            return False, None
+        return True, entry["answer"]
+
+    def remember(self, kind: str, title: str, message: str, choices, answer, ttl=None) -> None:
+        """
+        Remember the answer of a dialog
+
+        Args:
+            kind (str): function showing the dialog: confirm or askwithanswers
+            title (str): title
+            message (str): message or question
+            choices (list): choices
+            answer (any): answer, as returned by the function
+            ttl (float, optional): seconds to remember it. Defaults to None, the ttl of the store.
+        """
+        ttl = self.ttl if ttl is None else ttl
+        entry = {"answer": answer, "kind": kind, "title": title, "saved": time.time(), "expires": time.time() + ttl if ttl is not None else None}
+        with self.lock:
+            self.load()
+            self.answers[self.signature(kind, title, message, choices)] = entry
+            self.save()
+
+    def forget(self, kind: str = None, title: str = None, message: str = None, choices=None) -> int:
+        """
+        Forget remembered answers, so their dialogs are shown again
+
+        With the kind, title, message and choices of a dialog, only its answer is forgotten. With the kind and/or
+        title alone, every answer of that kind and/or title. With nothing, every answer.
+
+        Args:
+            kind (str, optional): function showing the dialog. Defaults to None.
+            title (str, optional): title. Defaults to None.
+            message (str, optional): message or question. Defaults to None.
+            choices (list, optional): choices. Defaults to None.
+
+        Returns:
+            int: number of answers forgotten
+        """
+        with self.lock:
+            self.load()
+            if message is not None or choices is not None:
+                assert kind is not None and title is not None and message is not None and choices is not None, "Give the kind, title, message and choices of the dialog."
+                keys = [self.signature(kind, title, message, choices)]
+            else:
+                keys = [key for key, entry in self.answers.items() if kind in (None, entry.get("kind")) and title in (None, entry.get("title"))]
+            keys = [key for key in keys if key in self.answers]
+            for key in keys:
+                del self.answers[key]
+            if keys:
+                self.save()
+        return len(keys)
+
+
+def keep(kind: str, title: str, message: str, choices, answer, remember) -> None:
+    """
+    Remember the answer of a dialog whose "Don't ask again" was ticked
+
+    Args:
+        kind (str): function showing the dialog: confirm or askwithanswers
+        title (str): title
+        message (str): message or question
+        choices (list): choices
+        answer (any): answer, not remembered if None (cancelled)
+        remember (bool | float): remember argument of the function, True or a number of seconds to remember it
+    """
+    if answer is None:
+        return
+    store.get().remember(kind, title, message, choices, answer, None if remember is True else remember)
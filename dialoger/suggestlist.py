@@ -0,0 +1,117 @@
+import tkinter as tk
+from dialoger.search import index
+
+class suggestlist:
+    """Drop-down list under an entry with the suggestions starting with its text"""
+
+    rows = 8
+
+    def __init__(self, master, entry, on_fill):
+        """Initialize the class
+
+        Args:
+            master (tk.Misc): parent widget, the frame of the entry
+            entry (tk.Entry): entry the suggestions complete
+            on_fill (callable): function called after a suggestion is put in the entry
+        """
+        self.entry = entry
+        self.on_fill = on_fill
+        self.index = index([])
+        self.matches = []
+        self.query = None
+        self.job = None
+        self.listbox = tk.Listbox(master, height=self.rows, activestyle="none", exportselection=False)
+        self.listbox.bind("<ButtonRelease-1>", lambda event: self.fill())
+
+    def load(self, suggestions: index):
+        """
+        Use new suggestions, hidden until the text of the entry changes
+
+        Args:
+            suggestions (index): index of the suggestions, see dialoger.search.cached
+        """
+        suggestions.sort()
+        self.index = suggestions
+        self.query = self.entry.get()
+        self.hide()
+
+    def schedule(self, event=None):
+        """Refresh once the pending keystrokes are handled, so fast typing only searches for the last text"""
+        if self.job is None:
+            self.job = self.entry.after_idle(self.refresh)
+
+    def refresh(self):
+        """Show the suggestions starting with the text of the entry, if it changed"""
+        self.job = None
+        query = self.entry.get()
+        if query == self.query:
+            return
+        self.query = query
+        # A prefix search in the sorted keys costs the same with 100 or 100k suggestions
+        self.matches = self.index.prefix(query, self.rows) if query else []
+        if not self.matches or (len(self.matches) == 1 and self.index.labels[self.matches[0]] == query):
+            self.hide()
+            return
+        self.listbox.delete(0, tk.END)
+        self.listbox.insert(tk.END, *[self.index.labels[i] for i in self.matches])
+        self.listbox.config(height=len(self.matches))
+        if not self.listbox.winfo_ismapped():
+            self.listbox.pack(after=self.entry, fill=tk.X, padx=10, pady=(0, 15))
+
+    def hide(self):
+        """Hide the list"""
+        self.matches = []
+        self.listbox.selection_clear(0, tk.END)
+        self.listbox.pack_forget()
+
+    def key(self, event):
+        """
+        Handle the keys of the entry that act on the list
+
+        Args:
+            event (event): key press event in the entry
+
+        Returns:
+            str: "break" if the key was used by the list, None otherwise
+        """
+        if not self.matches:
+            return None
+        if event.keysym in ("Down", "Up"):
+            selection = self.listbox.curselection()
+            if selection:
+                current = selection[0] + (1 if event.keysym == "Down" else -1)
+            else:
+                current = 0 if event.keysym == "Down" else len(self.matches) - 1
+            self.listbox.selection_clear(0, tk.END)
+            self.listbox.selection_set(current % len(self.matches))
+            self.listbox.see(current % len(self.matches))
+            return "break"
+        if event.keysym in ("Return", "KP_Enter", "Tab") and self.listbox.curselection():
+            self.fill()
+            return "break"
+        if event.keysym == "Escape":
+            self.hide()
+            return "break"
+        return None
+
+    def fill(self):
+        """Put the selected suggestion in the entry"""
+        selection = self.listbox.curselection()
+        if not selection:
+            return
+        label = self.index.labels[self.matches[selection[0]]]
+        self.entry.delete(0, tk.END)
+        self.entry.insert(0, label)
+        self.entry.icursor(tk.END)
+        self.query = self.entry.get()
+        self.hide()
+        self.entry.focus_set()
+        self.on_fill()
+
+    def stop(self):
+        """Cancel the pending refresh, hide the list and forget the suggestions until the next load"""
+        if self.job is not None:
+            self.entry.after_cancel(self.job)
+            self.job = None
+        self.index = index([])
+        self.hide()
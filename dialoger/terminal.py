@@ -0,0 +1,271 @@
+import getpass
+import os
+import sys
+import time
+from dialoger.backends import backend, body, expired, keep
+from dialoger.field import FIELD, field
+from dialoger.search import cached, index
+
+class terminal(backend):
+    """Backend asking the questions on the terminal, for sessions without a display"""
+
+    # Labels printed before the title of a message
+    LABELS = {"alert": "ALERT", "info": "INFO", "error": "ERROR", "success": "SUCCESS", "question": "?"}
+
+    # Most matches listed when a typed text matches several choices
+    max_matches = 20
+
+    def __init__(self, stdin=None, stdout=None):
+        """Initialize the class
+
+        Args:
+            stdin (file, optional): stream the answers are read from. Defaults to sys.stdin.
+            stdout (file, optional): stream the questions are written to. Defaults to sys.stdout.
+        """
+        self.stdin = stdin
+        self.stdout = stdout
+
+    def write(self, text: str) -> None:
+        """Write a text to the output"""
+        stdout = self.stdout or sys.stdout
+        stdout.write(text)
+        stdout.flush()
+
+    def read(self, prompt: str, secret: bool = False, deadline: float = None):
+        """
+        Read one line of input
+
+        Args:
+            prompt (str): text shown before the input
+            secret (bool, optional): don't echo the input, when reading from a terminal. Defaults to False.
+            deadline (float, optional): time.monotonic() after which to stop waiting. Defaults to None, no limit.
+
+        Raises:
+            TimeoutError: nothing was typed before the deadline
+
+        Returns:
+            str: the line without its line break, None at the end of the input
+        """
+        stdin = self.stdin or sys.stdin
+        if secret and stdin.isatty():
+            # getpass can't be interrupted, the deadline only applies to echoed input
+            try:
+                return getpass.getpass(prompt, stream=self.stdout)
+            except EOFError:
+                return None
+        self.write(prompt)
+        if deadline is not None and not self.ready(stdin, deadline):
+            self.write("\n")
+            raise TimeoutError("No answer in time")
+        line = stdin.readline()
+        if not line:
+            self.write("\n")
+            return None
+        return line.rstrip("\r\n")
+
+    @staticmethod
+    def ready(stdin, deadline: float) -> bool:
+        """
+        Wait until there is input to read
+
+        On Windows, where select only waits on sockets, the console is polled with msvcrt.kbhit, so the wait ends
+        at the first key pressed rather than at the end of the line. Streams that can't be waited on (files in
+        memory, pipes on Windows) are always ready, the timeout doesn't apply to them.
+
+        Args:
+            stdin (file): input stream
+            deadline (float): time.monotonic() after which to stop waiting
+
+        Returns:
+            bool: True if there is input, False if the deadline passed first
+        """
+        if sys.platform == "win32":
+            if not (hasattr(stdin, "isatty") and stdin.isatty()):
+                return True
+            import msvcrt
+            while not msvcrt.kbhit():
+                if time.monotonic() >= deadline:
+                    return False
+                time.sleep(0.05)
+            return True
+        try:
+            stdin.fileno()
+        except (AttributeError, OSError, ValueError):
+            return True
+        import select
+        return bool(select.select([stdin], [], [], max(0, deadline - time.monotonic()))[0])
+
+    @staticmethod
+    def deadline(timeout):
+        """time.monotonic() after which to stop waiting, None without a timeout"""
+        return None if timeout is None else time.monotonic() + timeout
+
+    def header(self, title: str, icon: str) -> None:
+        """Write the title of a dialog"""
+        self.write(f"\n[{self.LABELS.get(icon, icon)}] {title}\n")
+
+    def prompt(self, question, rules: field, answer_default=None, allow_cancel=True, deadline=None, suggestions=None):
+        """
+        Ask for an answer until it is valid
+
+        Args:
+            question (str): question
+            rules (field): rules of the answer
+            answer_default (str, optional): answer when the line is left empty. Defaults to None.
+            allow_cancel (bool, optional): allow cancel with the end of the input (Ctrl+D). Defaults to True.
+            deadline (float, optional): time.monotonic() after which to stop waiting, see read. Defaults to None.
+            suggestions (index, optional): the only answers accepted, besides an empty one. Defaults to None, any.
+
+        Returns:
+            str: the formatted answer, None if cancelled
+        """
+        hint = f" ({rules.pattern})" if rules.pattern else ""
+        default = f" [{answer_default}]" if answer_default not in (None, "") and not rules.validator.show else ""
+        while True:
+            text = self.read(f"{question}{hint}{default}: ", secret=bool(rules.validator.show), deadline=deadline)
+            if text is None:
+                if allow_cancel:
+                    return None
+                raise EOFError(f"No answer to '{question}' and it can't be cancelled")
+            if text == "" and answer_default is not None:
+                text = str(answer_default)
+            if rules.mask is not None:
+                text = rules.mask.format(text)
+            if not (rules.accepts(text) and rules.valid(text)):
+                self.write("Invalid answer, try again.\n")
+            elif suggestions is not None and text != "" and text not in suggestions:
+                matches = suggestions.prefix(text, self.max_matches)
+                self.write("Type one of the suggestions" + (": " + ", ".join(suggestions.labels[i] for i in matches) if matches else ".") + "\n")
+            else:
+                return text
+
+    def ask(self, title, question, answer_type, answer_default=None, pattern=None, allow_empty=True, allow_cancel=True, entrance_width=35, typed=False, timeout=None, on_timeout=None, suggestions=None, suggestions_only=False):
+        """Ask a question, see dialoger.ask"""
+        self.header(title, "question")
+        rules = field(answer_type, pattern, allow_empty)
+        try:
+            restrict = cached(suggestions) if suggestions_only and suggestions is not None else None
+            answer = self.prompt(question, rules, answer_default, allow_cancel, self.deadline(timeout), restrict)
+        except TimeoutError:
+            return expired(on_timeout, rules.default(answer_default, typed))
+        if answer is not None and typed:
+            return rules.parse(answer)
+        return answer
+
+    def form(self, title, fields, message=None, allow_cancel=True, entrance_width=35, timeout=None, on_timeout=None):
+        """Ask several questions at once, see dialoger.form"""
+        self.header(title, "question")
+        if message:
+            self.write(f"{message}\n")
+        deadline = self.deadline(timeout)
+        specs = []
+        for spec in fields:
+            spec = {"question": spec} if isinstance(spec, str) else spec
+            assert set(spec) <= set(FIELD), f"Unknown field options: {', '.join(set(spec) - set(FIELD))}"
+            spec = dict(FIELD, **spec)
+            if spec["name"] is None:
+                spec["name"] = spec["question"]
+            specs.append((spec, field(spec["answer_type"], spec["pattern"], spec["allow_empty"])))
+        answers = {}
+        for spec, rules in specs:
+            try:
+                answer = self.prompt(spec["question"], rules, spec["answer_default"], allow_cancel, deadline)
+            except TimeoutError:
+                # The whole form times out, like its window, with the defaults of every field
+                return expired(on_timeout, {spec["name"]: rules.default(spec["answer_default"], spec["typed"]) for spec, rules in specs})
+            if answer is None:
+                return None
+            answers[spec["name"]] = rules.parse(answer) if spec["typed"] else answer
+        return answers
+
+    def choose(self, question, choices, deadline=None):
+        """
+        List the choices and ask for one, by number or by (part of) its text
+
+        Args:
+            question (str): question
+            choices (list): list of choices
+            deadline (float, optional): time.monotonic() after which to stop waiting, see read. Defaults to None.
+
+        Returns:
+            str: choice, None if cancelled
+        """
+        self.write(f"{question}\n")
+        for number, choice in enumerate(choices, 1):
+            self.write(f"  {number}) {choice}\n")
+        search = index(choices)
+        while True:
+            text = self.read("> ", deadline=deadline)
+            if text is None:
+                return None
+            text = text.strip()
+            if text.isdigit() and 1 <= int(text) <= len(choices):
+                return choices[int(text) - 1]
+            matches = search.search(text) if text else []
+            exact = [i for i in matches if search.keys[i] == text.casefold()]
+            if len(exact) == 1 or len(matches) == 1:
+                return choices[(exact or matches)[0]]
+            if matches:
+                self.write("Several choices match:\n")
+                for i in matches[:self.max_matches]:
+                    self.write(f"  {i + 1}) {choices[i]}\n")
+            else:
+                self.write("Type the number or the text of a choice.\n")
+
+    def ask_again(self) -> bool:
+        """Ask if a choice should be remembered, as the "Don't ask again" check box of the windows"""
+        return (self.read("Don't ask again? [y/N] ") or "").strip().casefold() in ("y", "yes")
+
+    def askwithanswers(self, title, question, choices, orientation='horizontal', timeout=None, on_timeout=None, remember=False):
+        """Ask to pick one of the choices, see dialoger.askwithanswers"""
+        self.header(title, "question")
+        try:
+            choice = self.choose(question, list(choices), self.deadline(timeout))
+        except TimeoutError:
+            return expired(on_timeout)
+        if remember and choice is not None and self.ask_again():
+            keep("askwithanswers", title, question, choices, choice, remember)
+        return choice
+
+    def confirm(self, title, message, choices, timeout=None, on_timeout=False, remember=False):
+        """Ask to pick one of two choices, True for the first one, see dialoger.confirm"""
+        self.header(title, "question")
+        try:
+            choice = self.choose(message, list(choices), self.deadline(timeout))
+        except TimeoutError:
+            return expired(on_timeout)
+        if remember and choice is not None and self.ask_again():
+            keep("confirm", title, message, choices, choice == choices[0], remember)
+        return choice == choices[0]
+
+    def progress(self, title, message, iterable=None, total=None, icon="info", fps=10):
+        """Write the progress of a job on one line, rewritten at most fps times a second"""
+        from dialoger.tracker import tracker
+        self.header(title, icon)
+        if message:
+            self.write(f"{message}\n")
+
+        def draw(job):
+            fraction = job.fraction()
+            self.write(f"\r{job.count:,}" + (f" / {job.total:,} ({fraction:.0%})" if fraction is not None else ""))
+
+        def close(job):
+            draw(job)
+            self.write(" cancelled\n" if job.cancelled else "\n")
+
+        return tracker(iterable, total, fps, on_draw=draw, on_close=close)
+
+    def message(self, title, message, icon, timeout=None):
+        """Write a message, streaming files (given as path objects, a string is the text) and iterables of lines"""
+        self.header(title, icon)
+        message = body(message)
+        if isinstance(message, str):
+            self.write(f"{message}\n")
+        elif isinstance(message, os.PathLike):
+            with open(message, encoding="utf-8", errors="replace") as file:
+                for line in file:
+                    self.write(line)
+        elif message is not None:
+            for line in message:
+                line = str(line)
+                self.write(line if line.endswith("\n") else line + "\n")
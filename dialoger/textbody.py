@@ -0,0 +1,112 @@
+import os
+import tkinter as tk
+from dialoger.backends import body
+
+class textbody:
+    """Read-only scrollable text for long messages, filled in chunks from the event loop"""
+
+    # Characters inserted at each step
+    chunk_size = 64 * 1024
+
+    def __init__(self, master):
+        """Initialize the class
+
+        Args:
+            master (tk.Misc): parent widget
+        """
+        self.job = None
+        self.source = None
+        self.frame = tk.Frame(master, background="white")
+        self.text = tk.Text(self.frame, width=80, height=20, wrap=tk.WORD, relief=tk.FLAT, background="white", state=tk.DISABLED)
+        self.scrollbar = tk.Scrollbar(self.frame, orient=tk.VERTICAL, command=self.text.yview)
+        self.text.config(yscrollcommand=self.scrollbar.set)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.text.pack(side=tk.LEFT, expand=True, fill=tk.BOTH)
+
+    @staticmethod
+    def is_long(message, threshold: int) -> bool:
+        """
+        Check if a message should be shown in a text body instead of a label
+
+        Args:
+            message (str | os.PathLike | iterable): message, see dialoger.backends.body
+            threshold (int): longest text shown in a label
+
+        Returns:
+            bool: True for texts longer than the threshold, files and iterables of lines
+        """
+        message = body(message)
+        if message is None:
+            return False
+        return not isinstance(message, str) or len(message) > threshold
+
+    def chunks(self, message):
+        """
+        Split a message in chunks of about chunk_size characters
+
+        Args:
+            message (str | os.PathLike | iterable): text, path object (not a string) of a text file or iterable of lines
+
+        Yields:
+            str: chunks of the message
+        """
+        message = body(message)
+        if isinstance(message, str):
+            for start in range(0, len(message), self.chunk_size):
+                yield message[start:start + self.chunk_size]
+        elif isinstance(message, os.PathLike):
+            with open(message, encoding="utf-8", errors="replace") as file:
+                while True:
+                    chunk = file.read(self.chunk_size)
+                    if not chunk:
+                        break
+                    yield chunk
+        else:
+            lines = []
+            size = 0
+            for line in message:
+                line = str(line)
+                lines.append(line if line.endswith("\n") else line + "\n")
+                size += len(line)
+                if size >= self.chunk_size:
+                    yield "".join(lines)
+                    lines = []
+                    size = 0
+            if lines:
+                yield "".join(lines)
+
+    def load(self, message):
+        """
+        Clear the text and start filling it with a new message
+
+        Args:
+            message (str | os.PathLike | iterable): text, path object (not a string) of a text file or iterable of lines
+        """
+        self.stop()
+        self.text.config(state=tk.NORMAL)
+        self.text.delete("1.0", tk.END)
+        self.text.config(state=tk.DISABLED)
+        self.source = self.chunks(message)
+        self.fill()
+
+    def fill(self):
+        """Insert the next chunk and schedule the following one"""
+        self.job = None
+        try:
+            chunk = next(self.source)
+        except StopIteration:
+            self.source = None
+            return
+        self.text.config(state=tk.NORMAL)
+        self.text.insert(tk.END, chunk)
+        self.text.config(state=tk.DISABLED)
+        self.job = self.text.after(1, self.fill)
+
+    def stop(self):
+        """Stop filling the text, closing the file being read if any"""
+        if self.job is not None:
+            self.text.after_cancel(self.job)
+            self.job = None
+        if self.source is not None:
+            self.source.close()
+            self.source = None
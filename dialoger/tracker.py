@@ -0,0 +1,136 @@
+import threading
+import time
+
+class tracker:
+    """
+    Progress of a job, counted from any thread and drawn at a capped frame rate
+
+    The job either iterates over the tracker, which yields the items of the iterable it wraps, or calls
+    advance(), from any thread. Counting only adds to a number; the progress is drawn at most `fps` times a
+    second, and only on the thread that created the tracker (the one owning the window), however fast the items
+    come. When other threads do the work, that thread calls join() to keep drawing. The clock is only read every
+    `stride` items, a number adapted so it is read a few dozen times per frame.
+    """
+
+    def __init__(self, iterable=None, total=None, fps=10, on_draw=None, on_close=None):
+        """Initialize the class
+
+        Args:
+            iterable (iterable, optional): items of the job, yielded by iterating over the tracker. Defaults to None.
+            total (int, optional): number of items. Defaults to the length of the iterable, if it has one.
+            fps (float, optional): most redraws per second. Defaults to 10.
+            on_draw (callable, optional): function receiving the tracker to draw it. Defaults to None.
+            on_close (callable, optional): function receiving the tracker when it is closed. Defaults to None.
+        """
+        self.iterable = iterable
+        if total is None and iterable is not None and hasattr(iterable, "__len__"):
+            total = len(iterable)
+        self.total = total
+        self.count = 0
+        self.interval = 1 / fps
+        self.on_draw = on_draw
+        self.on_close = on_close
+        self.owner = threading.get_ident()
+        self.lock = threading.Lock()
+        self.cancelled = False
+        self.closed = False
+        self.next_frame = 0.0
+        self.stride = 1
+        self.countdown = 1
+        self.checked = time.perf_counter()
+
+    def __iter__(self):
+        assert self.iterable is not None, "The tracker has no iterable, call advance() instead."
+        try:
+            # The count is only changed by this loop, no lock is needed
+            countdown = self.stride
+            for item in self.iterable:
+                yield item
+                self.count += 1
+                countdown -= 1
+                if not countdown:
+                    # Drawn only by the thread that created the tracker, another one iterating relies on join()
+                    if threading.get_ident() == self.owner:
+                        self.check()
+                    if self.cancelled or self.closed:
+                        break
+                    countdown = self.stride
+        finally:
+            self.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def advance(self, n: int = 1) -> bool:
+        """
+        Count items done, from any thread
+
+        Args:
+            n (int, optional): number of items. Defaults to 1.
+
+        Returns:
+            bool: False once the job was cancelled, so the producer can stop
+        """
+        with self.lock:
+            self.count += n
+            self.countdown -= 1
+            if self.countdown > 0:
+                return not self.cancelled
+            self.countdown = self.stride
+        if threading.get_ident() == self.owner:
+            self.check()
+        return not self.cancelled
+
+    def fraction(self) -> float:
+        """Part of the job done, between 0 and 1, None without a total"""
+        if not self.total:
+            return None
+        return min(self.count / self.total, 1.0)
+
+    def check(self):
+        """Adapt the stride to the speed of the items and draw if a frame is due"""
+        now = time.perf_counter()
+        elapsed = now - self.checked
+        self.checked = now
+        if elapsed < self.interval / 50:
+            self.stride = min(self.stride * 2, 1 << 16)
+        elif elapsed > self.interval / 10 and self.stride > 1:
+            self.stride //= 2
+        if now >= self.next_frame:
+            self.draw()
+
+    def draw(self):
+        """Draw the progress now, on the thread that created the tracker"""
+        self.next_frame = time.perf_counter() + self.interval
+        if self.on_draw is not None and not self.closed:
+            self.on_draw(self)
+
+    def cancel(self) -> None:
+        """Cancel the job, advance() returns False and the iteration stops"""
+        self.cancelled = True
+
+    def join(self) -> bool:
+        """
+        On the thread that created the tracker: keep drawing while other threads advance, until the total is
+        reached or the job is cancelled or closed, then close
+
+        Returns:
+            bool: False if the job was cancelled
+        """
+        while not (self.closed or self.cancelled or (self.total is not None and self.count >= self.total)):
+            self.draw()
+            time.sleep(self.interval)
+        # The last items may have come after the last frame, or before the first one
+        self.draw()
+        self.close()
+        return not self.cancelled
+
+    def close(self) -> None:
+        """Stop drawing, once the job is done or cancelled. From another thread, the window is closed by the thread that created the tracker."""
+        self.closed = True
+        if self.on_close is not None and threading.get_ident() == self.owner:
+            on_close, self.on_close = self.on_close, None
+            on_close(self)
@@ -0,0 +1,166 @@
+import ipaddress
+import re
+
+# Name of the Tcl command shared by the entries of every dialog in an interpreter
+COMMAND = "dialoger_validate"
+
+# Validation callbacks of the attached entries, by interpreter and widget path
+_entries = {}
+
+
+class validator:
+    """Answer type compiled once: checks the text on every keystroke and parses the final answer"""
+
+    def __init__(self, partial=None, final=None, convert=None, show=""):
+        """Initialize the class
+
+        Args:
+            partial (str | callable, optional): regular expression or function the text must match while it is typed. Defaults to anything.
+            final (str | callable, optional): regular expression or function the answer must match. Defaults to partial.
+            convert (callable, optional): function turning the answer into a typed value, raising ValueError if it can't. Defaults to None, the text itself.
+            show (str, optional): character shown instead of the typed ones. Defaults to "".
+        """
+        self.partial = self.compile(partial)
+        self.final = self.compile(final) if final is not None else self.partial
+        self.convert = convert
+        self.show = show
+
+    @staticmethod
+    def compile(rule):
+        """Turn a regular expression into a function checking the whole text"""
+        if rule is None:
+            return lambda value: True
+        if isinstance(rule, str):
+            fullmatch = re.compile(rule).fullmatch
+            return lambda value: fullmatch(value) is not None
+        return rule
+
+    def accepts(self, value: str) -> bool:
+        """
+        Check the text while it is typed
+
+        Args:
+            value (str): text the entry would have after the keystroke
+
+        Returns:
+            bool: True if the keystroke is accepted, False otherwise
+        """
+        return value == "" or bool(self.partial(value))
+
+    def valid(self, value: str) -> bool:
+        """
+        Check the final answer
+
+        Args:
+            value (str): answer
+
+        Returns:
+            bool: True if the answer is valid, False otherwise
+        """
+        if not self.final(value):
+            return False
+        try:
+            self.parse(value)
+        except (ValueError, TypeError):
+            return False
+        return True
+
+    def parse(self, value: str):
+        """
+        Convert the answer to its type
+
+        Args:
+            value (str): answer
+
+        Returns:
+            any: the typed answer
+        """
+        return self.convert(value) if self.convert else value
+
+
+def number_range(low, high, integer=True) -> validator:
+    """
+    Create a validator for numbers between two limits, both included
+
+    Args:
+        low (int | float): lowest accepted number
+        high (int | float): highest accepted number
+        integer (bool, optional): accept only integers. Defaults to True.
+
+    Returns:
+        validator: the validator, to be registered with a name
+    """
+    base = _types["int" if integer else "float"]
+
+    def convert(value):
+        number = base.parse(value)
+        if not low <= number <= high:
+            raise ValueError(f"{number} is not between {low} and {high}")
+        return number
+
+    return validator(base.partial, base.final, convert)
+
+
+def register(name: str, rule: validator) -> None:
+    """
+    Register an answer type, usable as answer_type in ask
+
+    Args:
+        name (str): answer type
+        rule (validator): validator of the type
+    """
+    _types[name] = rule
+
+
+def get(name: str) -> validator:
+    """
+    Find the validator of an answer type, unknown types are free text
+
+    Args:
+        name (str): answer type
+
+    Returns:
+        validator: the validator
+    """
+    return _types.get(name, _types["str"])
+
+
+def attach(entry, callback) -> None:
+    """
+    Validate the keystrokes of an entry with a callback, through one Tcl command shared by all entries
+
+    Args:
+        entry (tk.Entry): entry
+        callback (callable): function receiving the text the entry would have and returning if it is accepted
+    """
+    if not entry.tk.call('info', 'commands', COMMAND):
+        entry.tk.createcommand(COMMAND, lambda path, value, app=entry.tk: _validate(app, path, value))
+    _entries[(entry.tk, str(entry))] = callback
+    entry.config(validate="key", validatecommand=(COMMAND, '%W', '%P'))
+
+
+def _validate(app, path, value):
+    """Run the callback of the entry being edited"""
+    callback = _entries.get((app, path))
+    return callback(value) if callback else True
+
+
+def detach(entry) -> None:
+    """
+    Stop validating the keystrokes of an entry
+
+    Args:
+        entry (tk.Entry): entry
+    """
+    _entries.pop((entry.tk, str(entry)), None)
+
+
+_types = {
+    "str": validator(),
+    "password": validator(show="*"),
+    "alphanumeric": validator(str.isalnum),
+    "int": validator(r"[+-]?[0-9]*", r"[+-]?[0-9]+", int),
+    "float": validator(r"[+-]?[0-9]*\.?[0-9]*([eE][+-]?[0-9]*)?", r"[+-]?([0-9]+\.?[0-9]*|\.[0-9]+)([eE][+-]?[0-9]+)?", float),
+    "email": validator(r"\S*", r"[^@\s]+@[^@\s]+\.[^@\s]+"),
+    "ipv4": validator(r"[0-9]{1,3}(\.[0-9]{0,3}){0,3}", r"[0-9]{1,3}(\.[0-9]{1,3}){3}", ipaddress.IPv4Address),
+}
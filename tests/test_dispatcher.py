@@ -0,0 +1,11 @@
+import pytest
+
+pytest.importorskip("tkinter")
+
+from dialoger.dispatcher import dispatcher
+
+
+def test_concurrency_must_allow_a_dialog():
+    with pytest.raises(AssertionError):
+        dispatcher(concurrency=0)
+    assert dispatcher(concurrency=2).concurrency == 2
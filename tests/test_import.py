@@ -0,0 +1,34 @@
+import importlib.util
+import os
+import subprocess
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def loaded_after(code):
+    """Modules of tkinter loaded by code run in a new interpreter"""
+    check = code + "\nimport sys\nprint(' '.join(name for name in sys.modules if name.split('.')[0] in ('tkinter', '_tkinter')))"
+    result = subprocess.run([sys.executable, "-c", check], cwd=ROOT, capture_output=True, text=True, check=True)
+    return result.stdout.split()
+
+
+def test_import_does_not_load_tkinter():
+    assert loaded_after("import dialoger") == []
+
+
+def test_scripted_dialogs_do_not_load_tkinter():
+    assert loaded_after("""
+import dialoger
+from dialoger.scripted import scripted
+dialoger.backends.use(scripted(["Ana", True]))
+dialoger.ask("Sign up", "Name", "str")
+dialoger.confirm("Sign up", "Save?")
+""") == []
+
+
+@pytest.mark.skipif(importlib.util.find_spec("_tkinter") is None, reason="tkinter is not installed")
+def test_first_dialog_class_loads_tkinter():
+    assert "tkinter" in loaded_after("import dialoger; dialoger.options")
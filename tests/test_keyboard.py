@@ -0,0 +1,158 @@
+"""
+Keyboard navigation: arrows, Tab, Return and Escape sent to real dialogs as key events
+
+Each test shows a dialog without waiting, sends keys to the widget focused in it and checks the focus and the
+result, through the real bindings. The mapping of the keys and the handlers are tested without a display in
+test_keys.py. Needs a display: without DISPLAY, an Xvfb server is started if there is one, else they are skipped.
+"""
+import os
+import shutil
+import subprocess
+import sys
+import time
+
+import pytest
+
+tk = pytest.importorskip("tkinter")
+
+import dialoger
+from dialoger import backends
+from dialoger.engine import engine
+
+
+@pytest.fixture(scope="module", autouse=True)
+def display():
+    server = None
+    if not os.environ.get("DISPLAY") and sys.platform not in ("win32", "darwin"):
+        if shutil.which("Xvfb") is None:
+            pytest.skip("no display and no Xvfb")
+        read, write = os.pipe()
+        server = subprocess.Popen(["Xvfb", "-displayfd", str(write), "-screen", "0", "1024x768x24", "-nolisten", "tcp"], pass_fds=(write,), stderr=subprocess.DEVNULL)
+        os.close(write)
+        with os.fdopen(read) as number:
+            os.environ["DISPLAY"] = ":" + number.readline().strip()
+    try:
+        tk.Tk().destroy()
+    except tk.TclError as error:
+        if server is not None:
+            server.terminate()
+        pytest.skip(f"no display: {error}")
+    previous = backends._current
+    backends.use("tk")
+    yield
+    engine.get().shutdown()
+    backends._current = previous
+    if server is not None:
+        del os.environ["DISPLAY"]
+        server.terminate()
+        server.wait()
+
+
+def settle(seconds=0.4):
+    """Run the event loop until the focus timers of a dialog just shown have run"""
+    root = engine.get().find_root()
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        root.update()
+        time.sleep(0.01)
+
+
+def focused(window):
+    """Widget focused in the window of a dialog"""
+    return window.dialog.focus_lastfor()
+
+
+def press(window, keysym, state=0):
+    """Send a key to the widget focused in the window of a dialog and run the events it triggers"""
+    focused(window).event_generate("<KeyPress>", keysym=keysym, state=state)
+    engine.get().find_root().update()
+
+
+def shown(function, *args, **kwargs):
+    """Show a dialog without waiting, once its focus is set"""
+    handle = function(*args, **kwargs)
+    settle()
+    return handle, handle.dialog
+
+
+def test_arrows_move_between_the_buttons():
+    handle, window = shown(dialoger.show_askwithanswers, "Keys", "Pick one", ["Red", "Green", "Blue"])
+    assert focused(window) == window.buttons[0]
+    press(window, "Right")
+    assert focused(window) == window.buttons[1]
+    press(window, "Right")
+    press(window, "Right")
+    assert focused(window) == window.buttons[0]
+    press(window, "Left")
+    assert focused(window) == window.buttons[2]
+    press(window, "Return")
+    assert handle.result(1) == "Blue"
+
+
+def test_keypad_enter_picks_the_focused_button():
+    handle, window = shown(dialoger.show_askwithanswers, "Keys", "Pick one", ["Red", "Green", "Blue"])
+    press(window, "Right")
+    press(window, "KP_Enter")
+    assert handle.result(1) == "Green"
+
+
+def test_escape_cancels_the_buttons():
+    handle, window = shown(dialoger.show_askwithanswers, "Keys", "Pick one", ["Red", "Green", "Blue"])
+    press(window, "Escape")
+    assert handle.result(1) is None
+
+
+def test_tab_cycles_in_the_input():
+    handle, window = shown(dialoger.show_ask, "Keys", "Name", "str")
+    assert focused(window) == window.answer_entry
+    window.answer_entry.insert(0, "Ana")
+    press(window, "Tab")
+    assert focused(window) == window.button
+    press(window, "Tab")
+    assert focused(window) == window.answer_entry
+    press(window, "Tab", state=0x1)
+    assert focused(window) == window.button
+    window.buttonCancel.focus_set()
+    press(window, "Tab")
+    assert focused(window) == window.answer_entry
+    press(window, "Return")
+    assert handle.result(1) == "Ana"
+
+
+def test_escape_cancels_the_input():
+    handle, window = shown(dialoger.show_ask, "Keys", "Name", "str")
+    press(window, "Escape")
+    assert handle.result(1) is None
+
+
+def test_escape_is_ignored_without_allow_cancel():
+    handle, window = shown(dialoger.show_ask, "Keys", "Name", "str", allow_cancel=False)
+    press(window, "Escape")
+    assert not handle.done()
+    window.answer_entry.insert(0, "Bia")
+    press(window, "Return")
+    assert handle.result(1) == "Bia"
+
+
+def test_return_fills_a_suggestion_before_confirming():
+    handle, window = shown(dialoger.show_ask, "Keys", "Fruit", "str", suggestions=["apple", "apricot", "banana"])
+    window.answer_entry.insert(0, "ap")
+    window.answer_entry.event_generate("<KeyRelease>", keysym="p")
+    settle(0.1)
+    press(window, "Down")
+    press(window, "Down")
+    assert not handle.done()
+    press(window, "Return")
+    assert window.answer_entry.get() == "apricot"
+    assert not handle.done()
+    press(window, "Return")
+    assert handle.result(1) == "apricot"
+
+
+def test_return_in_any_entry_confirms_the_form():
+    handle, window = shown(dialoger.show_form, "Keys", ["Name", "City"])
+    window.rows[0][1].insert(0, "Ana")
+    window.rows[1][1].insert(0, "Recife")
+    window.rows[1][1].focus_set()
+    press(window, "Return")
+    assert handle.result(1) == {"Name": "Ana", "City": "Recife"}
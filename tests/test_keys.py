@@ -0,0 +1,137 @@
+import types
+
+import pytest
+
+pytest.importorskip("tkinter")
+
+from dialoger import input, inputs, keys, options
+
+
+class button:
+    """Stand-in for a widget, recording the focus"""
+
+    focused = None
+
+    def focus_set(self):
+        button.focused = self
+
+
+def event(keysym, state=0, widget=".dialog.button"):
+    return types.SimpleNamespace(keysym=keysym, state=state, widget=widget)
+
+
+@pytest.mark.parametrize("owner, keysym, handler", [
+    (options, "Right", "next_button"),
+    (options, "Left", "previous_button"),
+    (options, "Return", "press_button"),
+    (options, "KP_Enter", "press_button"),
+    (options, "Escape", "escape_pressed"),
+    (input, "Escape", "escape_pressed"),
+    (input, "Return", "enter_pressed"),
+    (input, "KP_Enter", "enter_pressed"),
+    (input, "Tab", "tab_pressed"),
+    (input, "ISO_Left_Tab", "tab_pressed"),
+    (input, "Down", "suggestion_key"),
+    (inputs, "Return", "enter_pressed"),
+    (inputs, "KP_Enter", "enter_pressed"),
+])
+def test_action(owner, keysym, handler):
+    assert keys.action(owner, keysym) == handler
+
+
+def test_unhandled_keys():
+    assert keys.action(options, "a") is None
+    assert keys.action(options, "Tab") is None
+    assert keys.action(inputs, "Escape") is None
+
+
+def test_handlers_exist():
+    for owner in (options, input, inputs):
+        for keysym, handler in owner.keys.items():
+            assert callable(getattr(owner, handler, None)), (owner.__name__, keysym)
+
+
+def test_dispatch_runs_the_handler_with_the_position():
+    calls = []
+    owner = types.SimpleNamespace(keys={"Return": "pressed"}, pressed=lambda event, index: calls.append((event.keysym, index)) or "break")
+    keys._widgets[("app", ".dialog.button")] = (owner, 3)
+    try:
+        assert keys._dispatch("app", event("KP_Enter")) == "break"
+        assert keys._dispatch("app", event("Escape")) is None
+        assert keys._dispatch("other", event("Return")) is None
+    finally:
+        del keys._widgets[("app", ".dialog.button")]
+    assert calls == [("KP_Enter", 3)]
+
+
+def dialog_with_buttons(count):
+    dialog = options.__new__(options)
+    dialog.buttons = [button() for _ in range(count)]
+    dialog.choices = [f"Choice {i}" for i in range(count)]
+    return dialog
+
+
+def test_arrows_cycle_through_the_buttons():
+    dialog = dialog_with_buttons(3)
+    assert dialog.next_button(event("Right"), 0) == "break"
+    assert button.focused is dialog.buttons[1]
+    dialog.next_button(event("Right"), 2)
+    assert button.focused is dialog.buttons[0]
+    dialog.previous_button(event("Left"), 0)
+    assert button.focused is dialog.buttons[2]
+
+
+def test_return_picks_the_choice_of_the_button():
+    dialog = dialog_with_buttons(3)
+    picked = []
+    dialog.set_choice = picked.append
+    dialog.press_button(event("Return"), 1)
+    assert picked == ["Choice 1"]
+
+
+def input_dialog():
+    dialog = input.__new__(input)
+    dialog.suggest_list = None
+    dialog.answer_entry, dialog.button = button(), button()
+    dialog.tab_order = (dialog.answer_entry, dialog.button)
+    dialog.allow_cancel = True
+    return dialog
+
+
+def test_tab_cycles_through_the_entry_and_ok():
+    dialog = input_dialog()
+    assert dialog.tab_pressed(event("Tab"), 0) == "break"
+    assert button.focused is dialog.button
+    dialog.tab_pressed(event("Tab"), 1)
+    assert button.focused is dialog.answer_entry
+    # From Cancel, the next one is the entry
+    dialog.tab_pressed(event("Tab"), 2)
+    assert button.focused is dialog.answer_entry
+
+
+def test_shift_tab_cycles_backwards():
+    dialog = input_dialog()
+    dialog.tab_pressed(event("ISO_Left_Tab"), 0)
+    assert button.focused is dialog.button
+    dialog.tab_pressed(event("Tab", state=0x1), 1)
+    assert button.focused is dialog.answer_entry
+
+
+def test_escape_and_return_in_an_input():
+    dialog = input_dialog()
+    done = []
+    dialog.destroy_window = lambda: done.append("cancel")
+    dialog.set_answer = lambda: done.append("answer")
+    dialog.escape_pressed(event("Escape"), 0)
+    dialog.enter_pressed(event("Return"), 1)
+    dialog.allow_cancel = False
+    dialog.escape_pressed(event("Escape"), 0)
+    assert done == ["cancel", "answer"]
+
+
+def test_the_suggestions_get_the_keys_of_the_entry_first():
+    dialog = input_dialog()
+    dialog.suggest_list = types.SimpleNamespace(key=lambda event: "break")
+    dialog.set_answer = lambda: pytest.fail("Return was given to the list")
+    assert dialog.enter_pressed(event("Return"), 0) == "break"
+    assert dialog.suggestion_key(event("Down"), 1) is None
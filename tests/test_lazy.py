@@ -0,0 +1,61 @@
+import importlib.util
+import os
+import subprocess
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+tk_missing = importlib.util.find_spec("_tkinter") is None
+
+
+def run(code):
+    """Run code in a new interpreter, where no dialog class was loaded yet"""
+    subprocess.run([sys.executable, "-c", code], cwd=ROOT, check=True)
+
+
+def test_classes_stay_bound_after_a_dialog():
+    run("""
+import dialoger
+from dialoger.scripted import scripted
+dialoger.backends.use(scripted(["Ana"]))
+assert dialoger.ask("Sign up", "Name", "str") == "Ana"
+for name in dialoger._lazy:
+    assert isinstance(getattr(dialoger, name), type), name
+""")
+
+
+@pytest.mark.skipif(tk_missing, reason="tkinter is not installed")
+def test_classes_stay_bound_after_the_gui_backend():
+    run("""
+import dialoger
+dialoger.backends.gui().request_ask("Sign up", "Name", "str")
+assert isinstance(dialoger.input, type)
+dialoger.backends.gui().request_message("Sign up", "Done", "info")
+assert isinstance(dialoger.options, type)
+dialoger.backends.gui().request_form("Sign up", ["Name"])
+assert isinstance(dialoger.inputs, type)
+for name in dialoger._lazy:
+    assert isinstance(getattr(dialoger, name), type), name
+""")
+
+
+@pytest.mark.skipif(tk_missing, reason="tkinter is not installed")
+def test_classes_stay_bound_after_importing_the_notifier():
+    run("""
+import dialoger
+import dialoger.notifier
+assert isinstance(dialoger.dispatcher, type) and isinstance(dialoger.options, type)
+assert callable(dialoger.dispatcher.get)
+""")
+
+
+@pytest.mark.skipif(tk_missing, reason="tkinter is not installed")
+def test_classes_stay_bound_after_importing_the_server():
+    run("""
+import dialoger
+import dialoger.server
+assert isinstance(dialoger.dispatcher, type) and isinstance(dialoger.engine, type)
+assert callable(dialoger.dispatcher.get)
+""")
@@ -0,0 +1,63 @@
+from dialoger.mask import mask
+
+CPF = "###.###.###-##"
+
+
+def test_literals_are_inserted():
+    assert mask.compile(CPF).format("12345678901") == "123.456.789-01"
+
+
+def test_trailing_literals_are_removed():
+    assert mask.compile(CPF).format("123") == "123"
+    assert mask.compile(CPF).format("123.") == "123"
+
+
+def test_typed_literals_are_kept():
+    assert mask.compile("##/##/####").apply("01/0", 4) == ("01/0", 4)
+
+
+def test_characters_that_do_not_fit_are_dropped():
+    assert mask.compile(CPF).format("1a2b3") == "123"
+    assert mask.compile("@@-##").format("a1b22") == "ab-22"
+
+
+def test_caret_stays_after_the_same_typed_characters():
+    # The caret after the second digit stays there, the literal is added after it
+    assert mask.compile(CPF).apply("1234", 2) == ("123.4", 2)
+    # The caret after the fourth digit moves past the inserted literal
+    assert mask.compile(CPF).apply("1234", 4) == ("123.4", 5)
+    assert mask.compile("##/##/####").apply("0102", 1) == ("01/02", 1)
+
+
+def test_caret_defaults_to_the_end():
+    assert mask.compile(CPF).apply("12345678901") == ("123.456.789-01", 14)
+
+
+def test_paste_is_truncated_to_the_pattern():
+    assert mask.compile(CPF).apply("1234567890123456789012345") == ("123.456.789-01", 14)
+
+
+def test_escaped_placeholders_are_literals():
+    escaped = mask.compile(r"\#@@-##")
+    assert escaped.length == 6
+    assert escaped.format("ab12") == "#ab-12"
+
+
+def test_escaped_at_and_star_are_literals():
+    assert mask.compile(r"ID\*###").format("123") == "ID*123"
+    assert mask.compile(r"\@@@").format("ab") == "@ab"
+    assert mask.compile(r"\\##").format("12") == "\\12"
+    assert mask.compile(r"ID\*###").complete("ID*123")
+    assert not mask.compile(r"ID\*###").complete("IDa123")
+
+
+def test_complete():
+    cpf = mask.compile(CPF)
+    assert cpf.complete("123.456.789-01")
+    assert not cpf.complete("123.456.789-0")
+    assert not cpf.complete("123-456.789-01")
+    assert not cpf.complete("12a.456.789-01")
+
+
+def test_compiled_masks_are_reused():
+    assert mask.compile(CPF) is mask.compile(CPF)
@@ -0,0 +1,79 @@
+import types
+
+import pytest
+
+pytest.importorskip("tkinter")
+
+from dialoger.notifier import notifier
+
+
+class root:
+    """Stand-in for the Tk root, recording the timers"""
+
+    def __init__(self):
+        self.timers = []
+
+    def after(self, milliseconds, callback):
+        self.timers.append((milliseconds, callback))
+
+
+class shown:
+    """Stand-in for a notification window, recording its message"""
+
+    def __init__(self, message):
+        self.message = message
+
+    def update(self, message):
+        self.message = message
+
+
+def queue(limit=1, interval=5.0):
+    """Notifier whose pump runs at once, with windows that only record their message"""
+    fake_root = root()
+    fake_dispatcher = types.SimpleNamespace(engine=types.SimpleNamespace(find_root=lambda: fake_root), call=lambda function: function())
+    notifications = notifier(limit, interval, dispatcher=fake_dispatcher)
+
+    def open(root, key, title, message, icon, count):
+        notifications.shown[key] = [shown(message), count]
+
+    notifications.open = open
+    return notifications, fake_root
+
+
+def test_limit_must_allow_a_window():
+    with pytest.raises(AssertionError):
+        notifier(limit=0)
+
+
+def test_alike_notifications_are_merged():
+    notifications, _ = queue()
+    notifications.info("Copy", "File 1 copied")
+    notifications.info("Copy", "File 2 copied")
+    (window, count), = notifications.shown.values()
+    assert count == 2
+    # The window shows the last message, with the count
+    assert window.message == "File 2 copied\n\nx 2"
+
+
+def test_other_notifications_wait_for_the_rate_limit():
+    notifications, fake_root = queue(limit=1, interval=5.0)
+    notifications.info("Copy", "Done")
+    notifications.error("Copy", "Failed")
+    assert len(notifications.shown) == 1
+    assert len(notifications.pending) == 1
+    (milliseconds, callback), = fake_root.timers
+    assert 4000 < milliseconds <= 5001
+    # Once the interval is over, the waiting one is shown
+    notifications.opened.clear()
+    callback()
+    assert len(notifications.shown) == 2
+    assert not notifications.pending
+
+
+def test_pump_without_windows_counted():
+    notifications, fake_root = queue()
+    notifications.pending[("info", "Copy", "x")] = ["Copy", "x", "info", 1]
+    notifications.shown[("info", "Copy", "x")] = [shown("x"), 1]
+    notifications.pump()
+    assert notifications.shown[("info", "Copy", "x")][1] == 2
+    assert not fake_root.timers
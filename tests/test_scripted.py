@@ -0,0 +1,179 @@
+import json
+import queue
+
+import pytest
+
+import dialoger
+from dialoger import backends
+from dialoger.scripted import scripted
+
+
+@pytest.fixture
+def script():
+    previous = backends._current
+    yield lambda answers: backends.use(scripted(answers))
+    backends._current = previous
+
+
+def test_bare_answers_in_order(script):
+    script(["Ana", "31"])
+    assert dialoger.ask("Sign up", "Name", "str") == "Ana"
+    assert dialoger.ask("Sign up", "Age", "int", typed=True) == 31
+
+
+def test_matched_answers_before_bare_ones(script):
+    script(["Ana", {"title": "Sign up", "question": "Age", "answer": "31"}, {"question": "City", "answer": "Recife"}])
+    assert dialoger.ask("Sign up", "Age", "int") == "31"
+    assert dialoger.ask("Other", "City", "str") == "Recife"
+    assert dialoger.ask("Sign up", "Name", "str") == "Ana"
+
+
+def test_no_answer_left(script):
+    script([])
+    with pytest.raises(LookupError):
+        dialoger.ask("Sign up", "Name", "str")
+
+
+def test_queue_and_file(script, tmp_path):
+    answers = queue.Queue()
+    script(answers)
+    answers.put("Ana")
+    assert dialoger.ask("Sign up", "Name", "str") == "Ana"
+    path = tmp_path / "script.jsonl"
+    path.write_text('"Bia"\n\n{"timeout": true}\n', encoding="utf-8")
+    script(path)
+    assert dialoger.ask("Sign up", "Name", "str") == "Bia"
+    assert dialoger.confirm("Sign up", "Save?", on_timeout=True) is True
+
+
+def test_answers_are_checked_like_in_the_window(script):
+    script(["12345678901", "abc", None, "", "Purple"])
+    assert dialoger.ask("Sign up", "CPF", "str", pattern="###.###.###-##") == "123.456.789-01"
+    with pytest.raises(ValueError):
+        dialoger.ask("Sign up", "Age", "int")
+    with pytest.raises(ValueError):
+        dialoger.ask("Sign up", "Name", "str", allow_cancel=False)
+    with pytest.raises(ValueError):
+        dialoger.ask("Sign up", "Name", "str", allow_empty=False)
+    with pytest.raises(ValueError):
+        dialoger.askwithanswers("Sign up", "Color", ["Red", "Green"])
+
+
+def test_empty_answer_takes_the_default(script):
+    script([""])
+    assert dialoger.ask("Server", "Port", "int", answer_default="8080", typed=True) == 8080
+
+
+def test_suggestions_only(script):
+    script(["Recife", "Lisbon"])
+    assert dialoger.ask("Trip", "City", "str", suggestions=["Recife", "Natal"], suggestions_only=True) == "Recife"
+    with pytest.raises(ValueError):
+        dialoger.ask("Trip", "City", "str", suggestions=["Recife", "Natal"], suggestions_only=True)
+
+
+def test_confirm_and_choices(script):
+    script(["Yes", False, None, "Green"])
+    assert dialoger.confirm("Save", "Save?") is True
+    assert dialoger.confirm("Save", "Save?") is False
+    assert dialoger.confirm("Save", "Save?") is False
+    assert dialoger.askwithanswers("Color", "Pick one", ["Red", "Green"]) == "Green"
+
+
+def test_timeout(script):
+    script([scripted.TIMEOUT] * 5)
+    assert dialoger.ask("Server", "Port", "int", answer_default="8080", typed=True) == 8080
+    assert dialoger.ask("Server", "Name", "str", on_timeout="localhost") == "localhost"
+    assert dialoger.confirm("Save", "Save?") is False
+    assert dialoger.askwithanswers("Color", "Pick one", ["Red", "Green"]) is None
+    with pytest.raises(TimeoutError):
+        dialoger.ask("Server", "Name", "str", on_timeout=TimeoutError)
+
+
+def test_form(script):
+    script([{"name": "Ana", "age": "31"}, scripted.TIMEOUT, None])
+    fields = [{"name": "name", "question": "Name"}, {"name": "age", "question": "Age", "answer_type": "int", "typed": True, "answer_default": "18"}]
+    assert dialoger.form("Sign up", fields) == {"name": "Ana", "age": 31}
+    assert dialoger.form("Sign up", fields) == {"name": None, "age": 18}
+    assert dialoger.form("Sign up", fields) is None
+
+
+def test_form_answer_must_be_a_dict(script):
+    script(["Ana"])
+    with pytest.raises(ValueError, match="Sign up"):
+        dialoger.form("Sign up", ["Name"])
+
+
+def test_transcript(script, tmp_path):
+    shown = script(["12345678901", {"Birth": "01021993"}, "Red"])
+    dialoger.ask("Sign up", "CPF", "str", pattern="###.###.###-##")
+    dialoger.form("Sign up", [{"question": "Birth", "pattern": "##/##/####"}], message="Who are you?")
+    dialoger.askwithanswers("Color", "Pick one", ["Red", "Green"])
+    dialoger.info("Sign up", "Done")
+    assert shown.transcript == [
+        {"kind": "ask", "title": "Sign up", "question": "CPF", "answer": "123.456.789-01"},
+        {"kind": "form", "title": "Sign up", "question": "Who are you?", "answer": {"Birth": "01/02/1993"}},
+        {"kind": "askwithanswers", "title": "Color", "question": "Pick one", "answer": "Red"},
+        {"kind": "info", "title": "Sign up", "question": "Done"},
+    ]
+    path = tmp_path / "transcript.jsonl"
+    shown.save(path)
+    assert [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()] == shown.transcript
+
+
+def test_other_messages_are_recorded_as_text(script):
+    shown = script([])
+    dialoger.error("Failed", ValueError("boom"))
+    dialoger.info("Count", 42)
+    dialoger.info("Log", ["first", "second"])
+    assert [entry["question"] for entry in shown.transcript] == ["boom", "42", "first\nsecond"]
+
+
+def test_notifications_are_messages(script):
+    shown = script([])
+    assert dialoger.notify("Import", "Item 3 failed", "error") is None
+    assert shown.transcript == [{"kind": "error", "title": "Import", "question": "Item 3 failed"}]
+
+
+def test_nothing_is_remembered(script, tmp_path, monkeypatch):
+    monkeypatch.setenv("DIALOGER_STORE", str(tmp_path / "answers.json"))
+    monkeypatch.setattr("dialoger.store.store._instance", None)
+    script(["Yes", "No"])
+    assert dialoger.confirm("Save", "Save?", remember=True) is True
+    assert dialoger.confirm("Save", "Save?", remember=True) is False
+    assert not (tmp_path / "answers.json").exists()
+
+
+def test_async_variants(script):
+    import asyncio
+
+    async def main():
+        name = await dialoger.ask_async("Sign up", "Name", "str")
+        answers = await dialoger.form_async("Sign up", ["City"])
+        return name, answers
+
+    script(["Ana", {"City": "Recife"}])
+    assert asyncio.run(main()) == ("Ana", {"City": "Recife"})
+
+
+def test_form_async_of_the_base_backend(script):
+    import asyncio
+    from dialoger.backends import backend
+
+    class answered(backend):
+        def form(self, title, fields, *args):
+            return {name: title for name in fields}
+
+        ask = askwithanswers = confirm = message = None
+
+    assert asyncio.run(answered().form_async("Sign up", ["Name"])) == {"Name": "Sign up"}
+
+
+def test_backends_implement_every_dialog():
+    from dialoger.backends import backend
+
+    class partial(backend):
+        def form(self, title, fields, *args):
+            return {}
+
+    with pytest.raises(TypeError, match="abstract"):
+        partial()
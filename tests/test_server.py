@@ -0,0 +1,108 @@
+import socket
+import threading
+import types
+from concurrent.futures import Future
+
+import pytest
+
+pytest.importorskip("tkinter")
+
+from dialoger.client import LOOPBACK, client, parse_address
+from dialoger.server import server
+
+
+class answering:
+    """Stand-in for the dispatcher, answering every dialog with its arguments"""
+
+    def __init__(self):
+        self.requests = []
+
+    def request(self, name, *args, **kwargs):
+        self.requests.append((name, args, kwargs))
+        future = Future()
+        if kwargs.get("on_timeout") is TimeoutError:
+            future.set_exception(TimeoutError("Nobody answered"))
+        else:
+            future.set_result([name, list(args), kwargs.get("on_timeout")])
+        return future
+
+
+@pytest.fixture
+def serve():
+    started = []
+
+    def start(address, **options):
+        listening = server(address, answering(), **options)
+        listening.bind()
+        threading.Thread(target=listening.serve_forever, daemon=True).start()
+        started.append(listening)
+        return listening
+
+    yield start
+    for listening in started:
+        listening.close()
+
+
+def tcp_address(listening):
+    return "%s:%d" % listening.listener.getsockname()
+
+
+def test_parse_address():
+    assert parse_address("/tmp/dialoger.sock") == (socket.AF_UNIX, "/tmp/dialoger.sock")
+    assert parse_address("localhost:8765") == (socket.AF_INET, ("localhost", 8765))
+    assert parse_address("8765") == (socket.AF_INET, (LOOPBACK, 8765))
+    assert parse_address(":8765") == (socket.AF_INET, (LOOPBACK, 8765))
+
+
+@pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="no Unix sockets")
+def test_unix_socket_without_token(serve, tmp_path):
+    listening = serve(str(tmp_path / "dialoger.sock"))
+    assert listening.token is None
+    assert client(str(tmp_path / "dialoger.sock")).call("confirm", "Save", "Save?", ["Yes", "No"]) == ["confirm", ["Save", "Save?", ["Yes", "No"]], None]
+
+
+def test_tcp_needs_the_token(serve):
+    listening = serve("127.0.0.1:0")
+    assert listening.token
+    with pytest.raises(PermissionError):
+        client(tcp_address(listening), token="wrong").call("confirm", "Save", "Save?", ["Yes", "No"])
+    with pytest.raises(PermissionError):
+        client(tcp_address(listening), token="").call("confirm", "Save", "Save?", ["Yes", "No"])
+    assert client(tcp_address(listening), token=listening.token).call("confirm", "Save", "Save?", ["Yes", "No"])[0] == "confirm"
+
+
+def test_tcp_listens_on_loopback_only():
+    with pytest.raises(PermissionError):
+        server("0.0.0.0:0", answering()).bind()
+
+
+def test_other_messages_are_sent_as_text(serve):
+    listening = serve("127.0.0.1:0", token="secret")
+    remote = client(tcp_address(listening), token="secret")
+    remote.message("Failed", ValueError("boom"), "error")
+    remote.message("Count", 42, "info")
+    remote.message("Log", ("first", "second"), "info")
+    assert [request[1][1] for request in listening.dispatcher.requests] == ["boom", "42", "first\nsecond\n"]
+
+
+def test_notifications_are_answered_once_queued(serve):
+    listening = serve("127.0.0.1:0", token="secret")
+    queued = []
+    listening.notifier = types.SimpleNamespace(notify=lambda *args: queued.append(args))
+    assert client(tcp_address(listening), token="secret").notify("Import", "Item 3 failed", "error") is None
+    assert queued == [("Import", "Item 3 failed", "error")]
+    assert listening.dispatcher.requests == []
+
+
+def test_timeout_strings_are_values(serve):
+    listening = serve("127.0.0.1:0", token="secret")
+    remote = client(tcp_address(listening), token="secret")
+    # A string is sent and returned as a value, even one naming an exception
+    assert remote.confirm("Save", "Save?", ["Yes", "No"], timeout=1, on_timeout="TimeoutError") == ["confirm", ["Save", "Save?", ["Yes", "No"], 1], "TimeoutError"]
+    # An exception is asked for with the raise flag, and raised by the client
+    with pytest.raises(TimeoutError):
+        remote.confirm("Save", "Save?", ["Yes", "No"], timeout=1, on_timeout=TimeoutError)
+    with pytest.raises(KeyError):
+        remote.confirm("Save", "Save?", ["Yes", "No"], timeout=1, on_timeout=KeyError("late"))
+    assert listening.dispatcher.requests[0][2]["on_timeout"] == "TimeoutError"
+    assert listening.dispatcher.requests[1][2]["on_timeout"] is TimeoutError
@@ -0,0 +1,62 @@
+import io
+import os
+import pathlib
+import sys
+import time
+import types
+
+import pytest
+
+from dialoger.terminal import terminal
+
+
+def test_only_path_objects_are_read_as_files(tmp_path):
+    path = tmp_path / "app.log"
+    path.write_text("first line\nsecond line\n", encoding="utf-8")
+    output = io.StringIO()
+    tty = terminal(io.StringIO(), output)
+    tty.message("Log", str(path), "info")
+    assert str(path) in output.getvalue() and "first line" not in output.getvalue()
+    tty.message("Log", pathlib.Path(path), "info")
+    assert "first line\nsecond line\n" in output.getvalue()
+
+
+def test_iterables_of_lines():
+    output = io.StringIO()
+    terminal(io.StringIO(), output).message("Log", (f"line {i}" for i in range(3)), "info")
+    assert output.getvalue().endswith("line 0\nline 1\nline 2\n")
+
+
+def test_other_messages_are_shown_as_text():
+    output = io.StringIO()
+    tty = terminal(io.StringIO(), output)
+    tty.message("Failed", ValueError("boom"), "error")
+    tty.message("Count", 42, "info")
+    assert output.getvalue() == "\n[ERROR] Failed\nboom\n\n[INFO] Count\n42\n"
+
+
+class console(io.StringIO):
+    def isatty(self):
+        return True
+
+
+def test_windows_console_is_polled(monkeypatch):
+    pressed = []
+    monkeypatch.setattr(sys, "platform", "win32")
+    monkeypatch.setitem(sys.modules, "msvcrt", types.SimpleNamespace(kbhit=lambda: bool(pressed)))
+    assert terminal.ready(console(), time.monotonic() + 0.1) is False
+    pressed.append("a")
+    assert terminal.ready(console(), time.monotonic() + 0.1) is True
+    # Pipes can't be polled, they are always ready
+    assert terminal.ready(io.StringIO(), time.monotonic()) is True
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="select can't wait on pipes on Windows")
+def test_timeout_on_a_pipe():
+    read, write = os.pipe()
+    try:
+        with os.fdopen(read) as stdin:
+            tty = terminal(stdin, io.StringIO())
+            assert tty.confirm("Save", "Save?", ["Yes", "No"], timeout=0.1, on_timeout=True) is True
+    finally:
+        os.close(write)
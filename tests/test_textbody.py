@@ -0,0 +1,29 @@
+import pathlib
+
+import pytest
+
+pytest.importorskip("tkinter")
+
+from dialoger.textbody import textbody
+
+
+def test_is_long():
+    assert not textbody.is_long(None, 10)
+    assert not textbody.is_long("short", 10)
+    assert textbody.is_long("x" * 11, 10)
+    assert textbody.is_long(pathlib.Path("app.log"), 10)
+    assert textbody.is_long(["first", "second"], 10)
+    assert textbody.is_long((line for line in ["first"]), 10)
+
+
+def test_other_messages_are_text():
+    assert not textbody.is_long(ValueError("boom"), 10)
+    assert not textbody.is_long(42, 10)
+    assert textbody.is_long(ValueError("x" * 11), 10)
+
+
+def test_chunks():
+    body = textbody.__new__(textbody)
+    assert list(body.chunks(["first", "second\n"])) == ["first\nsecond\n"]
+    assert list(body.chunks(ValueError("boom"))) == ["boom"]
+    assert list(body.chunks(42)) == ["42"]
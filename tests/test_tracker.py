@@ -0,0 +1,73 @@
+import threading
+
+from dialoger.tracker import tracker
+
+
+def test_iteration_yields_every_item_and_closes():
+    closed = []
+    job = tracker(range(1000), on_close=closed.append)
+    assert sum(job) == sum(range(1000))
+    assert job.count == 1000 and job.total == 1000
+    assert job.closed and closed == [job]
+
+
+def test_cancel_stops_the_iteration_and_advance():
+    job = tracker(range(1000000))
+    for item in job:
+        if item == 10:
+            job.cancel()
+    assert job.count < 1000000
+    assert job.closed
+    assert tracker(total=10).advance() is True
+    cancelled = tracker(total=10)
+    cancelled.cancel()
+    assert cancelled.advance() is False
+
+
+def test_fraction():
+    job = tracker(total=4)
+    job.advance(3)
+    assert job.fraction() == 0.75
+    assert tracker().fraction() is None
+
+
+def test_only_the_owner_thread_draws():
+    drawn = []
+    job = tracker(range(200000), fps=1000, on_draw=lambda job: drawn.append(threading.get_ident()))
+    worker = threading.Thread(target=lambda: sum(job))
+    worker.start()
+    assert job.join() is True
+    worker.join()
+    assert job.count == 200000
+    assert drawn and set(drawn) == {threading.get_ident()}
+
+
+def test_threads_advancing_with_join():
+    drawn = []
+    job = tracker(total=40000, fps=1000, on_draw=lambda job: drawn.append(threading.get_ident()))
+    workers = [threading.Thread(target=lambda: [job.advance() for _ in range(10000)]) for _ in range(4)]
+    for worker in workers:
+        worker.start()
+    assert job.join() is True
+    for worker in workers:
+        worker.join()
+    assert job.count == 40000
+    assert set(drawn) == {threading.get_ident()}
+
+
+def test_join_draws_the_last_count():
+    drawn = []
+    job = tracker(total=100, fps=1000, on_draw=lambda job: drawn.append(job.count))
+    worker = threading.Thread(target=lambda: [job.advance() for _ in range(100)])
+    worker.start()
+    worker.join()
+    assert job.join() is True
+    assert drawn == [100]
+
+
+def test_close_from_another_thread_leaves_on_close_to_the_owner():
+    closed = []
+    job = tracker(total=10, on_close=closed.append)
+    threading.Thread(target=job.close).start()
+    assert job.join() is True
+    assert closed == [job]
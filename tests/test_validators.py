@@ -0,0 +1,76 @@
+import pytest
+
+from dialoger import validators
+from dialoger.field import field
+
+
+@pytest.mark.parametrize("value", ["1", "-3", "1.5", "+1.5", ".5", "1.", "1e5", "1.5e-3", "+1E+2"])
+def test_valid_floats(value):
+    assert validators.get("float").valid(value)
+    assert validators.get("float").parse(value) == float(value)
+
+
+@pytest.mark.parametrize("value", ["1.2.3", "1e", "-", ".", "1e+", "1,5"])
+def test_invalid_floats(value):
+    assert not validators.get("float").valid(value)
+
+
+def test_floats_are_accepted_while_typed():
+    for value in ("", "-", "1.", "1e", "1e-", "1.5E+1"):
+        assert validators.get("float").accepts(value), value
+    for value in ("1.2.3", "1e5e", "a"):
+        assert not validators.get("float").accepts(value), value
+
+
+def test_int():
+    assert validators.get("int").valid("-3")
+    assert validators.get("int").parse("-3") == -3
+    assert validators.get("int").accepts("-")
+    assert not validators.get("int").valid("-")
+    assert not validators.get("int").accepts("1.0")
+
+
+def test_ipv4():
+    assert validators.get("ipv4").valid("192.168.0.1")
+    assert validators.get("ipv4").accepts("192.168.")
+    assert not validators.get("ipv4").valid("256.1.1.1")
+    assert not validators.get("ipv4").valid("1.2.3")
+
+
+def test_email():
+    assert validators.get("email").valid("ana@example.com")
+    assert not validators.get("email").valid("ana@example")
+    assert not validators.get("email").accepts("ana @")
+
+
+def test_unknown_types_are_free_text():
+    assert validators.get("nope") is validators.get("str")
+
+
+def test_registered_range():
+    validators.register("percent", validators.number_range(0, 100))
+    try:
+        assert field("percent").valid("100")
+        assert not field("percent").valid("101")
+        assert field("percent").parse("42") == 42
+    finally:
+        del validators._types["percent"]
+
+
+def test_field_with_pattern_needs_the_whole_pattern():
+    date = field("str", "##/##/####")
+    assert date.valid("01/02/1993")
+    assert not date.valid("01/02/199")
+    assert not date.valid("")
+
+
+def test_field_empty_answers():
+    assert field("int").valid("")
+    assert field("int").parse("") is None
+    assert not field("int", allow_empty=False).valid("")
+
+
+def test_field_default():
+    assert field("int").default("8080", typed=True) == 8080
+    assert field("int").default("8080") == "8080"
+    assert field("int").default("abc", typed=True) is None